@@ -1,166 +1,212 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import numpy as np
-
-# kelas monitor listrik
-class MonitorListrik:
-    def __init__(self):
-        """Inisialisasi kelas monitoring listrik"""
-        self.peralatan = []
-        self.penggunaan_harian = []
-        self.tarif_listrik = {
-            'R-1': 1500,  # Tarif untuk golongan R-1 (per kWh)
-            'R-2': 2000,  # Tarif untuk golongan R-2 (per kWh)
-            'R-3': 2500,  # Tarif untuk golongan R-3 (per kWh)
-        }
-        self.tarif_terpilih = 'R-1'  # Golongan R-1 sebagai default
-
-    # 1.Peralatan Elektronik
-    def tambah_peralatan(self, nama, unit, watt, golongan, jam_per_hari):
-        """Menambahkan peralatan elektronik dan golongan listrik"""
-        self.peralatan.append({
-            'nama': nama,
-            'unit': unit,
-            'watt': watt,
-            'total_watt': watt * unit,
-            'golongan': golongan,
-            'jam_per_hari': jam_per_hari,
-        })
-        self.update_penggunaan_harian_dengan_peralatan_baru()
-
-    def update_penggunaan_harian_dengan_peralatan_baru(self):
-        """Mengupdate penggunaan harian dengan peralatan baru"""
-        if not self.penggunaan_harian:
-            self.generate_sample_data()
-        else:
-            new_usage = np.random.uniform(1, 5)
-            self.penggunaan_harian.append({
-                'hari': len(self.penggunaan_harian) + 1,
-                'penggunaan': new_usage
-            })
-
-    def set_tarif_listrik(self, golongan):
-        """Set golongan listrik yang dipilih"""
-        self.tarif_terpilih = golongan
-
-    # 2.Penggunaan Listrik
-    def hitung_total_penggunaan(self):
-        """Menghitung total penggunaan listrik dalam kWh per bulan"""
-        total_penggunaan_per_bulan = 0
-        for peralatan in self.peralatan:
-            total_penggunaan_per_bulan += (peralatan['total_watt'] / 1000) * peralatan['jam_per_hari'] * 30
-        return total_penggunaan_per_bulan
-
-    # 3.Estimasi Biaya
-    def hitung_estimasi_biaya(self):
-        """Menghitung estimasi biaya listrik"""
-        total_penggunaan_per_bulan = self.hitung_total_penggunaan()
-        tarif = self.tarif_listrik.get(self.tarif_terpilih, 1500)
-        return total_penggunaan_per_bulan * tarif
-
-    def generate_sample_data(self, hari=30):
-        """Menghasilkan data penggunaan listrik sampel"""
-        np.random.seed(42)
-        self.penggunaan_harian = []
-        for hari in range(1, hari + 1):
-            penggunaan = np.random.uniform(5, 15)
-            self.penggunaan_harian.append({
-                'hari': hari,
-                'penggunaan': penggunaan
-            })
-
-    def konsumsi_energi_per_peralatan(self):
-        """Menghitung konsumsi energi per peralatan"""
-        return [
-            {'peralatan': peralatan['nama'], 'konsumsi': (peralatan['total_watt'] / 1000) * peralatan['jam_per_hari'] * 30}
-            for peralatan in self.peralatan
-        ]
-
-# Input data
-def main():
-    if 'monitor' not in st.session_state:
-        monitor = MonitorListrik()
-
-        # Menambahkan peralatan default
-        peralatan_default = [
-            ('Kulkas', 1, 800, 'R-1', 24),
-            ('AC', 1, 2000, 'R-1', 8),
-            ('Mesin Cuci', 1, 1500, 'R-1', 2),
-            ('Lampu LED', 5, 20, 'R-1', 12),
-            ('Kipas Angin', 2, 75, 'R-1', 8),
-            ('Setrika', 1, 2000, 'R-1', 1),
-            ('TV LED', 1, 200, 'R-1', 6),
-            ('Rice Cooker', 1, 1000, 'R-1', 2),
-            ('Laptop', 1, 300, 'R-1', 8),
-            ('Microwave', 1, 1200, 'R-1', 0.5),
-            ('Pemanas Air', 1, 3000, 'R-1', 1),
-            ('Blender', 1, 700, 'R-1', 0.5),
-            ('Hair Dryer', 1, 1800, 'R-1', 0.5),
-            ('Kamera Pengawas', 2, 15, 'R-1', 24),
-            ('PC', 1, 200, 'R-1', 6)
-        ]
-
-        for nama, unit, watt, golongan, jam in peralatan_default:
-            monitor.tambah_peralatan(nama, unit, watt, golongan, jam)
-
-        st.session_state.monitor = monitor
-
-    monitor = st.session_state.monitor
-
-# Pelajarin masing-masing 
-# (yang beda baris 115)  
-# elif menu == 'Peralatan Elektronik': ->  if 'Peralatan Elektronik':
-# 1. Peralatan Elektronik
-    if 'Peralatan Elektronik':
-        st.title('Peralatan Elektronik')
-
-        tab1, tab2 = st.tabs(["Daftar Elektronik", "Tambah Elektronik"])
-
-        with tab1:
-            if monitor.peralatan:
-                data_peralatan = [{
-                    'Nama Peralatan': peralatan['nama'],
-                    'Golongan Listrik': peralatan['golongan'],
-                    'Jumlah Unit': peralatan['unit'],
-                    'Daya per Unit (Watt)': peralatan['watt'],
-                    'Total Daya (Watt)': peralatan['total_watt'],
-                    'Jam Penggunaan per Hari': peralatan['jam_per_hari']
-                } for peralatan in monitor.peralatan]
-
-                peralatan_df = pd.DataFrame(data_peralatan)
-                st.subheader("Daftar Peralatan Elektronik")
-                # Menampilkan grafik terlebih dahulu
-                fig_pie = px.pie(
-                    peralatan_df,
-                    values='Total Daya (Watt)',
-                    names='Nama Peralatan',
-                    title='Distribusi Daya per Peralatan'
-                )
-                st.plotly_chart(fig_pie)
-                # Kemudian tabel
-                st.dataframe(peralatan_df)
-
-        with tab2:
-            with st.form('Tambah Peralatan', clear_on_submit=True):
-                st.subheader("Formulir Tambah Peralatan Elektronik")
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    golongan = st.selectbox('Golongan Listrik', ['R-1', 'R-2', 'R-3'])
-                    nama = st.text_input('Nama Peralatan')
-                    unit = st.number_input('Jumlah Unit', min_value=1, value=1)
-
-                with col2:
-                    jam_per_hari = st.number_input('Waktu Penggunaan per Hari (Jam)', min_value=0.1, value=1.0)
-                    watt = st.number_input('Daya per Unit (Watt)', min_value=1)
-
-                submit = st.form_submit_button('Tambah')
-
-                if submit:
-                    monitor.tambah_peralatan(nama, unit, watt, golongan, jam_per_hari)
-                    st.success(f'Peralatan {nama} berhasil ditambahkan!')
-
-if __name__ == '__main__':
-    main()
+import streamlit as st
+
+from impor_malas import impor_malas
+from impor_peralatan import impor_peralatan
+from indeks_peralatan import UKURAN_HALAMAN
+from monitor_listrik import GOLONGAN, buat_df_distribusi_daya, buat_df_peralatan
+from sesi import ambil_monitor, tombol_ekspor
+
+px = impor_malas('plotly.express')
+
+
+# 1. Peralatan Elektronik
+# Kolom tabel yang dapat dipilih untuk mengurutkan -> kolom indeks peralatan
+KOLOM_URUT_TABEL = {
+    'Urutan Ditambahkan': 'indeks',
+    'Nama Peralatan': 'nama',
+    'Golongan Listrik': 'golongan',
+    'Jumlah Unit': 'unit',
+    'Daya per Unit (Watt)': 'watt',
+    'Total Daya (Watt)': 'total_watt',
+    'Jam Penggunaan per Hari': 'jam_per_hari',
+    'Jam Mulai': 'jam_mulai',
+}
+PILIHAN_UKURAN_HALAMAN = (25, UKURAN_HALAMAN, 100, 250)
+
+# Kolom tabel yang dapat diubah di editor -> atribut peralatan
+KOLOM_UBAH = {
+    'Nama Peralatan': 'nama',
+    'Golongan Listrik': 'golongan',
+    'Jumlah Unit': 'unit',
+    'Daya per Unit (Watt)': 'watt',
+    'Jam Penggunaan per Hari': 'jam_per_hari',
+    'Jam Mulai': 'jam_mulai',
+}
+KONFIGURASI_KOLOM = {
+    'Golongan Listrik': st.column_config.SelectboxColumn(options=GOLONGAN, required=True),
+    'Jumlah Unit': st.column_config.NumberColumn(min_value=1, step=1, required=True),
+    'Daya per Unit (Watt)': st.column_config.NumberColumn(min_value=1, required=True),
+    'Jam Penggunaan per Hari': st.column_config.NumberColumn(min_value=0.1, max_value=24, required=True),
+    'Jam Mulai': st.column_config.NumberColumn(min_value=0.0, max_value=23.5, step=0.5, required=True),
+}
+
+
+def buat_tampilan(monitor):
+    """Membuat grafik distribusi daya (peralatan terbesar ditambah 'Lainnya')"""
+    return px.pie(
+        buat_df_distribusi_daya(monitor),
+        values='Total Daya (Watt)',
+        names='Nama Peralatan',
+        title='Distribusi Daya per Peralatan'
+    )
+
+
+def terapkan_perubahan(monitor, peralatan_df, perubahan):
+    """Menerapkan hasil editor (baris diubah/dihapus per posisi) ke monitor lewat id peralatan.
+
+    Mengembalikan (jumlah diubah, jumlah dihapus, daftar galat); nama kosong
+    atau nama yang sudah dipakai peralatan lain ditolak.
+    """
+    id_baris = peralatan_df.index
+    diubah, galat = 0, []
+    for posisi, kolom in perubahan.get('edited_rows', {}).items():
+        id_peralatan = int(id_baris[int(posisi)])
+        ubahan = {KOLOM_UBAH[nama_kolom]: nilai for nama_kolom, nilai in kolom.items()
+                  if nama_kolom in KOLOM_UBAH and nilai is not None}
+        if 'nama' in ubahan:
+            nama = str(ubahan['nama']).strip()
+            if not nama:
+                galat.append(f'Nama peralatan ID {id_peralatan} tidak boleh kosong')
+                continue
+            if any(id_lain != id_peralatan for id_lain in monitor.cari_peralatan(nama)):
+                galat.append(f'Peralatan {nama} sudah ada')
+                continue
+            ubahan['nama'] = nama
+        if ubahan:
+            monitor.ubah_peralatan(id_peralatan, **ubahan)
+            diubah += 1
+    dihapus = [int(id_baris[int(posisi)]) for posisi in perubahan.get('deleted_rows', [])]
+    for id_peralatan in dihapus:
+        monitor.hapus_peralatan(id_peralatan)
+    return diubah, len(dihapus), galat
+
+
+def simpan_perubahan(monitor, peralatan_df, kunci_editor):
+    """Callback tombol simpan: menerapkan isi editor sebelum halaman dijalankan ulang"""
+    st.session_state.hasil_ubah_peralatan = terapkan_perubahan(
+        monitor, peralatan_df, st.session_state.get(kunci_editor, {})
+    )
+
+
+def tampilkan_tabel(monitor):
+    """Tabel peralatan yang disaring, diurutkan dan dipotong per halaman di server, hanya halaman aktif yang dikirim"""
+    indeks = monitor.indeks_peralatan()
+    watt_min, watt_maks = indeks.rentang_watt()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        golongan = st.multiselect('Golongan Listrik', GOLONGAN, default=list(GOLONGAN))
+    with col2:
+        awalan_nama = st.text_input('Awalan Nama Peralatan').strip()
+    with col3:
+        rentang_watt = (watt_min, watt_maks)
+        if watt_min < watt_maks:
+            rentang_watt = st.slider('Daya per Unit (Watt)', watt_min, watt_maks, (watt_min, watt_maks))
+
+    col4, col5, col6 = st.columns(3)
+    with col4:
+        urut = st.selectbox('Urutkan Berdasarkan', list(KOLOM_URUT_TABEL))
+    with col5:
+        ukuran_halaman = st.selectbox('Baris per Halaman', PILIHAN_UKURAN_HALAMAN, index=1)
+    with col6:
+        menurun = st.toggle('Urutan Menurun')
+
+    # Saringan yang tidak membatasi apa pun dilewati agar tidak membuat mask
+    baris_cocok = indeks.cocok(
+        KOLOM_URUT_TABEL[urut], menurun,
+        golongan=golongan if len(golongan) < len(GOLONGAN) else None,
+        watt_min=rentang_watt[0] if rentang_watt[0] > watt_min else None,
+        watt_maks=rentang_watt[1] if rentang_watt[1] < watt_maks else None,
+        awalan_nama=awalan_nama or None,
+    )
+    jumlah_halaman = max(-(-len(baris_cocok) // ukuran_halaman), 1)
+    tempat_tabel = st.container()
+    halaman = st.number_input(f'Halaman (dari {jumlah_halaman})', min_value=1, max_value=jumlah_halaman, value=1)
+
+    awal = (halaman - 1) * ukuran_halaman
+    baris_halaman = baris_cocok[awal:awal + ukuran_halaman]
+    peralatan_df = buat_df_peralatan(monitor, baris_halaman)
+    peralatan_df.index = monitor.peralatan.id[baris_halaman]  # Id stabil, tetap benar setelah baris lain dihapus
+    peralatan_df.index.name = 'ID'
+    # Kunci editor ikut versi dan isi halaman agar suntingan lama tidak menempel ke baris lain
+    kunci_editor = f'editor_peralatan_{monitor.versi}_{hash(baris_halaman.tobytes())}'
+    with tempat_tabel:
+        st.data_editor(
+            peralatan_df, key=kunci_editor, num_rows='delete', column_config=KONFIGURASI_KOLOM,
+            disabled=['_index', 'Total Daya (Watt)']
+        )
+        st.caption(
+            f'Baris {awal + 1 if len(baris_halaman) else 0}-{awal + len(baris_halaman)} dari '
+            f'{len(baris_cocok)} peralatan yang cocok ({len(indeks)} total). '
+            'Ubah sel atau hapus baris, lalu simpan.'
+        )
+        st.button('Simpan Perubahan', on_click=simpan_perubahan, args=(monitor, peralatan_df, kunci_editor))
+        if 'hasil_ubah_peralatan' in st.session_state:
+            diubah, dihapus, galat = st.session_state.pop('hasil_ubah_peralatan')
+            if diubah or dihapus:
+                st.success(f'{diubah} peralatan diubah, {dihapus} peralatan dihapus')
+            for pesan in galat:
+                st.error(pesan)
+
+
+def main():
+    monitor = ambil_monitor()
+
+    st.title('Peralatan Elektronik')
+
+    tab1, tab2, tab3 = st.tabs(["Daftar Elektronik", "Tambah Elektronik", "Impor Massal"])
+
+    with tab1:
+        if monitor.peralatan:
+            fig_pie = monitor.ambil_turunan('peralatan', lambda: buat_tampilan(monitor))
+            st.subheader("Daftar Peralatan Elektronik")
+            # Menampilkan grafik terlebih dahulu
+            st.plotly_chart(fig_pie)
+            # Kemudian tabel per halaman
+            tampilkan_tabel(monitor)
+            tombol_ekspor(monitor, 'peralatan')
+
+    with tab2:
+        with st.form('Tambah Peralatan', clear_on_submit=True):
+            st.subheader("Formulir Tambah Peralatan Elektronik")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                golongan = st.selectbox('Golongan Listrik', GOLONGAN, index=GOLONGAN.index(monitor.tarif_terpilih))
+                nama = st.text_input('Nama Peralatan')
+                unit = st.number_input('Jumlah Unit', min_value=1, value=1)
+
+            with col2:
+                jam_per_hari = st.number_input('Waktu Penggunaan per Hari (Jam)', min_value=0.1, value=1.0)
+                watt = st.number_input('Daya per Unit (Watt)', min_value=1)
+                jam_mulai = st.number_input('Jam Mulai Menyala (0-24)', min_value=0.0, max_value=23.5, value=18.0, step=0.5)
+
+            submit = st.form_submit_button('Tambah')
+
+            if submit:
+                try:
+                    monitor.tambah_peralatan(nama, unit, watt, golongan, jam_per_hari, jam_mulai, tolak_duplikat=True)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.success(f'Peralatan {nama} berhasil ditambahkan!')
+
+    with tab3:
+        st.subheader("Impor Inventaris Peralatan (CSV/Parquet)")
+        st.caption("Kolom wajib: nama, unit, watt, golongan, jam_per_hari (opsional: jam_mulai)")
+        berkas = st.file_uploader('Berkas Inventaris', type=['csv', 'parquet'])
+
+        if berkas is not None and st.button('Impor'):
+            try:
+                hasil = impor_peralatan(monitor, berkas, tolak_duplikat=True)
+            except (ValueError, ImportError) as e:
+                st.error(f'Impor gagal: {e}')
+            else:
+                st.success(f"{hasil['jumlah_diimpor']} peralatan berhasil diimpor!")
+                if len(hasil['ditolak']):
+                    st.warning(f"{len(hasil['ditolak'])} baris ditolak")
+                    st.dataframe(hasil['ditolak'].head(1000))
+
+if __name__ == '__main__':
+    main()
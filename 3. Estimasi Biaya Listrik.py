@@ -1,153 +1,96 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import numpy as np
-
-# kelas monitor listrik
-class MonitorListrik:
-    def __init__(self):
-        """Inisialisasi kelas monitoring listrik"""
-        self.peralatan = []
-        self.penggunaan_harian = []
-        self.tarif_listrik = {
-            'R-1': 1500,  # Tarif untuk golongan R-1 (per kWh)
-            'R-2': 2000,  # Tarif untuk golongan R-2 (per kWh)
-            'R-3': 2500,  # Tarif untuk golongan R-3 (per kWh)
-        }
-        self.tarif_terpilih = 'R-1'  # Golongan R-1 sebagai default
-
-    # 1.Peralatan Elektronik
-    def tambah_peralatan(self, nama, unit, watt, golongan, jam_per_hari):
-        """Menambahkan peralatan elektronik dan golongan listrik"""
-        self.peralatan.append({
-            'nama': nama,
-            'unit': unit,
-            'watt': watt,
-            'total_watt': watt * unit,
-            'golongan': golongan,
-            'jam_per_hari': jam_per_hari,
-        })
-        self.update_penggunaan_harian_dengan_peralatan_baru()
-
-    def update_penggunaan_harian_dengan_peralatan_baru(self):
-        """Mengupdate penggunaan harian dengan peralatan baru"""
-        if not self.penggunaan_harian:
-            self.generate_sample_data()
-        else:
-            new_usage = np.random.uniform(1, 5)
-            self.penggunaan_harian.append({
-                'hari': len(self.penggunaan_harian) + 1,
-                'penggunaan': new_usage
-            })
-
-    def set_tarif_listrik(self, golongan):
-        """Set golongan listrik yang dipilih"""
-        self.tarif_terpilih = golongan
-
-    # 2.Penggunaan Listrik
-    def hitung_total_penggunaan(self):
-        """Menghitung total penggunaan listrik dalam kWh per bulan"""
-        total_penggunaan_per_bulan = 0
-        for peralatan in self.peralatan:
-            total_penggunaan_per_bulan += (peralatan['total_watt'] / 1000) * peralatan['jam_per_hari'] * 30
-        return total_penggunaan_per_bulan
-
-    # 3.Estimasi Biaya
-    def hitung_estimasi_biaya(self):
-        """Menghitung estimasi biaya listrik"""
-        total_penggunaan_per_bulan = self.hitung_total_penggunaan()
-        tarif = self.tarif_listrik.get(self.tarif_terpilih, 1500)
-        return total_penggunaan_per_bulan * tarif
-
-    def generate_sample_data(self, hari=30):
-        """Menghasilkan data penggunaan listrik sampel"""
-        np.random.seed(42)
-        self.penggunaan_harian = []
-        for hari in range(1, hari + 1):
-            penggunaan = np.random.uniform(5, 15)
-            self.penggunaan_harian.append({
-                'hari': hari,
-                'penggunaan': penggunaan
-            })
-
-    def konsumsi_energi_per_peralatan(self):
-        """Menghitung konsumsi energi per peralatan"""
-        return [
-            {'peralatan': peralatan['nama'], 'konsumsi': (peralatan['total_watt'] / 1000) * peralatan['jam_per_hari'] * 30}
-            for peralatan in self.peralatan
-        ]
-
-# Input data
-def main():
-    if 'monitor' not in st.session_state:
-        monitor = MonitorListrik()
-
-        # Menambahkan peralatan default
-        peralatan_default = [
-            ('Kulkas', 1, 800, 'R-1', 24),
-            ('AC', 1, 2000, 'R-1', 8),
-            ('Mesin Cuci', 1, 1500, 'R-1', 2),
-            ('Lampu LED', 5, 20, 'R-1', 12),
-            ('Kipas Angin', 2, 75, 'R-1', 8),
-            ('Setrika', 1, 2000, 'R-1', 1),
-            ('TV LED', 1, 200, 'R-1', 6),
-            ('Rice Cooker', 1, 1000, 'R-1', 2),
-            ('Laptop', 1, 300, 'R-1', 8),
-            ('Microwave', 1, 1200, 'R-1', 0.5),
-            ('Pemanas Air', 1, 3000, 'R-1', 1),
-            ('Blender', 1, 700, 'R-1', 0.5),
-            ('Hair Dryer', 1, 1800, 'R-1', 0.5),
-            ('Kamera Pengawas', 2, 15, 'R-1', 24),
-            ('PC', 1, 200, 'R-1', 6)
-        ]
-
-        for nama, unit, watt, golongan, jam in peralatan_default:
-            monitor.tambah_peralatan(nama, unit, watt, golongan, jam)
-
-        st.session_state.monitor = monitor
-
-    monitor = st.session_state.monitor
-
-# Pelajarin masing-masing 
-# (yang beda baris 111)
-# elif menu == 'Estimasi Biaya': ->  if 'Estimasi Biaya':
-# 3. Estimasi Biaya
-    if 'Estimasi Biaya':
-        st.title('Estimasi Biaya Listrik')
-
-        total_biaya = monitor.hitung_estimasi_biaya()
-        st.metric(
-            label="Estimasi Total Biaya selama Sebulan",
-            value=f"Rp {total_biaya:,.2f}"
-        )
-
-        data_peralatan = []
-        for peralatan in monitor.peralatan:
-            konsumsi = (peralatan['total_watt'] / 1000) * peralatan['jam_per_hari'] * 30
-            biaya_per_peralatan = konsumsi * monitor.tarif_listrik[peralatan['golongan']]
-            data_peralatan.append({
-                'Nama Peralatan': peralatan['nama'],
-                'Listrik Sebulan (kWh)': konsumsi,
-                'Biaya Listrik (Rp)': biaya_per_peralatan
-            })
-
-        peralatan_df = pd.DataFrame(data_peralatan)
-        st.subheader("Rincian Biaya Listrik per Peralatan")
-
-        # Grafik distribusi biaya listrik
-        fig = px.bar(
-            peralatan_df,
-            x='Nama Peralatan',
-            y='Biaya Listrik (Rp)',
-            title='Distribusi Biaya Listrik per Peralatan',
-            color='Biaya Listrik (Rp)',
-            color_continuous_scale='Viridis'
-        )
-        st.plotly_chart(fig)
-
-        # Kemudian tabel
-        st.dataframe(peralatan_df)
-
-# Menjalankan aplikasi
-if __name__ == "__main__":
-    main()
+import streamlit as st
+
+from impor_malas import impor_malas
+from monitor_listrik import GOLONGAN, buat_df_biaya, buat_df_biaya_golongan
+from sesi import ambil_monitor, tombol_ekspor
+from tarif import DefinisiTarif
+
+px = impor_malas('plotly.express')
+
+
+# 3. Estimasi Biaya
+def buat_tampilan(monitor):
+    """Membuat tabel biaya per golongan, tabel dan grafik biaya per peralatan"""
+    golongan_df = buat_df_biaya_golongan(monitor)
+    peralatan_df = buat_df_biaya(monitor)
+    fig = px.bar(
+        peralatan_df,
+        x='Nama Peralatan',
+        y='Biaya Listrik (Rp)',
+        title='Distribusi Biaya Listrik per Peralatan',
+        color='Biaya Listrik (Rp)',
+        color_continuous_scale='Viridis'
+    )
+    return golongan_df, peralatan_df, fig
+
+
+def main():
+    monitor = ambil_monitor()
+
+    st.title('Estimasi Biaya Listrik')
+
+    with st.expander('Tarif Listrik per Golongan (Rp/kWh)'):
+        kolom_tarif = st.columns(len(GOLONGAN))
+        for kolom, golongan in zip(kolom_tarif, GOLONGAN):
+            with kolom:
+                tarif = st.number_input(golongan, min_value=0, value=int(monitor.tarif_listrik[golongan]), step=50)
+                if tarif != monitor.tarif_listrik[golongan]:
+                    monitor.ubah_tarif_listrik(golongan, tarif)
+
+    with st.expander('Tarif Lanjutan (Blok, Waktu Pakai, Biaya Minimum, Pajak)'):
+        with st.form('Tarif Lanjutan'):
+            golongan = st.selectbox('Golongan Listrik', GOLONGAN)
+            aktif = st.checkbox('Gunakan tarif lanjutan', value=golongan in monitor.tarif_lanjutan)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                batas_blok = st.number_input('Batas Blok Pertama (kWh)', min_value=1.0, value=900.0)
+                harga_blok_1 = st.number_input('Harga Blok Pertama (Rp/kWh)', min_value=0.0, value=float(monitor.tarif_listrik[golongan]))
+                harga_blok_2 = st.number_input('Harga Blok Berikutnya (Rp/kWh)', min_value=0.0, value=float(monitor.tarif_listrik[golongan]))
+            with col2:
+                biaya_minimum = st.number_input('Biaya Minimum (Rp/bulan)', min_value=0.0, value=0.0)
+                abonemen = st.number_input('Abonemen (Rp/bulan)', min_value=0.0, value=0.0)
+                pajak = st.number_input('Pajak (%)', min_value=0.0, max_value=100.0, value=0.0)
+
+            # Satu jendela waktu pakai (mis. beban puncak 17-22); harga 0 berarti tanpa jendela
+            col3, col4, col5 = st.columns(3)
+            with col3:
+                jam_mulai_wbp = st.number_input('Jam Mulai Waktu Pakai', min_value=0, max_value=23, value=17)
+            with col4:
+                jam_selesai_wbp = st.number_input('Jam Selesai Waktu Pakai', min_value=0, max_value=23, value=22)
+            with col5:
+                harga_wbp = st.number_input('Harga Waktu Pakai (Rp/kWh, 0 = tanpa)', min_value=0.0, value=0.0)
+
+            if st.form_submit_button('Simpan Tarif'):
+                definisi = DefinisiTarif(
+                    golongan,
+                    [(batas_blok, harga_blok_1), (None, harga_blok_2)],
+                    waktu_pakai=[(jam_mulai_wbp, jam_selesai_wbp, harga_wbp)] if harga_wbp > 0 else (),
+                    biaya_minimum=biaya_minimum,
+                    abonemen=abonemen,
+                    pajak=pajak / 100
+                ) if aktif else None
+                monitor.atur_definisi_tarif(golongan, definisi)
+                st.success(f'Tarif golongan {golongan} disimpan!')
+
+    total_biaya = monitor.hitung_estimasi_biaya()
+    st.metric(
+        label="Estimasi Total Biaya selama Sebulan",
+        value=f"Rp {total_biaya:,.2f}"
+    )
+
+    golongan_df, peralatan_df, fig = monitor.ambil_turunan('biaya', lambda: buat_tampilan(monitor))
+    st.dataframe(golongan_df)
+
+    st.subheader("Rincian Biaya Listrik per Peralatan")
+
+    # Grafik distribusi biaya listrik
+    st.plotly_chart(fig)
+
+    # Kemudian tabel
+    st.dataframe(peralatan_df)
+    tombol_ekspor(monitor, 'biaya')
+
+# Menjalankan aplikasi
+if __name__ == "__main__":
+    main()
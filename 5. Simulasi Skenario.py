@@ -0,0 +1,81 @@
+import numpy as np
+import streamlit as st
+
+from impor_malas import impor_malas
+from monitor_listrik import GOLONGAN, buat_df_skenario
+from sesi import ambil_monitor
+
+px = impor_malas('plotly.express')
+
+
+# 5. Simulasi Skenario
+def buat_tampilan(monitor, hasil):
+    """Membuat tabel skenario terurut dan grafik front Pareto biaya vs kenyamanan"""
+    skenario_df = buat_df_skenario(monitor, hasil)
+    fig = px.scatter(
+        skenario_df,
+        x='Kehilangan Kenyamanan',
+        y='Biaya Listrik (Rp)',
+        color='Pareto',
+        hover_data=list(skenario_df.columns),
+        title='Front Pareto: Biaya Listrik vs Kehilangan Kenyamanan'
+    )
+    front = skenario_df[skenario_df['Pareto']].sort_values('Kehilangan Kenyamanan')
+    fig.add_scatter(x=front['Kehilangan Kenyamanan'], y=front['Biaya Listrik (Rp)'], mode='lines', name='Front Pareto')
+    return skenario_df, fig
+
+
+def buat_skenario(monitor, golongan, perubahan_jam, penggantian_watt):
+    """Menyapu semua kombinasi skenario pilihan (golongan sekarang selalu ikut) beserta tampilannya"""
+    hasil = monitor.sapu_skenario(
+        golongan=(None, *golongan), perubahan_jam=perubahan_jam, penggantian_watt=penggantian_watt
+    )
+    return buat_tampilan(monitor, hasil)
+
+
+def main():
+    monitor = ambil_monitor()
+    peralatan = monitor.peralatan
+    nama_peralatan = list(dict.fromkeys(peralatan.nama))
+
+    st.title('Simulasi Skenario')
+
+    golongan = st.multiselect('Golongan yang dicoba', GOLONGAN)
+
+    perubahan_jam = {}
+    dipilih = st.multiselect('Peralatan yang dikurangi jam penggunaannya', nama_peralatan)
+    for nama in dipilih:
+        jam_sekarang = float(peralatan.jam_per_hari[peralatan.nama == nama].max())
+        maksimum = st.slider(f'Pengurangan maksimum {nama} (jam/hari)', 0.0, jam_sekarang, min(2.0, jam_sekarang), step=0.5)
+        perubahan_jam[nama] = -np.arange(0.0, maksimum + 0.25, 0.5)
+
+    penggantian_watt = {}
+    diganti = st.multiselect('Peralatan yang diganti dengan yang lebih hemat', nama_peralatan)
+    for nama in diganti:
+        watt_sekarang = float(peralatan.watt[peralatan.nama == nama][0])
+        watt_baru = st.number_input(f'Daya pengganti {nama} (Watt)', min_value=0.0, value=watt_sekarang / 2)
+        penggantian_watt[nama] = [watt_sekarang, watt_baru]
+
+    # Sapuan, tabel dan grafik di-cache per pilihan grid; interaksi lain tidak menghitung ulang
+    kunci = (
+        'skenario', tuple(golongan),
+        tuple((nama, tuple(pilihan.tolist())) for nama, pilihan in perubahan_jam.items()),
+        tuple((nama, tuple(pilihan)) for nama, pilihan in penggantian_watt.items()),
+    )
+    try:
+        skenario_df, fig = monitor.ambil_turunan(
+            kunci, lambda: buat_skenario(monitor, golongan, perubahan_jam, penggantian_watt)
+        )
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    st.metric(label='Jumlah Skenario', value=f'{len(skenario_df):,}')
+
+    st.plotly_chart(fig)
+
+    st.subheader('Skenario Terurut')
+    st.dataframe(skenario_df)
+
+if __name__ == '__main__':
+    main()
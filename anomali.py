@@ -0,0 +1,165 @@
+from collections import deque
+
+import numpy as np
+
+AMBANG_Z = 3.5
+PEMANASAN = 7  # Jumlah bacaan per slot sebelum deteksi dimulai
+JUMLAH_PERINGATAN = 50  # Peringatan terbaru yang disimpan per monitor
+
+
+class DetektorAnomali:
+    """Deteksi anomali online dengan rata-rata dan varians berjalan (Welford) per seri dan slot.
+
+    Satu detektor melayani banyak seri sekaligus (mis. seluruh rumah tangga
+    armada) dengan status berukuran tetap (seri x slot): jumlah, rata-rata dan
+    M2. Slot memisahkan pola berulang, mis. 24 slot untuk jam dalam sehari
+    pada data per jam. Setiap bacaan dinilai terhadap statistik sebelum
+    bacaan itu masuk; bacaan yang anomali tidak ikut memperbarui statistik
+    agar satu gangguan panjang (pemanas macet) tidak menjadi "normal baru".
+    """
+
+    def __init__(self, jumlah_seri=1, jumlah_slot=1, ambang=AMBANG_Z, pemanasan=PEMANASAN):
+        """Inisialisasi status kosong untuk jumlah_seri x jumlah_slot"""
+        self.ambang = ambang
+        self.pemanasan = pemanasan
+        self.jumlah = np.zeros((jumlah_seri, jumlah_slot), dtype=np.int64)
+        self.rata_rata = np.zeros((jumlah_seri, jumlah_slot), dtype=np.float64)
+        self._m2 = np.zeros((jumlah_seri, jumlah_slot), dtype=np.float64)
+
+    def salin(self):
+        """Membuat salinan status detektor"""
+        salinan = DetektorAnomali.__new__(DetektorAnomali)
+        salinan.ambang = self.ambang
+        salinan.pemanasan = self.pemanasan
+        salinan.jumlah = self.jumlah.copy()
+        salinan.rata_rata = self.rata_rata.copy()
+        salinan._m2 = self._m2.copy()
+        return salinan
+
+    def simpangan_baku(self):
+        """Simpangan baku sampel per seri dan slot (NaN bila bacaan kurang dari dua)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.sqrt(self._m2 / (self.jumlah - 1))
+
+    def perbarui(self, nilai, slot=0, seri=None):
+        """Menilai lalu memasukkan satu bacaan untuk setiap seri yang diberikan.
+
+        nilai, slot dan seri berupa skalar atau array sama panjang; seri None
+        berarti semua seri berurutan. Setiap seri paling banyak satu bacaan
+        per panggilan. Mengembalikan (skor z, apakah anomali).
+        """
+        nilai = np.atleast_1d(np.asarray(nilai, dtype=np.float64))
+        if seri is None and np.ndim(slot) == 0:
+            # Satu bacaan untuk setiap seri pada slot yang sama: cukup view kolom, tanpa fancy indexing
+            indeks = (slice(None), int(slot))
+        else:
+            seri = np.arange(len(nilai)) if seri is None else np.atleast_1d(np.asarray(seri, dtype=np.int64))
+            indeks = (seri, np.broadcast_to(np.asarray(slot, dtype=np.int64), seri.shape))
+
+        jumlah = self.jumlah[indeks]
+        rata_rata = self.rata_rata[indeks]
+        m2 = self._m2[indeks]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            skor = (nilai - rata_rata) / np.sqrt(m2 / (jumlah - 1))
+        # Varians nol (seri konstan) memberi skor 0 seperti perbarui_satu, bukan inf yang menjadi skor raksasa
+        skor = np.where((jumlah >= self.pemanasan) & (m2 > 0), skor, 0.0)
+        anomali = np.abs(skor) > self.ambang
+
+        # Pembaruan Welford hanya untuk bacaan normal
+        normal = ~anomali
+        jumlah_baru = jumlah + normal
+        delta = nilai - rata_rata
+        rata_rata_baru = rata_rata + np.where(normal, delta / jumlah_baru, 0.0)
+        self._m2[indeks] = m2 + np.where(normal, delta * (nilai - rata_rata_baru), 0.0)
+        self.rata_rata[indeks] = rata_rata_baru
+        self.jumlah[indeks] = jumlah_baru
+        return skor, anomali
+
+    def perbarui_satu(self, nilai, slot=0, seri=0):
+        """Versi skalar perbarui() untuk satu bacaan, tanpa overhead array; mengembalikan (skor z, anomali)"""
+        jumlah = int(self.jumlah[seri, slot])
+        rata_rata = float(self.rata_rata[seri, slot])
+        m2 = float(self._m2[seri, slot])
+        skor = 0.0
+        if jumlah >= self.pemanasan and m2 > 0:
+            skor = (nilai - rata_rata) / (m2 / (jumlah - 1)) ** 0.5
+        anomali = abs(skor) > self.ambang
+        if not anomali:
+            jumlah += 1
+            delta = nilai - rata_rata
+            rata_rata += delta / jumlah
+            self.jumlah[seri, slot] = jumlah
+            self.rata_rata[seri, slot] = rata_rata
+            self._m2[seri, slot] = m2 + delta * (nilai - rata_rata)
+        return skor, anomali
+
+
+def deteksi_batch(kwh, slot=None, ambang=AMBANG_Z, pemanasan=PEMANASAN):
+    """Menjalankan detektor atas matriks bacaan (waktu x seri), mis. penggunaan harian seluruh armada.
+
+    Bacaan diproses per langkah waktu seperti alirannya tiba, setiap langkah
+    satu operasi vektor untuk semua seri. slot per langkah waktu (opsional).
+    Mengembalikan (skor, anomali) berbentuk sama dengan kwh, serta detektornya.
+    """
+    kwh = np.asarray(kwh, dtype=np.float64)
+    jumlah_slot = 1 if slot is None else int(np.max(slot)) + 1
+    detektor = DetektorAnomali(kwh.shape[1], jumlah_slot, ambang, pemanasan)
+    skor = np.empty_like(kwh)
+    anomali = np.empty(kwh.shape, dtype=bool)
+    for t in range(kwh.shape[0]):
+        skor[t], anomali[t] = detektor.perbarui(kwh[t], 0 if slot is None else slot[t])
+    return skor, anomali, detektor
+
+
+class PemantauAnomali:
+    """Detektor anomali satu rumah tangga untuk deret harian dan per jam, beserta peringatan terbarunya.
+
+    Hanya ember yang sudah lengkap (sebelum waktu sekarang) yang dinilai, dan
+    setiap ember dinilai sekali; peringatan disimpan dalam deque berukuran tetap.
+    """
+
+    def __init__(self):
+        """Inisialisasi detektor harian (1 slot) dan per jam (24 slot jam dalam sehari)"""
+        self.harian = DetektorAnomali()
+        self.per_jam = DetektorAnomali(jumlah_slot=24)
+        self.hari_terakhir = None
+        self.jam_terakhir = None
+        self.peringatan = deque(maxlen=JUMLAH_PERINGATAN)
+
+    def salin(self):
+        """Membuat salinan status pemantau"""
+        salinan = PemantauAnomali.__new__(PemantauAnomali)
+        salinan.harian = self.harian.salin()
+        salinan.per_jam = self.per_jam.salin()
+        salinan.hari_terakhir = self.hari_terakhir
+        salinan.jam_terakhir = self.jam_terakhir
+        salinan.peringatan = deque(self.peringatan, maxlen=JUMLAH_PERINGATAN)
+        return salinan
+
+    def _nilai(self, detektor, rollup, ember_terakhir, ember_sekarang, slot_dari_ember):
+        """Menilai ember baru yang lengkap dari satu rollup, mengembalikan ember terakhir yang dinilai"""
+        ember, kwh = rollup.seri()
+        baru = ember < ember_sekarang
+        if ember_terakhir is not None:
+            baru &= ember > ember_terakhir
+        for e, nilai in zip(ember[baru].tolist(), kwh[baru].tolist()):
+            skor, anomali = detektor.perbarui_satu(nilai, slot_dari_ember(e))
+            if anomali:
+                self.peringatan.append({
+                    'waktu': int(rollup.waktu_awal(e)),
+                    'resolusi': rollup.resolusi,
+                    'kwh': nilai,
+                    'rata_rata': float(detektor.rata_rata[0, slot_dari_ember(e)]),
+                    'skor': skor,
+                })
+            ember_terakhir = e
+        return ember_terakhir
+
+    def perbarui(self, deret, waktu_sekarang):
+        """Menilai semua ember harian dan per jam yang sudah lengkap sejak pembaruan terakhir"""
+        self.hari_terakhir = self._nilai(
+            self.harian, deret.per_hari, self.hari_terakhir, int(deret.per_hari.ember(waktu_sekarang)), lambda e: 0
+        )
+        self.jam_terakhir = self._nilai(
+            self.per_jam, deret.per_jam, self.jam_terakhir, int(deret.per_jam.ember(waktu_sekarang)), lambda e: e % 24
+        )
@@ -0,0 +1,177 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from impor_peralatan import ALIAS_KOLOM, baca_inventaris
+from monitor_listrik import TARIF_DEFAULT
+from perencana import batas_jam_default, rencanakan_jam
+from profil_beban import hitung_beban_jam_kelompok
+from tabel_peralatan import GOLONGAN, TabelPeralatan
+from tarif import DefinisiTarif, hitung_tagihan_golongan
+
+KOLOM_RUMAH_TANGGA = 'rumah_tangga'
+
+
+def _definisi_per_golongan(tarif):
+    """Menormalkan tarif (dict golongan -> Rp/kWh atau DefinisiTarif) menjadi daftar DefinisiTarif berurutan kode"""
+    tarif = {**TARIF_DEFAULT, **(tarif or {})}
+    return [
+        tarif[golongan] if isinstance(tarif[golongan], DefinisiTarif) else DefinisiTarif.flat(golongan, tarif[golongan])
+        for golongan in GOLONGAN
+    ]
+
+
+class Armada:
+    """Banyak rumah tangga dalam satu tabel peralatan berbentuk kolom.
+
+    Setiap peralatan membawa id rumah tangganya; penggunaan, biaya dan
+    penghematan seluruh rumah tangga dihitung sekaligus dengan bincount ke
+    matriks (rumah tangga x golongan), tanpa perulangan per rumah tangga.
+    """
+
+    def __init__(self, rumah_tangga, nama, unit, watt, golongan, jam_per_hari):
+        """Inisialisasi armada dari kolom-kolom peralatan yang sama panjang"""
+        self.id_rumah_tangga, self.kode_rumah_tangga = np.unique(np.asarray(rumah_tangga), return_inverse=True)
+        self.peralatan = TabelPeralatan(kapasitas=max(len(self.kode_rumah_tangga), 1))
+        self.peralatan.tambah_banyak(nama, unit, watt, golongan, jam_per_hari)
+
+    @classmethod
+    def dari_dataframe(cls, df):
+        """Membuat armada dari DataFrame berkolom rumah_tangga, nama, unit, watt, golongan, jam_per_hari"""
+        df = df.rename(columns=ALIAS_KOLOM)
+        return cls(
+            df[KOLOM_RUMAH_TANGGA].to_numpy(), df['nama'].to_numpy(dtype=object), df['unit'].to_numpy(),
+            df['watt'].to_numpy(), df['golongan'].to_numpy(dtype=object), df['jam_per_hari'].to_numpy()
+        )
+
+    def __len__(self):
+        """Jumlah rumah tangga"""
+        return len(self.id_rumah_tangga)
+
+    def _per_golongan(self, nilai):
+        """Menjumlahkan nilai per peralatan menjadi matriks (rumah tangga x golongan)"""
+        jumlah_golongan = len(GOLONGAN)
+        indeks = self.kode_rumah_tangga * jumlah_golongan + self.peralatan.kode_golongan
+        return np.bincount(indeks, weights=nilai, minlength=len(self) * jumlah_golongan).reshape(len(self), jumlah_golongan)
+
+    def _beban_jam(self, daftar_definisi):
+        """Bentuk beban per jam (rumah tangga x golongan x 24) bila ada tarif waktu pakai, selain itu None"""
+        if not any(definisi.waktu_pakai for definisi in daftar_definisi):
+            return None
+        jumlah_golongan = len(GOLONGAN)
+        kelompok = self.kode_rumah_tangga * jumlah_golongan + self.peralatan.kode_golongan
+        beban_jam = hitung_beban_jam_kelompok(self.peralatan, kelompok, len(self) * jumlah_golongan)
+        return beban_jam.reshape(len(self), jumlah_golongan, 24)
+
+    def hitung(self, tarif=None):
+        """Menghitung penggunaan, biaya dan potensi penghematan per rumah tangga.
+
+        tarif berupa dict golongan -> Rp/kWh atau DefinisiTarif (golongan yang
+        tidak disebut memakai TARIF_DEFAULT). Mengembalikan DataFrame satu baris
+        per rumah tangga.
+        """
+        definisi = _definisi_per_golongan(tarif)
+        kwh_golongan = self._per_golongan(self.peralatan.kwh_per_bulan())
+        kwh_saran_golongan = self._per_golongan(self.peralatan.kwh_saran_per_bulan())
+        beban_jam = self._beban_jam(definisi)
+        biaya = hitung_tagihan_golongan(definisi, kwh_golongan, beban_jam)
+        biaya_saran = hitung_tagihan_golongan(definisi, kwh_saran_golongan, beban_jam)
+        kwh = kwh_golongan.sum(axis=1)
+        kwh_saran = kwh_saran_golongan.sum(axis=1)
+        return pd.DataFrame({
+            KOLOM_RUMAH_TANGGA: self.id_rumah_tangga,
+            'jumlah_peralatan': np.bincount(self.kode_rumah_tangga, minlength=len(self)),
+            'total_kwh': kwh,
+            'estimasi_biaya': biaya,
+            'kwh_setelah_saran': kwh_saran,
+            'potensi_penghematan_kwh': kwh - kwh_saran,
+            'potensi_penghematan_biaya': biaya - biaya_saran,
+        })
+
+    def rencanakan(self, target_kwh=None, anggaran=None, tarif=None, prioritas=None):
+        """Menyusun rencana jam penggunaan untuk semua rumah tangga sekaligus.
+
+        target_kwh / anggaran boleh skalar atau satu nilai per rumah tangga
+        (urutan id_rumah_tangga). Mengembalikan (DataFrame per rumah tangga,
+        jam rencana per peralatan).
+        """
+        peralatan = self.peralatan
+        jam_min, jam_maks = batas_jam_default(peralatan.nama, peralatan.jam_per_hari)
+        if anggaran is None and target_kwh is None:
+            target_kwh = self._per_golongan(peralatan.kwh_saran_per_bulan()).sum(axis=1)
+        definisi = None if anggaran is None else _definisi_per_golongan(tarif)
+        rencana = rencanakan_jam(
+            peralatan.kwh_per_jam(), peralatan.kode_golongan, peralatan.jam_per_hari,
+            np.broadcast_to(target_kwh if anggaran is None else anggaran, (len(self),)),
+            jam_min=jam_min, jam_maks=jam_maks, prioritas=prioritas, rumah_tangga=self.kode_rumah_tangga,
+            daftar_definisi=definisi, beban_jam=None if definisi is None else self._beban_jam(definisi),
+        )
+        df = pd.DataFrame({
+            KOLOM_RUMAH_TANGGA: self.id_rumah_tangga,
+            'total_kwh_rencana': np.bincount(self.kode_rumah_tangga, weights=rencana['kwh_rencana'], minlength=len(self)),
+            'nilai_rencana': rencana['nilai'],
+            'tercapai': rencana['tercapai'],
+            'kehilangan_kenyamanan': rencana['kehilangan_kenyamanan_rumah_tangga'],
+        })
+        return df, rencana['jam_rencana']
+
+
+def hitung_berkas(sumber, tarif=None):
+    """Membaca satu berkas armada (CSV/Parquet) lalu menghitung hasil per rumah tangganya"""
+    df = pd.concat(list(baca_inventaris(sumber)), ignore_index=True)
+    return Armada.dari_dataframe(df).hitung(tarif)
+
+
+def _hitung_dataframe(df, tarif=None):
+    """Menghitung hasil per rumah tangga dari satu shard DataFrame armada"""
+    return Armada.dari_dataframe(df).hitung(tarif)
+
+
+def hitung_berkas_paralel(daftar_sumber, tarif=None, workers=None):
+    """Menghitung banyak berkas armada di process pool, hasil dialirkan per berkas sesuai urutan masukan.
+
+    Setiap proses membaca dan menghitung shard-nya sendiri, sehingga yang
+    dikirim antar proses hanya path berkas dan hasil per rumah tangga.
+    Rumah tangga yang sama sebaiknya tidak tersebar di beberapa berkas.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for sumber in daftar_sumber:
+            yield hitung_berkas(sumber, tarif)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(hitung_berkas, daftar_sumber, repeat(tarif))
+
+
+def hitung_paralel(armada_df, tarif=None, workers=None, jumlah_shard=None):
+    """Membagi DataFrame armada per rumah tangga menjadi shard lalu menghitungnya di process pool.
+
+    Hasil tiap shard dialirkan (generator) begitu selesai sesuai urutan shard.
+    """
+    workers = workers or os.cpu_count() or 1
+    jumlah_shard = jumlah_shard or workers
+    kode, _ = pd.factorize(armada_df[KOLOM_RUMAH_TANGGA])
+    shard = [armada_df[kode % jumlah_shard == i] for i in range(jumlah_shard)]
+    if workers == 1:
+        for bagian in shard:
+            yield _hitung_dataframe(bagian, tarif)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_hitung_dataframe, shard, repeat(tarif))
+
+
+def buat_armada_sintetis(jumlah_rumah_tangga, peralatan_per_rumah_tangga=15, seed=0, awal_id=0):
+    """Membuat DataFrame armada acak untuk pengujian beban dan benchmark"""
+    rng = np.random.default_rng(seed)
+    n = jumlah_rumah_tangga * peralatan_per_rumah_tangga
+    return pd.DataFrame({
+        KOLOM_RUMAH_TANGGA: np.repeat(np.arange(awal_id, awal_id + jumlah_rumah_tangga), peralatan_per_rumah_tangga),
+        'nama': rng.choice(['Kulkas', 'AC', 'Lampu LED', 'TV LED', 'Kamera Pengawas', 'Pemanas Air'], n),
+        'unit': rng.integers(1, 4, n),
+        'watt': rng.uniform(10, 2000, n).round(),
+        'golongan': rng.choice(GOLONGAN, n),
+        'jam_per_hari': rng.uniform(0.5, 24, n).round(1),
+    })
@@ -0,0 +1,48 @@
+"""Benchmark detektor anomali: biaya per bacaan untuk satu rumah tangga dan untuk armada (batch).
+
+Contoh: python benchmark/bench_anomali.py --rumah-tangga 100000 --hari 365
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anomali import DetektorAnomali, deteksi_batch  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rumah-tangga', type=int, default=100000)
+    parser.add_argument('--hari', type=int, default=365)
+    parser.add_argument('--bacaan-tunggal', type=int, default=20000, help='jumlah bacaan untuk uji satu seri')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    # Satu rumah tangga, bacaan per jam datang satu per satu
+    bacaan = rng.gamma(4.0, 0.1, args.bacaan_tunggal)
+    detektor = DetektorAnomali(jumlah_slot=24)
+    mulai = time.perf_counter()
+    for i, nilai in enumerate(bacaan.tolist()):
+        detektor.perbarui_satu(nilai, i % 24)
+    detik = time.perf_counter() - mulai
+    print(f'satu seri : {args.bacaan_tunggal} bacaan, {detik / args.bacaan_tunggal * 1e6:8.2f} us/bacaan')
+
+    # Armada: satu bacaan harian per rumah tangga per langkah
+    kwh = rng.gamma(9.0, 1.2, (args.hari, args.rumah_tangga))
+    kwh[rng.random(kwh.shape) < 0.001] *= 4  # Sisipan anomali
+    mulai = time.perf_counter()
+    _, anomali, detektor = deteksi_batch(kwh)
+    detik = time.perf_counter() - mulai
+    print(f'armada    : {kwh.size} bacaan ({args.rumah_tangga} rumah tangga x {args.hari} hari), '
+          f'{detik / kwh.size * 1e9:8.1f} ns/bacaan, {int(anomali.sum())} anomali')
+    status = detektor.jumlah.nbytes + detektor.rata_rata.nbytes + detektor._m2.nbytes
+    print(f'status    : {status / args.rumah_tangga:.0f} byte per rumah tangga (tetap, tidak tumbuh dengan waktu)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark mode armada: waktu hitung N rumah tangga untuk jumlah worker 1..jumlah core.
+
+Contoh: python benchmark/bench_armada.py --rumah-tangga 100000 --shard 16
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from armada import buat_armada_sintetis, hitung_berkas_paralel  # noqa: E402
+
+
+def siapkan_shard(folder, jumlah_rumah_tangga, jumlah_shard, peralatan_per_rumah_tangga):
+    """Menulis armada sintetis sebagai berkas-berkas CSV, satu rentang rumah tangga per berkas"""
+    per_shard = -(-jumlah_rumah_tangga // jumlah_shard)
+    daftar = []
+    for i in range(jumlah_shard):
+        jumlah = min(per_shard, jumlah_rumah_tangga - i * per_shard)
+        if jumlah <= 0:
+            break
+        path = os.path.join(folder, f'armada_{i:03d}.csv')
+        buat_armada_sintetis(jumlah, peralatan_per_rumah_tangga, seed=i, awal_id=i * per_shard).to_csv(path, index=False)
+        daftar.append(path)
+    return daftar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rumah-tangga', type=int, default=100000)
+    parser.add_argument('--peralatan', type=int, default=15, help='peralatan per rumah tangga')
+    parser.add_argument('--shard', type=int, default=None, help='jumlah berkas (default 4 x jumlah core)')
+    parser.add_argument('--workers', type=int, nargs='*', default=None, help='daftar jumlah worker yang diuji')
+    args = parser.parse_args()
+
+    core = os.cpu_count() or 1
+    daftar_workers = args.workers or list(range(1, core + 1))
+    jumlah_shard = args.shard or 4 * max(daftar_workers)
+
+    with tempfile.TemporaryDirectory() as folder:
+        daftar = siapkan_shard(folder, args.rumah_tangga, jumlah_shard, args.peralatan)
+        print(f'{args.rumah_tangga} rumah tangga, {args.rumah_tangga * args.peralatan} peralatan, '
+              f'{len(daftar)} shard, {core} core')
+        print(f'{"workers":>8} {"detik":>8} {"rt/detik":>12} {"speedup":>8} {"efisiensi":>10}')
+        dasar = None
+        for workers in daftar_workers:
+            mulai = time.perf_counter()
+            jumlah = sum(len(hasil) for hasil in hitung_berkas_paralel(daftar, workers=workers))
+            detik = time.perf_counter() - mulai
+            dasar = dasar or detik
+            speedup = dasar / detik
+            print(f'{workers:>8} {detik:>8.2f} {jumlah / detik:>12,.0f} {speedup:>8.2f} {speedup / workers:>10.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+"""Benchmark jalur utama MonitorListrik dan pembuat tabel/grafik halaman untuk 10 sampai 1 juta baris.
+
+Setiap kasus dijalankan pada setiap ukuran (jumlah peralatan atau baris
+penggunaan); dicatat waktu terbaik dari beberapa ulangan dan memori puncak
+(tracemalloc, termasuk array numpy). Hasil bisa disimpan sebagai baseline
+JSON lalu dibandingkan pada jalankan berikutnya; regresi membuat proses
+keluar dengan kode 1.
+
+Contoh:
+    python benchmark/bench_monitor.py --simpan benchmark/baseline_monitor.json
+    python benchmark/bench_monitor.py --bandingkan benchmark/baseline_monitor.json
+    python benchmark/bench_monitor.py --kasus hitung_ buat_tampilan --ukuran 10 1000000
+"""
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AKAR)
+
+from armada import buat_armada_sintetis  # noqa: E402
+from monitor_listrik import (  # noqa: E402
+    MonitorListrik, buat_df_biaya, buat_df_penggunaan, buat_df_penggunaan_harian, buat_df_peralatan
+)
+
+UKURAN_DEFAULT = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+TOLERANSI_WAKTU = 0.5    # Regresi bila lebih dari 50% lebih lambat dari baseline ...
+BATAS_DERAU_DETIK = 5e-3  # ... dan selisihnya di atas derau pengukuran
+TOLERANSI_MEMORI = 0.2
+BATAS_DERAU_BYTE = 1 << 20
+PANGGILAN_KECIL = 1000  # Jumlah panggilan per pengukuran untuk operasi O(1)
+WAKTU_AWAL = 1_700_000_000  # Epoch bacaan meter sintetis
+
+
+def _muat_halaman(nama_berkas, nama_modul):
+    """Memuat modul halaman Streamlit dari berkasnya (nama berkas diawali angka) tanpa menjalankan main()"""
+    spec = importlib.util.spec_from_file_location(nama_modul, os.path.join(AKAR, nama_berkas))
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+_kolom_cache = {}
+
+
+def kolom_peralatan(n):
+    """Kolom peralatan sintetis sebanyak n baris (di-cache per ukuran)"""
+    if n not in _kolom_cache:
+        df = buat_armada_sintetis(n // 15 + 1, 15).iloc[:n]
+        _kolom_cache[n] = tuple(df[kolom].to_numpy() for kolom in ('nama', 'unit', 'watt', 'golongan', 'jam_per_hari'))
+    return _kolom_cache[n]
+
+
+def bacaan_meter(n):
+    """n bacaan meter per menit (waktu epoch detik, kWh)"""
+    rng = np.random.default_rng(0)
+    return WAKTU_AWAL + 60 * np.arange(n, dtype=np.int64), rng.gamma(2.0, 0.005, n)
+
+
+def monitor_peralatan(n):
+    """Monitor baru berisi n peralatan sintetis"""
+    monitor = MonitorListrik()
+    monitor.tambah_peralatan_banyak(*kolom_peralatan(n))
+    return monitor
+
+
+def monitor_penggunaan(n):
+    """Monitor berisi peralatan default-sintetis dan n bacaan meter per menit"""
+    monitor = monitor_peralatan(15)
+    monitor.tambah_bacaan_meter(*bacaan_meter(n))
+    return monitor
+
+
+def _monitor_sampel(hari):
+    """Monitor berisi data penggunaan sampel sebanyak hari"""
+    monitor = MonitorListrik()
+    monitor.generate_sample_data(hari)
+    return monitor
+
+
+def _ulang(fungsi, kali=PANGGILAN_KECIL):
+    """Memanggil fungsi berulang kali (untuk operasi O(1) yang terlalu cepat diukur sekali)"""
+    def jalankan(*args):
+        for _ in range(kali):
+            fungsi(*args)
+    return jalankan
+
+
+def _tambah_satu_per_satu(monitor):
+    for i in range(PANGGILAN_KECIL):
+        monitor.tambah_peralatan(f'Peralatan {i}', 1, 100.0, 'R-1', 2.0)
+
+
+def _ubah_satu_per_satu(monitor):
+    for id_peralatan in range(min(PANGGILAN_KECIL, len(monitor.peralatan))):
+        monitor.ubah_peralatan(id_peralatan, watt=50.0)
+
+
+def _hapus_satu_per_satu(monitor):
+    for id_peralatan in range(min(PANGGILAN_KECIL, len(monitor.peralatan))):
+        monitor.hapus_peralatan(id_peralatan)
+
+
+def daftar_kasus():
+    """Kasus benchmark: nama -> (dimensi ukuran, persiapan(n) -> argumen, fungsi(*argumen), ukuran maksimum)"""
+    import app
+    halaman_peralatan = _muat_halaman('1. Peralatan Elektronik.py', 'halaman_peralatan')
+    halaman_penggunaan = _muat_halaman('2. Penggunaan Listrik.py', 'halaman_penggunaan')
+    halaman_biaya = _muat_halaman('3. Estimasi Biaya Listrik.py', 'halaman_biaya')
+    halaman_saran = _muat_halaman('4. Saran Penggunaan Listrik.py', 'halaman_saran')
+    halaman_skenario = _muat_halaman('5. Simulasi Skenario.py', 'halaman_skenario')
+
+    def satu(persiapan):
+        return lambda n: (persiapan(n),)
+
+    return {
+        # Operasi MonitorListrik
+        'tambah_peralatan': ('peralatan', satu(monitor_peralatan), _tambah_satu_per_satu, None),
+        'tambah_peralatan_banyak': (
+            'peralatan', lambda n: (MonitorListrik(), *kolom_peralatan(n)),
+            lambda monitor, *kolom: monitor.tambah_peralatan_banyak(*kolom), None
+        ),
+        'ubah_peralatan': ('peralatan', satu(monitor_peralatan), _ubah_satu_per_satu, None),
+        'hapus_peralatan': ('peralatan', satu(monitor_peralatan), _hapus_satu_per_satu, None),
+        'hitung_total_penggunaan': (
+            'peralatan', satu(monitor_peralatan), _ulang(MonitorListrik.hitung_total_penggunaan), None
+        ),
+        'hitung_estimasi_biaya': (
+            'peralatan', satu(monitor_peralatan), _ulang(MonitorListrik.hitung_estimasi_biaya), None
+        ),
+        'konsumsi_energi_per_peralatan': (
+            'peralatan', satu(monitor_peralatan), MonitorListrik.konsumsi_energi_per_peralatan, None
+        ),
+        'generate_sample_data': (
+            'penggunaan', lambda n: (MonitorListrik(), n), MonitorListrik.generate_sample_data, None
+        ),
+        'tambah_bacaan_meter': (
+            'penggunaan', lambda n: (monitor_peralatan(15), *bacaan_meter(n)), MonitorListrik.tambah_bacaan_meter, None
+        ),
+        # Dashboard
+        'dashboard.buat_df_penggunaan_harian': (
+            'penggunaan', lambda n: (_monitor_sampel(n),), buat_df_penggunaan_harian, None
+        ),
+        'dashboard.buat_grafik_penggunaan': (
+            'penggunaan', satu(monitor_penggunaan), lambda monitor: app.buat_grafik_penggunaan(monitor, None, None), None
+        ),
+        'dashboard.buat_grafik_konsumsi': ('peralatan', satu(monitor_peralatan), app.buat_grafik_konsumsi, None),
+        # Matriks beban berukuran peralatan x 1440 menit (float64): 10 rb peralatan sudah ~115 MB
+        'dashboard.buat_grafik_profil_beban': (
+            'peralatan', satu(monitor_peralatan), app.buat_grafik_profil_beban, 10_000
+        ),
+        # Halaman
+        'peralatan.buat_df_peralatan': ('peralatan', satu(monitor_peralatan), buat_df_peralatan, None),
+        'peralatan.buat_tampilan': ('peralatan', satu(monitor_peralatan), halaman_peralatan.buat_tampilan, None),
+        'penggunaan.buat_df_penggunaan': ('peralatan', satu(monitor_peralatan), buat_df_penggunaan, None),
+        'penggunaan.buat_tampilan': ('peralatan', satu(monitor_peralatan), halaman_penggunaan.buat_tampilan, None),
+        'biaya.buat_df_biaya': ('peralatan', satu(monitor_peralatan), buat_df_biaya, None),
+        'biaya.buat_tampilan': ('peralatan', satu(monitor_peralatan), halaman_biaya.buat_tampilan, None),
+        'saran.buat_tampilan': (
+            'peralatan', satu(monitor_peralatan),
+            lambda monitor: halaman_saran.buat_tampilan(monitor, monitor.rencanakan_penggunaan()), None
+        ),
+        'skenario.buat_tampilan': (
+            'peralatan', satu(monitor_peralatan),
+            lambda monitor: halaman_skenario.buat_tampilan(monitor, monitor.sapu_skenario()), None
+        ),
+    }
+
+
+def ukur(persiapan, fungsi, n, ulangan):
+    """Waktu terbaik (detik) dari beberapa ulangan dan memori puncak (byte) satu jalankan; persiapan tidak diukur"""
+    terbaik = float('inf')
+    for _ in range(ulangan):
+        argumen = persiapan(n)
+        mulai = time.perf_counter()
+        fungsi(*argumen)
+        terbaik = min(terbaik, time.perf_counter() - mulai)
+    argumen = persiapan(n)
+    tracemalloc.start()
+    fungsi(*argumen)
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return terbaik, puncak
+
+
+def bandingkan(hasil, baseline, toleransi_waktu=TOLERANSI_WAKTU, toleransi_memori=TOLERANSI_MEMORI):
+    """Daftar regresi (kunci, besaran, nilai baseline, nilai sekarang) terhadap baseline"""
+    regresi = []
+    for kunci, sekarang in hasil.items():
+        dasar = baseline.get(kunci)
+        if dasar is None:
+            continue
+        if (sekarang['detik'] > dasar['detik'] * (1 + toleransi_waktu)
+                and sekarang['detik'] - dasar['detik'] > BATAS_DERAU_DETIK):
+            regresi.append((kunci, 'detik', dasar['detik'], sekarang['detik']))
+        if (sekarang['memori_puncak'] > dasar['memori_puncak'] * (1 + toleransi_memori)
+                and sekarang['memori_puncak'] - dasar['memori_puncak'] > BATAS_DERAU_BYTE):
+            regresi.append((kunci, 'memori_puncak', dasar['memori_puncak'], sekarang['memori_puncak']))
+    return regresi
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ukuran', type=int, nargs='*', default=list(UKURAN_DEFAULT))
+    parser.add_argument('--kasus', nargs='*', default=None, help='hanya kasus yang namanya memuat salah satu teks ini')
+    parser.add_argument('--ulangan', type=int, default=3)
+    parser.add_argument('--simpan', default=None, help='menyimpan hasil sebagai baseline JSON')
+    parser.add_argument('--bandingkan', default=None, help='baseline JSON pembanding; keluar 1 bila ada regresi')
+    parser.add_argument('--toleransi-waktu', type=float, default=TOLERANSI_WAKTU)
+    parser.add_argument('--toleransi-memori', type=float, default=TOLERANSI_MEMORI)
+    args = parser.parse_args()
+
+    # Halaman Streamlit dimuat tanpa runtime; peringatan "missing ScriptRunContext" tidak relevan
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+    kasus = daftar_kasus()
+    if args.kasus:
+        kasus = {nama: isi for nama, isi in kasus.items() if any(teks in nama for teks in args.kasus)}
+
+    hasil = {}
+    print(f'{"kasus":<40} {"dimensi":>10} {"n":>9} {"detik":>10} {"memori MB":>10}')
+    for nama, (dimensi, persiapan, fungsi, maks) in kasus.items():
+        for n in args.ukuran:
+            if maks is not None and n > maks:
+                continue
+            detik, puncak = ukur(persiapan, fungsi, n, args.ulangan)
+            hasil[f'{nama}@{n}'] = {'detik': detik, 'memori_puncak': puncak}
+            print(f'{nama:<40} {dimensi:>10} {n:>9} {detik:>10.4f} {puncak / 1e6:>10.2f}', flush=True)
+
+    if args.simpan:
+        with open(args.simpan, 'w') as berkas:
+            json.dump({
+                'mesin': {'python': platform.python_version(), 'numpy': np.__version__,
+                          'platform': platform.platform(), 'cpu': os.cpu_count()},
+                'hasil': hasil,
+            }, berkas, indent=2, sort_keys=True)
+            berkas.write('\n')
+        print(f'baseline disimpan ke {args.simpan}')
+
+    if args.bandingkan:
+        with open(args.bandingkan) as berkas:
+            baseline = json.load(berkas)['hasil']
+        regresi = bandingkan(hasil, baseline, args.toleransi_waktu, args.toleransi_memori)
+        for kunci, besaran, dasar, sekarang in regresi:
+            print(f'REGRESI {kunci} {besaran}: {dasar:.6g} -> {sekarang:.6g} ({sekarang / dasar:.2f}x)')
+        if regresi:
+            sys.exit(1)
+        print(f'tidak ada regresi terhadap {args.bandingkan}')
+
+
+if __name__ == '__main__':
+    main()
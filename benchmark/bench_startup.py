@@ -0,0 +1,116 @@
+"""Waktu cold start aplikasi Streamlit: impor app.py dan render pertama halaman, dengan anggaran waktu.
+
+Setiap ulangan dijalankan di proses Python baru agar tidak ada modul yang
+sudah ter-cache. Yang diukur:
+    impor      import streamlit + import app (tanpa menjalankan main())
+    render     jalankan pertama halaman lewat AppTest, termasuk memuat
+               pandas/plotly.express saat tabel atau grafik pertama dibuat
+Selain anggaran waktu (median ulangan), impor app.py tidak boleh memuat
+modul berat (pandas, plotly.express, pyarrow). Pelanggaran membuat proses
+keluar dengan kode 1.
+
+Anggaran default diukur pada container 1 vCPU dengan headroom sekitar 1,5x;
+sesuaikan lewat --anggaran-impor/--anggaran-render untuk mesin lain.
+
+Contoh:
+    python benchmark/bench_startup.py
+    python benchmark/bench_startup.py --halaman "3. Estimasi Biaya Listrik.py" --ulangan 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ANGGARAN_IMPOR_DETIK = 1.25  # import streamlit + app
+ANGGARAN_RENDER_DETIK = 2.0   # render pertama halaman (Dashboard secara default)
+MODUL_BERAT = ('pandas', 'plotly.express', 'pyarrow')  # Tidak boleh dimuat oleh impor app.py
+HALAMAN_DEFAULT = 'app.py'
+
+
+def ukur_sekali(halaman):
+    """Dijalankan di proses anak: mengukur impor dan render pertama, mengembalikan dict hasil"""
+    sys.path.insert(0, AKAR)
+    os.chdir(AKAR)
+    mulai = time.perf_counter()
+    import streamlit  # noqa: F401
+    import app  # noqa: F401
+    impor = time.perf_counter() - mulai
+    dimuat = [nama for nama in MODUL_BERAT if nama in sys.modules]
+
+    from streamlit.testing.v1 import AppTest
+    mulai = time.perf_counter()
+    at = AppTest.from_file(os.path.join(AKAR, halaman), default_timeout=120).run()
+    render = time.perf_counter() - mulai
+    return {
+        'impor': impor,
+        'render': render,
+        'modul_berat_saat_impor': dimuat,
+        'galat': [str(e.value) for e in at.exception],
+    }
+
+
+def ukur(halaman, ulangan):
+    """Menjalankan ukur_sekali di proses baru sebanyak ulangan kali"""
+    hasil = []
+    for _ in range(ulangan):
+        keluaran = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--anak', '--halaman', halaman],
+            capture_output=True, text=True, check=True, cwd=AKAR
+        ).stdout
+        hasil.append(json.loads(keluaran.strip().splitlines()[-1]))
+    return hasil
+
+
+def periksa(hasil, anggaran_impor=ANGGARAN_IMPOR_DETIK, anggaran_render=ANGGARAN_RENDER_DETIK):
+    """Ringkasan median dan daftar pelanggaran anggaran"""
+    impor = statistics.median(h['impor'] for h in hasil)
+    render = statistics.median(h['render'] for h in hasil)
+    pelanggaran = []
+    if impor > anggaran_impor:
+        pelanggaran.append(f'impor {impor:.2f} s > anggaran {anggaran_impor:.2f} s')
+    if render > anggaran_render:
+        pelanggaran.append(f'render pertama {render:.2f} s > anggaran {anggaran_render:.2f} s')
+    dimuat = sorted({nama for h in hasil for nama in h['modul_berat_saat_impor']})
+    if dimuat:
+        pelanggaran.append(f'impor app.py memuat modul berat: {", ".join(dimuat)}')
+    galat = sorted({g for h in hasil for g in h['galat']})
+    if galat:
+        pelanggaran.append(f'halaman gagal dirender: {"; ".join(galat)}')
+    return {'impor': impor, 'render': render, 'total': impor + render}, pelanggaran
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--halaman', default=HALAMAN_DEFAULT, help='berkas halaman yang dirender (default: app.py)')
+    parser.add_argument('--ulangan', type=int, default=3)
+    parser.add_argument('--anggaran-impor', type=float, default=ANGGARAN_IMPOR_DETIK)
+    parser.add_argument('--anggaran-render', type=float, default=ANGGARAN_RENDER_DETIK)
+    parser.add_argument('--anak', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.anak:
+        print(json.dumps(ukur_sekali(args.halaman)))
+        return
+
+    hasil = ukur(args.halaman, args.ulangan)
+    for i, h in enumerate(hasil, 1):
+        print(f"ulangan {i}: impor {h['impor']:.3f} s, render pertama {h['render']:.3f} s")
+    median, pelanggaran = periksa(hasil, args.anggaran_impor, args.anggaran_render)
+    print(f"median: impor {median['impor']:.3f} s (anggaran {args.anggaran_impor:.2f}), "
+          f"render pertama {median['render']:.3f} s (anggaran {args.anggaran_render:.2f}), "
+          f"total {median['total']:.3f} s")
+    if pelanggaran:
+        print('\nAnggaran cold start terlampaui:')
+        for pesan in pelanggaran:
+            print(f'  {pesan}')
+        sys.exit(1)
+    print('Anggaran cold start terpenuhi')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """Cache LRU berukuran terbatas dengan penghitung hit/miss.
+
+    Entri boleh diberi label versi (nama, nilai). Begitu nilai versi suatu
+    nama berubah, semua entri berlabel nama itu dengan nilai lain dibuang
+    saat itu juga, tanpa menunggu terdesak entri baru, sehingga turunan
+    besar dari versi lama tidak tertahan di memori.
+    """
+
+    def __init__(self, kapasitas=32):
+        """Inisialisasi cache kosong dengan jumlah entri maksimum"""
+        self.kapasitas = kapasitas
+        self._data = OrderedDict()
+        self._versi_entri = {}  # Kunci -> (nama versi, nilai versi)
+        self._versi_terakhir = {}  # Nama versi -> nilai versi terakhir yang diminta
+        self.hit = 0
+        self.miss = 0
+
+    def _buang_versi_lama(self, nama, nilai):
+        """Membuang entri berlabel versi nama dengan nilai selain nilai"""
+        if self._versi_terakhir.get(nama, nilai) != nilai:
+            for kunci, (nama_entri, nilai_entri) in list(self._versi_entri.items()):
+                if nama_entri == nama and nilai_entri != nilai:
+                    del self._data[kunci]
+                    del self._versi_entri[kunci]
+        self._versi_terakhir[nama] = nilai
+
+    def ambil(self, kunci, pembuat, versi=None):
+        """Mengembalikan nilai untuk kunci, memanggil pembuat() hanya bila belum tersimpan.
+
+        versi (nama, nilai) melabeli entri dan membuang entri versi lama bernama sama.
+        """
+        if versi is not None:
+            self._buang_versi_lama(*versi)
+        if kunci in self._data:
+            self._data.move_to_end(kunci)
+            self.hit += 1
+            return self._data[kunci]
+        self.miss += 1
+        nilai = pembuat()
+        self._data[kunci] = nilai
+        if versi is not None:
+            self._versi_entri[kunci] = versi
+        if len(self._data) > self.kapasitas:
+            kunci_lama, _ = self._data.popitem(last=False)
+            self._versi_entri.pop(kunci_lama, None)
+        return nilai
+
+    def kosongkan(self):
+        """Menghapus semua entri (penghitung hit/miss tetap)"""
+        self._data.clear()
+        self._versi_entri.clear()
+
+    def statistik(self):
+        """Mengembalikan jumlah hit, miss dan entri yang tersimpan"""
+        return {'hit': self.hit, 'miss': self.miss, 'entri': len(self._data)}
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,318 @@
+import time
+
+import numpy as np
+
+from indeks_rentang import IndeksRentang
+from penyederhanaan import LEBAR_GRAFIK_PX, lttb
+
+DETIK_PER_MENIT = 60
+DETIK_PER_JAM = 3600
+DETIK_PER_HARI = 86400
+OFFSET_WIB = 7 * DETIK_PER_JAM  # Batas hari mengikuti tengah malam WIB
+
+TANGGAL_TAGIHAN_MAKS = 28  # Tanggal awal siklus tagihan yang ada di setiap bulan
+
+_ID_KOSONG = np.iinfo(np.int64).min
+
+
+def ke_epoch_detik(waktu):
+    """Mengubah waktu (epoch detik, datetime64 atau datetime) menjadi array int64 epoch detik"""
+    waktu = np.atleast_1d(np.asarray(waktu))
+    if waktu.dtype == object:
+        waktu = waktu.astype('datetime64[s]')
+    if waktu.dtype.kind == 'M':
+        return waktu.astype('datetime64[s]').astype(np.int64)
+    return waktu.astype(np.int64)
+
+
+def ke_tanggal(hari):
+    """Mengubah id hari menjadi datetime.date"""
+    return np.datetime64(int(hari), 'D').item()
+
+
+def dari_tanggal(tanggal):
+    """Mengubah datetime.date menjadi id hari"""
+    return int((np.datetime64(tanggal, 'D') - np.datetime64(0, 'D')).astype(np.int64))
+
+
+def _awal_bulan(bulan):
+    """Id hari tanggal 1 untuk array datetime64[M]"""
+    return (bulan.astype('datetime64[D]') - np.datetime64(0, 'D')).astype(np.int64)
+
+
+def siklus_tagihan(hari, tanggal_tagihan=1):
+    """Id hari awal (inklusif) dan akhir (eksklusif) siklus tagihan kalender yang memuat hari.
+
+    Siklus dimulai pada tanggal_tagihan setiap bulan (1 = bulan kalender),
+    sehingga panjangnya 28 sampai 31 hari mengikuti kalender.
+    """
+    awal, akhir = daftar_siklus_tagihan(hari, hari, tanggal_tagihan)
+    return int(awal[0]), int(akhir[0])
+
+
+def daftar_siklus_tagihan(hari_awal, hari_akhir, tanggal_tagihan=1):
+    """Array id hari awal (inklusif) dan akhir (eksklusif) semua siklus tagihan yang beririsan dengan rentang hari"""
+    if not 1 <= tanggal_tagihan <= TANGGAL_TAGIHAN_MAKS:
+        raise ValueError(f'Tanggal tagihan harus antara 1 dan {TANGGAL_TAGIHAN_MAKS}')
+    geser = tanggal_tagihan - 1
+    # Menggeser hari mundur sebesar (tanggal_tagihan - 1) memetakan siklus ke bulan kalender
+    bulan_awal = np.datetime64(int(hari_awal) - geser, 'D').astype('datetime64[M]')
+    bulan_akhir = np.datetime64(int(hari_akhir) - geser, 'D').astype('datetime64[M]')
+    bulan = np.arange(bulan_awal, bulan_akhir + 1)
+    return _awal_bulan(bulan) + geser, _awal_bulan(bulan + 1) + geser
+
+
+class BufferCincin:
+    """Ring buffer berkapasitas tetap untuk bacaan meter mentah (waktu, kWh).
+
+    Array dialokasikan sekali saat bacaan pertama masuk; bacaan terlama
+    ditimpa ketika buffer penuh.
+    """
+
+    def __init__(self, kapasitas):
+        """Inisialisasi buffer kosong dengan kapasitas tetap"""
+        self.kapasitas = kapasitas
+        self._waktu = None
+        self._kwh = None
+        self._ditulis = 0  # Jumlah bacaan yang pernah ditulis
+
+    def tambah_banyak(self, waktu, kwh):
+        """Menulis sekumpulan bacaan ke buffer"""
+        if self._waktu is None:
+            self._waktu = np.zeros(self.kapasitas, dtype=np.int64)
+            self._kwh = np.zeros(self.kapasitas, dtype=np.float64)
+        n = len(waktu)
+        if n > self.kapasitas:
+            self._ditulis += n - self.kapasitas
+            waktu, kwh, n = waktu[-self.kapasitas:], kwh[-self.kapasitas:], self.kapasitas
+        awal = self._ditulis % self.kapasitas
+        ujung = min(n, self.kapasitas - awal)
+        self._waktu[awal:awal + ujung] = waktu[:ujung]
+        self._kwh[awal:awal + ujung] = kwh[:ujung]
+        self._waktu[:n - ujung] = waktu[ujung:]
+        self._kwh[:n - ujung] = kwh[ujung:]
+        self._ditulis += n
+
+    def data(self):
+        """Mengembalikan (waktu, kWh) bacaan yang tersimpan, urut dari yang terlama"""
+        if self._waktu is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        if self._ditulis <= self.kapasitas:
+            return self._waktu[:self._ditulis].copy(), self._kwh[:self._ditulis].copy()
+        awal = self._ditulis % self.kapasitas
+        return np.roll(self._waktu, -awal), np.roll(self._kwh, -awal)
+
+    def __len__(self):
+        return min(self._ditulis, self.kapasitas)
+
+
+class RollupWaktu:
+    """Jumlah kWh per ember waktu (menit/jam/hari) dalam ring berkapasitas tetap.
+
+    Ember ke-b disimpan di slot b % kapasitas bersama id embernya, sehingga
+    penambahan bacaan hanya menyentuh slot ember terkait (tanpa geser array)
+    dan ember yang lebih tua dari jendela kapasitas otomatis tertimpa.
+    """
+
+    def __init__(self, resolusi, kapasitas, offset=0):
+        """Inisialisasi rollup dengan resolusi (detik) dan jumlah ember yang disimpan"""
+        self.resolusi = resolusi
+        self.kapasitas = kapasitas
+        self.offset = offset
+        self._id = None
+        self._jumlah = None
+        self.terbaru = None  # Id ember terbaru
+
+    def ember(self, waktu):
+        """Id ember untuk waktu (epoch detik)"""
+        return (np.asarray(waktu, dtype=np.int64) + self.offset) // self.resolusi
+
+    def waktu_awal(self, ember):
+        """Waktu awal (epoch detik) dari id ember"""
+        return np.asarray(ember, dtype=np.int64) * self.resolusi - self.offset
+
+    def tambah_bacaan_banyak(self, waktu, kwh):
+        """Menambahkan bacaan (waktu epoch detik, kWh) ke ember masing-masing"""
+        self.tambah_banyak(self.ember(waktu), kwh)
+
+    def tambah_banyak(self, ember, kwh):
+        """Menambahkan kWh ke ember-ember tertentu"""
+        ember = np.asarray(ember, dtype=np.int64)
+        kwh = np.asarray(kwh, dtype=np.float64)
+        if not len(ember):
+            return
+        if self._id is None:
+            self._id = np.full(self.kapasitas, _ID_KOSONG, dtype=np.int64)
+            self._jumlah = np.zeros(self.kapasitas, dtype=np.float64)
+
+        terbaru = int(ember.max()) if self.terbaru is None else max(self.terbaru, int(ember.max()))
+        dalam_jendela = ember > terbaru - self.kapasitas
+        ember, kwh = ember[dalam_jendela], kwh[dalam_jendela]
+
+        slot = ember % self.kapasitas
+        id_lama = self._id[slot]
+        baru = ember > id_lama
+        self._id[slot[baru]] = ember[baru]
+        self._jumlah[slot[baru]] = 0.0
+        np.add.at(self._jumlah, slot, kwh)
+        self.terbaru = terbaru
+
+    def nilai(self, ember):
+        """Total kWh ember-ember tertentu (NaN untuk ember yang tidak terisi atau sudah di luar jendela)"""
+        ember = np.asarray(ember, dtype=np.int64)
+        if self._id is None:
+            return np.full(ember.shape, np.nan)
+        slot = ember % self.kapasitas
+        return np.where(self._id[slot] == ember, self._jumlah[slot], np.nan)
+
+    def seri(self):
+        """Mengembalikan (id ember, kWh) untuk ember yang terisi, urut dari yang terlama"""
+        if self.terbaru is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        ember = np.arange(self.terbaru - self.kapasitas + 1, self.terbaru + 1, dtype=np.int64)
+        slot = ember % self.kapasitas
+        terisi = self._id[slot] == ember
+        return ember[terisi], self._jumlah[slot[terisi]]
+
+    def salin(self):
+        """Membuat salinan rollup yang dapat diubah"""
+        salinan = RollupWaktu(self.resolusi, self.kapasitas, self.offset)
+        if self._id is not None:
+            salinan._id = self._id.copy()
+            salinan._jumlah = self._jumlah.copy()
+        salinan.terbaru = self.terbaru
+        return salinan
+
+    def bekukan(self):
+        """Menjadikan array rollup hanya-baca"""
+        if self._id is not None:
+            self._id.flags.writeable = False
+            self._jumlah.flags.writeable = False
+
+
+class DeretWaktu:
+    """Deret waktu penggunaan listrik: bacaan mentah dan rollup menit, jam dan hari.
+
+    Bacaan meter (resolusi 1 detik sampai 1 menit) masuk ke ring buffer mentah
+    dan sekaligus dijumlahkan ke rollup menit, jam dan hari. Data yang sudah
+    berupa total harian bisa langsung ditulis ke rollup hari. Indeks rentang
+    atas total harian ikut diperbarui setiap penulisan agar jumlah, rata-rata,
+    minimum dan maksimum rentang hari bisa dijawab O(1).
+    """
+
+    def __init__(self, kapasitas_mentah=DETIK_PER_HARI, offset=OFFSET_WIB):
+        """Inisialisasi deret waktu kosong (array dialokasikan saat pertama ditulis)"""
+        self.offset = offset
+        self.mentah = BufferCincin(kapasitas_mentah)
+        self.per_menit = RollupWaktu(DETIK_PER_MENIT, 7 * 24 * 60, offset)   # 7 hari
+        self.per_jam = RollupWaktu(DETIK_PER_JAM, 400 * 24, offset)          # ~13 bulan
+        self.per_hari = RollupWaktu(DETIK_PER_HARI, 10 * 366, offset)        # ~10 tahun
+        self.indeks_harian = IndeksRentang()
+
+    def tambah_bacaan(self, waktu, kwh):
+        """Menambahkan satu bacaan meter (kWh sejak bacaan sebelumnya)"""
+        self.tambah_bacaan_banyak([waktu], [kwh])
+
+    def tambah_bacaan_banyak(self, waktu, kwh):
+        """Menambahkan sekumpulan bacaan meter dan memperbarui semua rollup"""
+        waktu = ke_epoch_detik(waktu)
+        kwh = np.atleast_1d(np.asarray(kwh, dtype=np.float64))
+        if len(waktu) != len(kwh):
+            raise ValueError('Panjang waktu dan kWh bacaan harus sama')
+        self.mentah.tambah_banyak(waktu, kwh)
+        for rollup in (self.per_menit, self.per_jam, self.per_hari):
+            rollup.tambah_bacaan_banyak(waktu, kwh)
+        self._perbarui_indeks(self.per_hari.ember(waktu))
+
+    def tambah_harian(self, hari, kwh):
+        """Menambahkan total kWh harian langsung ke rollup hari (hari = id hari)"""
+        hari = np.atleast_1d(np.asarray(hari, dtype=np.int64))
+        self.per_hari.tambah_banyak(hari, np.atleast_1d(kwh))
+        self._perbarui_indeks(hari)
+
+    def _perbarui_indeks(self, hari):
+        """Menyalin total terbaru hari-hari yang berubah ke indeks rentang"""
+        hari = np.unique(hari)
+        nilai = self.per_hari.nilai(hari)
+        terisi = ~np.isnan(nilai)
+        self.indeks_harian.atur(hari[terisi], nilai[terisi])
+
+    def statistik_rentang(self, hari_awal, hari_akhir):
+        """Jumlah, rata-rata, minimum, maksimum dan jumlah hari berdata pada rentang hari (inklusif), O(1).
+
+        Argumen boleh berupa array untuk banyak rentang sekaligus; rata-rata
+        dihitung atas hari yang berdata.
+        """
+        return self.indeks_harian.kueri(hari_awal, hari_akhir)
+
+    def harian(self):
+        """Mengembalikan (id hari, kWh) dari rollup hari"""
+        return self.per_hari.seri()
+
+    def hari_ini(self):
+        """Id hari untuk waktu sekarang"""
+        return int(self.per_hari.ember(int(time.time())))
+
+    def hari_terakhir(self):
+        """Id hari terbaru yang terisi, atau None bila kosong"""
+        return self.per_hari.terbaru
+
+    def rentang_hari(self):
+        """Id hari pertama dan terakhir yang terisi, atau (None, None) bila kosong"""
+        hari, _ = self.harian()
+        if not len(hari):
+            return None, None
+        return int(hari[0]), int(hari[-1])
+
+    def kueri(self, hari_awal=None, hari_akhir=None, jumlah_titik=LEBAR_GRAFIK_PX):
+        """Mengambil penggunaan pada rentang hari (inklusif) untuk digambar.
+
+        Dipilih rollup terhalus (menit, jam, lalu hari) yang masih mencakup
+        seluruh rentang, kemudian hasilnya disederhanakan dengan LTTB menjadi
+        paling banyak jumlah_titik titik. Mengembalikan (waktu epoch detik,
+        kWh per ember, resolusi dalam detik).
+        """
+        hari_pertama, hari_terakhir = self.rentang_hari()
+        if hari_pertama is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64), DETIK_PER_HARI
+        hari_awal = hari_pertama if hari_awal is None else max(hari_awal, hari_pertama)
+        hari_akhir = hari_terakhir if hari_akhir is None else hari_akhir
+        awal = self.per_hari.waktu_awal(hari_awal)
+        akhir = self.per_hari.waktu_awal(hari_akhir + 1)
+
+        for rollup in (self.per_menit, self.per_jam, self.per_hari):
+            ember, kwh = rollup.seri()
+            if not len(ember):
+                continue
+            waktu = rollup.waktu_awal(ember)
+            if rollup is not self.per_hari:
+                if rollup.waktu_awal(rollup.terbaru - rollup.kapasitas + 1) > awal:
+                    continue  # Jendela rollup ini sudah tidak mencakup awal rentang
+                if waktu[0] >= awal + DETIK_PER_HARI:
+                    continue  # Hari awal hanya punya total harian, tanpa bacaan rinci
+            potong = slice(np.searchsorted(waktu, awal), np.searchsorted(waktu, akhir))
+            waktu, kwh = lttb(waktu[potong], kwh[potong], jumlah_titik)
+            return waktu, kwh, rollup.resolusi
+
+    def salin(self):
+        """Membuat salinan deret waktu yang dapat diubah"""
+        salinan = DeretWaktu.__new__(DeretWaktu)
+        salinan.offset = self.offset
+        salinan.mentah = BufferCincin(self.mentah.kapasitas)
+        if len(self.mentah):
+            salinan.mentah.tambah_banyak(*self.mentah.data())
+        salinan.per_menit = self.per_menit.salin()
+        salinan.per_jam = self.per_jam.salin()
+        salinan.per_hari = self.per_hari.salin()
+        salinan.indeks_harian = self.indeks_harian.salin()
+        return salinan
+
+    def bekukan(self):
+        """Menjadikan semua rollup dan indeks rentang hanya-baca"""
+        for rollup in (self.per_menit, self.per_jam, self.per_hari):
+            rollup.bekukan()
+        self.indeks_harian.bekukan()
+
+    def __len__(self):
+        """Jumlah hari yang terisi"""
+        return len(self.harian()[0])
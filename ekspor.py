@@ -0,0 +1,184 @@
+import importlib.util
+import io
+import os
+import tempfile
+
+from monitor_listrik import buat_df_biaya, buat_df_penggunaan, buat_df_peralatan, buat_df_rencana
+
+UKURAN_CHUNK_EKSPOR = 10000  # Baris per chunk; memori puncak sebanding ukuran ini, bukan jumlah baris
+UKURAN_BLOK_BACA = 1 << 20
+
+# Format ekspor: ekstensi dan tipe MIME
+FORMAT_EKSPOR = {
+    'csv': ('.csv', 'text/csv'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'excel': ('.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'json': ('.json', 'application/json'),
+}
+
+# Paket opsional yang dibutuhkan format tertentu
+DEPENDENSI_FORMAT = {'parquet': 'pyarrow', 'excel': 'xlsxwriter'}
+
+# Tabel per halaman: pembuat DataFrame per potongan baris peralatan
+TABEL_EKSPOR = {
+    'peralatan': lambda monitor, potong, rencana: buat_df_peralatan(monitor, potong),
+    'penggunaan': lambda monitor, potong, rencana: buat_df_penggunaan(monitor, potong),
+    'biaya': lambda monitor, potong, rencana: buat_df_biaya(monitor, potong),
+    'saran': lambda monitor, potong, rencana: buat_df_rencana(monitor, rencana, potong),
+}
+
+
+def format_tersedia():
+    """Format ekspor yang dependensinya terpasang"""
+    return [
+        format for format in FORMAT_EKSPOR
+        if format not in DEPENDENSI_FORMAT or importlib.util.find_spec(DEPENDENSI_FORMAT[format])
+    ]
+
+
+def chunk_tabel(monitor, tabel, rencana=None, ukuran_chunk=UKURAN_CHUNK_EKSPOR):
+    """Menghasilkan DataFrame tabel halaman per chunk baris, dibangun langsung dari potongan array peralatan"""
+    if tabel not in TABEL_EKSPOR:
+        raise ValueError(f'Tabel ekspor tidak dikenal: {tabel}')
+    if tabel == 'saran' and rencana is None:
+        rencana = monitor.rencanakan_penggunaan()
+    pembuat = TABEL_EKSPOR[tabel]
+    jumlah = len(monitor.peralatan)
+    for awal in range(0, max(jumlah, 1), ukuran_chunk):
+        yield pembuat(monitor, slice(awal, min(awal + ukuran_chunk, jumlah)), rencana)
+
+
+class _Penampung(io.RawIOBase):
+    """Tujuan tulis sementara untuk penulis Parquet: isi yang sudah ditulis diambil lalu dikosongkan"""
+
+    def __init__(self):
+        self._bagian = []
+        self._posisi = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._bagian.append(data)
+        self._posisi += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._posisi
+
+    def ambil(self):
+        """Mengambil dan mengosongkan byte yang sudah ditulis"""
+        data = b''.join(self._bagian)
+        self._bagian = []
+        return data
+
+
+def aliran_csv(chunks):
+    """Mengubah aliran DataFrame menjadi aliran byte CSV (UTF-8), header hanya sekali"""
+    for i, df in enumerate(chunks):
+        yield df.to_csv(index=False, header=i == 0).encode('utf-8')
+
+
+def aliran_json(chunks):
+    """Mengubah aliran DataFrame menjadi aliran byte satu array JSON berisi record"""
+    yield b'['
+    pertama = True
+    for df in chunks:
+        if not len(df):
+            continue
+        isi = df.to_json(orient='records', date_format='iso', force_ascii=False)[1:-1]
+        yield (isi if pertama else ',' + isi).encode('utf-8')
+        pertama = False
+    yield b']'
+
+
+def aliran_parquet(chunks):
+    """Mengubah aliran DataFrame menjadi aliran byte Parquet, satu row group per chunk"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError('Ekspor Parquet membutuhkan paket pyarrow') from e
+    penampung = _Penampung()
+    penulis = None
+    for df in chunks:
+        if penulis is None:
+            skema = pa.Schema.from_pandas(df, preserve_index=False)
+            penulis = pq.ParquetWriter(penampung, skema)
+        penulis.write_table(pa.Table.from_pandas(df, schema=skema, preserve_index=False))
+        yield penampung.ambil()
+    if penulis is not None:
+        penulis.close()
+    yield penampung.ambil()
+
+
+def aliran_excel(chunks, nama_sheet='Data'):
+    """Mengubah aliran DataFrame menjadi aliran byte XLSX.
+
+    xlsxwriter mode constant_memory menulis baris langsung ke berkas
+    sementara, sehingga memori tidak bertambah dengan jumlah baris; berkas
+    jadinya lalu dibaca per blok.
+    """
+    try:
+        import xlsxwriter
+    except ImportError as e:
+        raise ImportError('Ekspor Excel membutuhkan paket xlsxwriter') from e
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'ekspor.xlsx')
+        buku = xlsxwriter.Workbook(path, {'constant_memory': True, 'tmpdir': folder})
+        sheet = buku.add_worksheet(nama_sheet)
+        baris = 0
+        for df in chunks:
+            if baris == 0:
+                sheet.write_row(0, 0, list(df.columns))
+                baris = 1
+            for nilai in df.itertuples(index=False):
+                sheet.write_row(baris, 0, nilai)
+                baris += 1
+        buku.close()
+        with open(path, 'rb') as berkas:
+            while blok := berkas.read(UKURAN_BLOK_BACA):
+                yield blok
+
+
+def aliran_ekspor(monitor, tabel, format='csv', rencana=None, ukuran_chunk=UKURAN_CHUNK_EKSPOR):
+    """Aliran byte berkas ekspor tabel halaman dalam format csv, parquet, excel atau json"""
+    chunks = chunk_tabel(monitor, tabel, rencana, ukuran_chunk)
+    if format == 'csv':
+        return aliran_csv(chunks)
+    if format == 'parquet':
+        return aliran_parquet(chunks)
+    if format == 'excel':
+        return aliran_excel(chunks, tabel.capitalize())
+    if format == 'json':
+        return aliran_json(chunks)
+    raise ValueError(f'Format ekspor tidak didukung: {format}')
+
+
+def tulis_ekspor(monitor, tabel, path, format='csv', rencana=None, ukuran_chunk=UKURAN_CHUNK_EKSPOR):
+    """Menulis ekspor tabel halaman ke berkas chunk demi chunk, mengembalikan jumlah byte"""
+    ukuran = 0
+    with open(path, 'wb') as berkas:
+        for blok in aliran_ekspor(monitor, tabel, format, rencana, ukuran_chunk):
+            berkas.write(blok)
+            ukuran += len(blok)
+    return ukuran
+
+
+def data_unduhan(monitor, tabel, format='csv', rencana=None, ukuran_chunk=UKURAN_CHUNK_EKSPOR):
+    """Isi berkas ekspor sebagai bytes untuk tombol unduh.
+
+    Chunk ditulis dulu ke berkas sementara di disk, jadi yang dibaca ke
+    memori hanya hasil akhirnya, tanpa DataFrame penuh maupun daftar chunk.
+    """
+    with tempfile.TemporaryFile() as berkas:
+        for blok in aliran_ekspor(monitor, tabel, format, rencana, ukuran_chunk):
+            berkas.write(blok)
+        berkas.seek(0)
+        return berkas.read()
+
+
+def nama_berkas_ekspor(tabel, format):
+    """Nama berkas unduhan untuk tabel dan format"""
+    return f'{tabel}{FORMAT_EKSPOR[format][0]}'
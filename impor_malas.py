@@ -0,0 +1,36 @@
+import importlib
+import sys
+
+
+class ModulMalas:
+    """Pengganti modul yang baru mengimpor modul aslinya saat atribut pertama diakses.
+
+    Dipakai untuk pandas dan plotly.express di jalur Streamlit agar impor
+    aplikasi dan halaman tidak memuatnya sebelum ada tabel atau grafik yang
+    benar-benar dibuat. Setelah dimuat, akses atribut hanya satu pencarian
+    dict tambahan.
+    """
+
+    def __init__(self, nama):
+        self._nama = nama
+        self._modul = None
+
+    def __getattr__(self, atribut):
+        if atribut.startswith('__'):
+            raise AttributeError(atribut)
+        modul = self._modul
+        if modul is None:
+            modul = self._modul = importlib.import_module(self._nama)
+        return getattr(modul, atribut)
+
+    def __repr__(self):
+        return f"<ModulMalas '{self._nama}' ({'dimuat' if self.sudah_dimuat() else 'belum dimuat'})>"
+
+    def sudah_dimuat(self):
+        """True bila modul asli sudah ada di sys.modules"""
+        return self._modul is not None or self._nama in sys.modules
+
+
+def impor_malas(nama):
+    """ModulMalas untuk nama modul; bila modul sudah dimuat, modul aslinya langsung dikembalikan"""
+    return sys.modules.get(nama) or ModulMalas(nama)
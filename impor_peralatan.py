@@ -0,0 +1,153 @@
+import os
+
+import numpy as np
+
+from impor_malas import impor_malas
+from tabel_peralatan import GOLONGAN, JAM_MULAI_DEFAULT, normalisasi_nama
+
+pd = impor_malas('pandas')  # Baru dimuat saat berkas inventaris dibaca
+
+UKURAN_CHUNK = 50000
+
+KOLOM_WAJIB = ('nama', 'unit', 'watt', 'golongan', 'jam_per_hari')
+KOLOM_OPSIONAL = ('jam_mulai',)
+
+# Nama kolom seperti di tabel halaman Peralatan Elektronik juga diterima
+ALIAS_KOLOM = {
+    'Nama Peralatan': 'nama',
+    'Jumlah Unit': 'unit',
+    'Daya per Unit (Watt)': 'watt',
+    'Golongan Listrik': 'golongan',
+    'Jam Penggunaan per Hari': 'jam_per_hari',
+    'Jam Mulai': 'jam_mulai',
+}
+
+
+def _tebak_format(sumber, format):
+    """Menentukan format file ('csv' atau 'parquet') dari argumen atau ekstensi nama file"""
+    if format:
+        return format.lower()
+    nama = getattr(sumber, 'name', sumber)
+    ekstensi = os.path.splitext(str(nama))[1].lower()
+    if ekstensi in ('.parquet', '.pq'):
+        return 'parquet'
+    return 'csv'
+
+
+def baca_inventaris(sumber, format=None, ukuran_chunk=UKURAN_CHUNK):
+    """Membaca file inventaris peralatan (CSV/Parquet) per chunk DataFrame"""
+    format = _tebak_format(sumber, format)
+    if format == 'csv':
+        yield from pd.read_csv(sumber, chunksize=ukuran_chunk)
+    elif format == 'parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError('Impor Parquet membutuhkan paket pyarrow') from e
+        for batch in pq.ParquetFile(sumber).iter_batches(batch_size=ukuran_chunk):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f'Format file tidak didukung: {format}')
+
+
+def validasi_chunk(df, baris_awal=1, nama_terpakai=None):
+    """Memvalidasi satu chunk secara per kolom.
+
+    Bila nama_terpakai (set nama ternormalisasi) diberikan, baris dengan nama
+    yang sudah ada di dalamnya ditolak sebagai duplikat, dan nama baris yang
+    lolos ditambahkan ke set itu. Mengembalikan dict kolom peralatan yang valid
+    dan DataFrame baris yang ditolak beserta nomor baris dan alasannya.
+    """
+    df = df.rename(columns=ALIAS_KOLOM)
+    hilang = [kolom for kolom in KOLOM_WAJIB if kolom not in df.columns]
+    if hilang:
+        raise ValueError(f'Kolom wajib tidak ditemukan: {", ".join(hilang)}')
+
+    nama = df['nama'].astype('string').str.strip()
+    golongan = df['golongan'].astype('string').str.strip().str.upper()
+    unit = pd.to_numeric(df['unit'], errors='coerce')
+    watt = pd.to_numeric(df['watt'], errors='coerce')
+    jam = pd.to_numeric(df['jam_per_hari'], errors='coerce')
+    if 'jam_mulai' in df.columns:
+        jam_mulai = pd.to_numeric(df['jam_mulai'], errors='coerce').fillna(JAM_MULAI_DEFAULT)
+    else:
+        jam_mulai = pd.Series(JAM_MULAI_DEFAULT, index=df.index)
+
+    kondisi = [
+        (nama.isna() | (nama == '')).to_numpy(dtype=bool, na_value=True),
+        (unit.isna() | (unit < 1) | (unit % 1 != 0)).to_numpy(dtype=bool, na_value=True),
+        (watt.isna() | (watt <= 0)).to_numpy(dtype=bool, na_value=True),
+        (jam.isna() | (jam < 0) | (jam > 24)).to_numpy(dtype=bool, na_value=True),
+        (~golongan.isin(GOLONGAN)).to_numpy(dtype=bool, na_value=True),
+        ((jam_mulai < 0) | (jam_mulai >= 24)).to_numpy(dtype=bool, na_value=True),
+    ]
+    pesan = [
+        'nama kosong',
+        'unit harus bilangan bulat >= 1',
+        'watt harus lebih dari 0',
+        'jam_per_hari harus antara 0 dan 24',
+        f'golongan harus salah satu dari {", ".join(GOLONGAN)}',
+        'jam_mulai harus antara 0 dan kurang dari 24',
+    ]
+    alasan = np.select(kondisi, pesan, default='').astype(object)
+    if nama_terpakai is not None:
+        # Duplikat diperiksa per baris yang lolos, dalam urutan file
+        nama_array = nama.to_numpy(dtype=object)
+        for i in np.flatnonzero(alasan == '').tolist():
+            kunci = normalisasi_nama(nama_array[i])
+            if kunci in nama_terpakai:
+                alasan[i] = 'nama sudah dipakai peralatan lain'
+            else:
+                nama_terpakai.add(kunci)
+    valid = alasan == ''
+
+    kolom_valid = {
+        'nama': nama.to_numpy(dtype=object)[valid],
+        'unit': unit.to_numpy(dtype=np.float64, na_value=np.nan)[valid].astype(np.int64),
+        'watt': watt.to_numpy(dtype=np.float64, na_value=np.nan)[valid],
+        'golongan': golongan.to_numpy(dtype=object)[valid],
+        'jam_per_hari': jam.to_numpy(dtype=np.float64, na_value=np.nan)[valid],
+        'jam_mulai': jam_mulai.to_numpy(dtype=np.float64, na_value=np.nan)[valid],
+    }
+    ditolak = df.loc[~valid, list(KOLOM_WAJIB)].copy()
+    ditolak.insert(0, 'baris', np.flatnonzero(~valid) + baris_awal)
+    ditolak['alasan'] = alasan[~valid]
+    return kolom_valid, ditolak
+
+
+def impor_peralatan(monitor, sumber, format=None, ukuran_chunk=UKURAN_CHUNK, tolak_duplikat=False):
+    """Mengimpor inventaris peralatan dari CSV/Parquet ke monitor dalam satu batch.
+
+    File dibaca dan divalidasi per chunk, lalu seluruh baris valid ditambahkan
+    dengan satu panggilan monitor.tambah_peralatan_banyak(). Dengan
+    tolak_duplikat=True, nama yang sudah dipakai peralatan monitor atau baris
+    sebelumnya di file (setelah normalisasi) ikut ditolak. Mengembalikan
+    jumlah peralatan yang diimpor dan DataFrame baris yang ditolak.
+    """
+    bagian = {kolom: [] for kolom in (*KOLOM_WAJIB, *KOLOM_OPSIONAL)}
+    semua_ditolak = []
+    nama_terpakai = {normalisasi_nama(nama) for nama in monitor.peralatan.nama.tolist()} if tolak_duplikat else None
+    baris_awal = 1
+    for chunk in baca_inventaris(sumber, format, ukuran_chunk):
+        kolom_valid, ditolak = validasi_chunk(chunk, baris_awal, nama_terpakai)
+        for kolom, nilai in kolom_valid.items():
+            bagian[kolom].append(nilai)
+        if len(ditolak):
+            semua_ditolak.append(ditolak)
+        baris_awal += len(chunk)
+
+    if bagian['nama']:
+        kolom = {nama: np.concatenate(nilai) for nama, nilai in bagian.items()}
+        monitor.tambah_peralatan_banyak(
+            kolom['nama'], kolom['unit'], kolom['watt'], kolom['golongan'], kolom['jam_per_hari'],
+            kolom['jam_mulai']
+        )
+        jumlah_diimpor = len(kolom['nama'])
+    else:
+        jumlah_diimpor = 0
+
+    ditolak = (
+        pd.concat(semua_ditolak, ignore_index=True) if semua_ditolak
+        else pd.DataFrame(columns=['baris', *KOLOM_WAJIB, 'alasan'])
+    )
+    return {'jumlah_diimpor': jumlah_diimpor, 'ditolak': ditolak}
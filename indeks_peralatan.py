@@ -0,0 +1,102 @@
+import numpy as np
+
+from tabel_peralatan import KODE_GOLONGAN
+
+UKURAN_HALAMAN = 50
+
+# Kolom yang dapat dipakai untuk mengurutkan: nama -> kunci urut dari tabel peralatan
+KOLOM_URUT = {
+    'indeks': lambda tabel: tabel.id,  # Urutan penambahan (id naik, tetap benar setelah swap-remove)
+    'nama': lambda tabel: np.strings.lower(tabel.nama.astype(str)),
+    'golongan': lambda tabel: tabel.kode_golongan,
+    'unit': lambda tabel: tabel.unit,
+    'watt': lambda tabel: tabel.watt,
+    'total_watt': lambda tabel: tabel.total_watt(),
+    'jam_per_hari': lambda tabel: tabel.jam_per_hari,
+    'jam_mulai': lambda tabel: tabel.jam_mulai,
+}
+
+
+class IndeksPeralatan:
+    """Indeks urut untuk menyaring, mengurutkan dan memotong tabel peralatan per halaman di sisi server.
+
+    Urutan (argsort stabil) setiap kolom dibuat sekali saat pertama dipakai
+    bersama kuncinya yang sudah terurut, dan berlaku sampai tabel berubah
+    (monitor menyimpannya per versi peralatan). Saringan awalan nama dan
+    rentang watt memakai pencarian biner pada urutan nama/watt; tanpa
+    saringan, satu halaman hanya O(ukuran halaman).
+    """
+
+    def __init__(self, tabel):
+        """Indeks kosong atas tabel peralatan; urutan dibuat saat dibutuhkan"""
+        self._tabel = tabel
+        self._urutan = {}
+        self._kunci_urut = {}
+
+    def urutan(self, kolom):
+        """Indeks baris terurut naik menurut kolom (stabil: baris dengan kunci sama tetap berurutan)"""
+        if kolom not in KOLOM_URUT:
+            raise ValueError(f'Kolom urut tidak dikenal: {kolom}')
+        if kolom not in self._urutan:
+            kunci = KOLOM_URUT[kolom](self._tabel)
+            urutan = np.argsort(kunci, kind='stable')
+            self._urutan[kolom] = urutan
+            self._kunci_urut[kolom] = kunci[urutan]
+        return self._urutan[kolom]
+
+    def _posisi(self, kolom, bawah=None, atas=None, atas_inklusif=True):
+        """Rentang posisi [awal, akhir) pada urutan kolom untuk kunci antara bawah dan atas"""
+        self.urutan(kolom)
+        kunci = self._kunci_urut[kolom]
+        awal = 0 if bawah is None else int(np.searchsorted(kunci, bawah, 'left'))
+        sisi_atas = 'right' if atas_inklusif else 'left'
+        akhir = len(kunci) if atas is None else int(np.searchsorted(kunci, atas, sisi_atas))
+        return awal, max(akhir, awal)
+
+    def rentang_watt(self):
+        """(minimum, maksimum) daya per unit, atau (0.0, 0.0) untuk tabel kosong"""
+        self.urutan('watt')
+        kunci = self._kunci_urut['watt']
+        if not len(kunci):
+            return 0.0, 0.0
+        return float(kunci[0]), float(kunci[-1])
+
+    def saring(self, golongan=None, watt_min=None, watt_maks=None, awalan_nama=None):
+        """Mask boolean baris yang lolos semua saringan, atau None bila tidak ada saringan"""
+        mask = None
+
+        def dari_posisi(kolom, awal, akhir):
+            hasil = np.zeros(len(self._tabel), dtype=bool)
+            hasil[self._urutan[kolom][awal:akhir]] = True
+            return hasil
+
+        if awalan_nama:
+            awalan = awalan_nama.lower()
+            # Semua nama berawalan 'ab' ada di antara 'ab' (inklusif) dan 'ac' (eksklusif)
+            batas_atas = awalan[:-1] + chr(ord(awalan[-1]) + 1)
+            mask = dari_posisi('nama', *self._posisi('nama', awalan, batas_atas, atas_inklusif=False))
+        if watt_min is not None or watt_maks is not None:
+            dalam_rentang = dari_posisi('watt', *self._posisi('watt', watt_min, watt_maks))
+            mask = dalam_rentang if mask is None else mask & dalam_rentang
+        if golongan is not None:
+            kode = [KODE_GOLONGAN[nama_golongan] for nama_golongan in golongan]
+            golongan_cocok = np.isin(self._tabel.kode_golongan, kode)
+            mask = golongan_cocok if mask is None else mask & golongan_cocok
+        return mask
+
+    def cocok(self, urut='indeks', menurun=False, **saringan):
+        """Indeks semua baris yang lolos saringan dalam urutan kolom urut (tanpa saringan: view urutan)"""
+        urutan = self.urutan(urut)
+        mask = self.saring(**saringan)
+        if mask is not None:
+            urutan = urutan[mask[urutan]]
+        return urutan[::-1] if menurun else urutan
+
+    def kueri(self, urut='indeks', menurun=False, halaman=0, ukuran_halaman=UKURAN_HALAMAN, **saringan):
+        """Indeks baris pada satu halaman (mulai 0) hasil saring dan urut, beserta jumlah baris yang cocok"""
+        urutan = self.cocok(urut, menurun, **saringan)
+        awal = halaman * ukuran_halaman
+        return urutan[awal:awal + ukuran_halaman], len(urutan)
+
+    def __len__(self):
+        return len(self._tabel)
@@ -0,0 +1,159 @@
+import numpy as np
+
+
+class IndeksRentang:
+    """Indeks kueri rentang O(1) atas deret harian: prefix sum dan sparse table minimum/maksimum.
+
+    Hari dipetakan ke posisi padat mulai hari_awal; hari tanpa data bernilai
+    NaN (tidak ikut jumlah, hitungan, minimum maupun maksimum). Perubahan
+    nilai pada posisi p hanya menghitung ulang akhiran array mulai p, sehingga
+    menambah hari baru atau memperbarui hari terakhir cukup O(log n).
+    Array tumbuh dua kali lipat saat penuh.
+    """
+
+    def __init__(self, kapasitas=64):
+        """Inisialisasi indeks kosong"""
+        self.hari_awal = None
+        self._n = 0
+        self._alokasi(kapasitas)
+
+    def _alokasi(self, kapasitas):
+        """Mengalokasikan array berkapasitas tertentu dan menyalin isi lama"""
+        level = max(kapasitas.bit_length(), 1)
+        nilai = np.full(kapasitas, np.nan)
+        kumulatif = np.zeros(kapasitas + 1)
+        hitung = np.zeros(kapasitas + 1, dtype=np.int64)
+        minimum = np.full((level, kapasitas), np.nan)
+        maksimum = np.full((level, kapasitas), np.nan)
+        if self._n:
+            n = self._n
+            nilai[:n] = self._nilai[:n]
+            kumulatif[:n + 1] = self._kumulatif[:n + 1]
+            hitung[:n + 1] = self._hitung[:n + 1]
+            minimum[:len(self._min), :n] = self._min[:, :n]
+            maksimum[:len(self._maks), :n] = self._maks[:, :n]
+        self._nilai, self._kumulatif, self._hitung = nilai, kumulatif, hitung
+        self._min, self._maks = minimum, maksimum
+
+    def salin(self):
+        """Membuat salinan indeks yang dapat diubah"""
+        salinan = IndeksRentang.__new__(IndeksRentang)
+        salinan.hari_awal = self.hari_awal
+        salinan._n = self._n
+        for atribut in ('_nilai', '_kumulatif', '_hitung', '_min', '_maks'):
+            setattr(salinan, atribut, getattr(self, atribut).copy())
+        return salinan
+
+    def bekukan(self):
+        """Menjadikan array indeks hanya-baca"""
+        for atribut in ('_nilai', '_kumulatif', '_hitung', '_min', '_maks'):
+            getattr(self, atribut).flags.writeable = False
+
+    def __len__(self):
+        """Jumlah hari (posisi) yang dicakup indeks"""
+        return self._n
+
+    def atur(self, hari, nilai):
+        """Menetapkan total kWh untuk hari-hari tertentu lalu memperbarui akhiran indeks"""
+        hari = np.atleast_1d(np.asarray(hari, dtype=np.int64))
+        nilai = np.atleast_1d(np.asarray(nilai, dtype=np.float64))
+        if not len(hari):
+            return
+        if self.hari_awal is None:
+            self.hari_awal = int(hari.min())
+        elif hari.min() < self.hari_awal:
+            # Hari sebelum awal indeks: bangun ulang dengan awal baru
+            lama = np.arange(self.hari_awal, self.hari_awal + self._n)
+            nilai_lama = self._nilai[:self._n]
+            ada = ~np.isnan(nilai_lama)
+            self.hari_awal, self._n = int(hari.min()), 0
+            self._alokasi(len(self._nilai))
+            self.atur(np.concatenate([lama[ada], hari]), np.concatenate([nilai_lama[ada], nilai]))
+            return
+
+        posisi = hari - self.hari_awal
+        n_lama = self._n
+        n = max(n_lama, int(posisi.max()) + 1)
+        if n > len(self._nilai):
+            kapasitas = len(self._nilai)
+            while kapasitas < n:
+                kapasitas *= 2
+            self._alokasi(kapasitas)
+        self._nilai[posisi] = nilai
+        self._n = n
+        # Hari kosong di antara akhir lama dan hari baru juga perlu prefix sum
+        self._hitung_ulang_akhiran(min(int(posisi.min()), n_lama))
+
+    def _hitung_ulang_akhiran(self, p):
+        """Menghitung ulang prefix sum dan sparse table untuk semua entri yang mencakup posisi >= p"""
+        n = self._n
+        bagian = self._nilai[p:n]
+        ada = ~np.isnan(bagian)
+        self._kumulatif[p + 1:n + 1] = self._kumulatif[p] + np.cumsum(np.where(ada, bagian, 0.0))
+        self._hitung[p + 1:n + 1] = self._hitung[p] + np.cumsum(ada)
+
+        self._min[0, p:n] = bagian
+        self._maks[0, p:n] = bagian
+        for j in range(1, n.bit_length()):
+            lebar = 1 << j
+            awal = max(p - lebar + 1, 0)
+            akhir = n - lebar + 1  # Entri level j valid untuk posisi < akhir
+            if akhir <= awal:
+                break
+            setengah = lebar >> 1
+            self._min[j, awal:akhir] = np.fmin(self._min[j - 1, awal:akhir], self._min[j - 1, awal + setengah:akhir + setengah])
+            self._maks[j, awal:akhir] = np.fmax(self._maks[j - 1, awal:akhir], self._maks[j - 1, awal + setengah:akhir + setengah])
+
+    def kueri(self, hari_awal, hari_akhir):
+        """Jumlah, rata-rata, minimum, maksimum dan jumlah hari berdata pada rentang hari (inklusif), O(1).
+
+        Argumen boleh berupa array untuk menjawab banyak rentang sekaligus.
+        Rentang dipotong ke cakupan indeks; rentang kosong menghasilkan jumlah 0
+        dan rata-rata/minimum/maksimum NaN.
+        """
+        if np.ndim(hari_awal) == 0 and np.ndim(hari_akhir) == 0:
+            return self._kueri_satu(int(hari_awal), int(hari_akhir))
+        if self.hari_awal is None:
+            kosong = np.full(np.broadcast(hari_awal, hari_akhir).shape, np.nan)
+            return {'jumlah': np.zeros_like(kosong), 'rata_rata': kosong, 'minimum': kosong,
+                    'maksimum': kosong, 'jumlah_hari': np.zeros(kosong.shape, dtype=np.int64)}
+        i = np.clip(np.asarray(hari_awal, dtype=np.int64) - self.hari_awal, 0, self._n)
+        j = np.clip(np.asarray(hari_akhir, dtype=np.int64) - self.hari_awal + 1, 0, self._n)  # eksklusif
+        j = np.maximum(i, j)
+        jumlah = self._kumulatif[j] - self._kumulatif[i]
+        hitung = self._hitung[j] - self._hitung[i]
+        panjang = j - i
+        level = np.where(panjang > 0, np.log2(np.maximum(panjang, 1)).astype(np.int64), 0)
+        kanan = np.maximum(j - (1 << level), i)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rata_rata = np.where(hitung > 0, jumlah / hitung, np.nan)
+        kosong = hitung == 0
+        kiri = np.minimum(i, max(self._n - 1, 0))
+        kanan = np.minimum(kanan, max(self._n - 1, 0))
+        return {
+            'jumlah': jumlah,
+            'rata_rata': rata_rata,
+            'minimum': np.where(kosong, np.nan, np.fmin(self._min[level, kiri], self._min[level, kanan])),
+            'maksimum': np.where(kosong, np.nan, np.fmax(self._maks[level, kiri], self._maks[level, kanan])),
+            'jumlah_hari': hitung,
+        }
+
+    def _kueri_satu(self, hari_awal, hari_akhir):
+        """Versi skalar kueri() untuk satu rentang, tanpa overhead array"""
+        i = j = 0
+        if self.hari_awal is not None:
+            i = min(max(hari_awal - self.hari_awal, 0), self._n)
+            j = max(min(max(hari_akhir - self.hari_awal + 1, 0), self._n), i)
+        hitung = int(self._hitung[j] - self._hitung[i]) if j > i else 0
+        if not hitung:
+            return {'jumlah': 0.0, 'rata_rata': np.nan, 'minimum': np.nan, 'maksimum': np.nan, 'jumlah_hari': 0}
+        jumlah = float(self._kumulatif[j] - self._kumulatif[i])
+        level = (j - i).bit_length() - 1
+        kanan = j - (1 << level)
+        return {
+            'jumlah': jumlah,
+            'rata_rata': jumlah / hitung,
+            'minimum': float(np.fmin(self._min[level, i], self._min[level, kanan])),
+            'maksimum': float(np.fmax(self._maks[level, i], self._maks[level, kanan])),
+            'jumlah_hari': hitung,
+        }
@@ -0,0 +1,178 @@
+import contextvars
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# Opt-in: tanpa MONITOR_LISTRIK_PROFIL=1 tidak ada fungsi yang dibungkus, jadi tanpa biaya tambahan
+AKTIF = os.environ.get('MONITOR_LISTRIK_PROFIL') == '1'
+PATH_JSONL = os.environ.get('MONITOR_LISTRIK_PROFIL_JSONL')  # Bila diisi, setiap rerun ditambahkan ke file ini
+JUMLAH_RERUN = 20  # Rerun terakhir yang disimpan per sesi
+
+# Tahap menurut awalan nama rentang; sisanya masuk 'lainnya'. Rentang app.* membungkus tahap main():
+# waktu sendirinya adalah kode halaman/sidebar di luar fungsi-fungsi yang dibungkus.
+TAHAP = (
+    ('MonitorListrik.', 'monitor'),
+    ('buat_df_', 'dataframe'),
+    ('px.', 'grafik'),
+    ('st.', 'render'),
+    ('app.halaman', 'halaman'),
+    ('app.simpan_monitor', 'simpan'),
+    ('app.sidebar', 'sidebar'),
+)
+
+_perekam = contextvars.ContextVar('perekam_rerun', default=None)
+
+
+def tahap(nama):
+    """Tahap (monitor, dataframe, grafik, render, halaman, simpan, sidebar, lainnya) dari nama rentang"""
+    for awalan, nama_tahap in TAHAP:
+        if nama.startswith(awalan):
+            return nama_tahap
+    return 'lainnya'
+
+
+class PerekamRerun:
+    """Mencatat rentang waktu bersarang selama satu rerun halaman"""
+
+    def __init__(self, halaman=None):
+        self.halaman = halaman
+        self.waktu = time.time()
+        self._mulai = time.perf_counter()
+        self._kedalaman = 0
+        self.rentang = []  # dict nama, kedalaman, mulai_ms, durasi_ms, dalam urutan mulai
+        self.total_ms = None
+
+    @contextmanager
+    def catat(self, nama):
+        """Mencatat satu rentang bernama; rentang di dalamnya menjadi anaknya"""
+        catatan = {'nama': nama, 'kedalaman': self._kedalaman,
+                   'mulai_ms': (time.perf_counter() - self._mulai) * 1000, 'durasi_ms': None}
+        self.rentang.append(catatan)
+        self._kedalaman += 1
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            catatan['durasi_ms'] = (time.perf_counter() - mulai) * 1000
+            self._kedalaman -= 1
+
+    def selesai(self, halaman=None):
+        """Menutup rerun dan mengembalikan ringkasannya sebagai dict siap JSON"""
+        self.total_ms = (time.perf_counter() - self._mulai) * 1000
+        if halaman is not None:
+            self.halaman = halaman
+        return self.ringkasan()
+
+    def waktu_sendiri(self):
+        """Durasi setiap rentang dikurangi durasi anak langsungnya (ms)"""
+        sendiri = [catatan['durasi_ms'] or 0.0 for catatan in self.rentang]
+        tumpukan = []  # Indeks leluhur yang masih terbuka
+        for i, catatan in enumerate(self.rentang):
+            del tumpukan[catatan['kedalaman']:]
+            if tumpukan:
+                sendiri[tumpukan[-1]] -= catatan['durasi_ms'] or 0.0
+            tumpukan.append(i)
+        return sendiri
+
+    def ringkasan(self):
+        """Rerun sebagai dict: waktu, halaman, total dan per tahap (waktu sendiri, ms), serta semua rentang"""
+        per_tahap = {nama_tahap: 0.0 for _, nama_tahap in TAHAP}
+        for catatan, sendiri in zip(self.rentang, self.waktu_sendiri()):
+            nama_tahap = tahap(catatan['nama'])
+            per_tahap[nama_tahap] = per_tahap.get(nama_tahap, 0.0) + sendiri
+        total = self.total_ms if self.total_ms is not None else (time.perf_counter() - self._mulai) * 1000
+        per_tahap['lainnya'] = per_tahap.get('lainnya', 0.0) + total - sum(
+            catatan['durasi_ms'] or 0.0 for catatan in self.rentang if catatan['kedalaman'] == 0
+        )
+        return {
+            'waktu': self.waktu,
+            'halaman': self.halaman,
+            'total_ms': total,
+            'tahap_ms': per_tahap,
+            'rentang': [dict(catatan) for catatan in self.rentang],
+        }
+
+
+def mulai_rerun(halaman=None):
+    """Memasang perekam baru untuk rerun pada konteks ini dan mengembalikannya"""
+    perekam = PerekamRerun(halaman)
+    _perekam.set(perekam)
+    return perekam
+
+
+def selesai_rerun(perekam, halaman=None):
+    """Menutup perekam, melepasnya dari konteks, dan menulis ke PATH_JSONL bila diatur"""
+    ringkasan = perekam.selesai(halaman)
+    _perekam.set(None)
+    if PATH_JSONL:
+        tulis_jsonl([ringkasan], PATH_JSONL)
+    return ringkasan
+
+
+@contextmanager
+def rentang(nama):
+    """Rentang waktu bernama pada rerun yang sedang direkam (tanpa efek bila tidak ada perekam)"""
+    perekam = _perekam.get()
+    if perekam is None:
+        yield
+        return
+    with perekam.catat(nama):
+        yield
+
+
+def terukur(nama, fungsi):
+    """Membungkus fungsi agar setiap panggilannya tercatat sebagai rentang bernama"""
+    @functools.wraps(fungsi)
+    def pembungkus(*args, **kwargs):
+        perekam = _perekam.get()
+        if perekam is None:
+            return fungsi(*args, **kwargs)
+        with perekam.catat(nama):
+            return fungsi(*args, **kwargs)
+    pembungkus.__terukur__ = True
+    return pembungkus
+
+
+def bungkus_atribut(objek, daftar_nama, awalan):
+    """Mengganti atribut-atribut callable objek (kelas/modul) dengan versi terukur, sekali saja"""
+    for nama in daftar_nama:
+        fungsi = getattr(objek, nama, None)
+        if callable(fungsi) and not getattr(fungsi, '__terukur__', False):
+            setattr(objek, nama, terukur(f'{awalan}{nama}', fungsi))
+
+
+def ke_jsonl(daftar_ringkasan):
+    """Mengubah ringkasan rerun menjadi teks JSON lines (satu rerun per baris)"""
+    return ''.join(json.dumps(ringkasan, ensure_ascii=False) + '\n' for ringkasan in daftar_ringkasan)
+
+
+def tulis_jsonl(daftar_ringkasan, path):
+    """Menambahkan ringkasan rerun ke file JSON lines"""
+    with open(path, 'a', encoding='utf-8') as berkas:
+        berkas.write(ke_jsonl(daftar_ringkasan))
+
+
+def pasang(*modul_tambahan):
+    """Membungkus metode publik MonitorListrik, pembuat DataFrame, fungsi px dan render st yang dipakai halaman.
+
+    Fungsi yang dibungkus hanya mencatat bila ada perekam rerun pada
+    konteks (thread) pemanggil. Halaman dieksekusi ulang setiap rerun
+    sehingga mengimpor versi terukur; modul yang sudah mengimpor buat_df_*
+    lebih dulu (mis. app) diberikan lewat modul_tambahan.
+    """
+    import plotly.express as px
+    import streamlit as st
+
+    import monitor_listrik
+
+    kelas = monitor_listrik.MonitorListrik
+    bungkus_atribut(
+        kelas, [nama for nama, nilai in vars(kelas).items() if callable(nilai) and not nama.startswith('_')],
+        'MonitorListrik.'
+    )
+    for modul in (monitor_listrik, *modul_tambahan):
+        bungkus_atribut(modul, [nama for nama in vars(modul) if nama.startswith('buat_df_')], '')
+    bungkus_atribut(px, ('bar', 'pie', 'line', 'scatter'), 'px.')
+    bungkus_atribut(st, ('plotly_chart', 'dataframe', 'data_editor'), 'st.')
@@ -0,0 +1,190 @@
+"""Laporan batch tanpa Streamlit: tabel Dashboard, Penggunaan, Estimasi Biaya dan Saran dari berkas peralatan.
+
+Contoh: python laporan.py rumah_a.csv rumah_b.csv --penggunaan meter_a.csv meter_b.csv --format parquet --workers 4
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from deret_waktu import OFFSET_WIB
+from ekspor import FORMAT_EKSPOR, tulis_ekspor
+from impor_peralatan import baca_inventaris, impor_peralatan
+from monitor_listrik import (
+    MonitorListrik, buat_df_biaya_golongan, buat_df_konsumsi, buat_df_penggunaan_harian, buat_df_siklus_tagihan
+)
+
+FORMAT_KELUARAN = ('csv', 'parquet', 'json')
+
+# Tabel per peralatan yang ditulis per chunk lewat ekspor: nama berkas -> tabel ekspor
+TABEL_PER_PERALATAN = {
+    'penggunaan_peralatan': 'penggunaan',
+    'biaya_peralatan': 'biaya',
+    'saran_rencana': 'saran',
+}
+
+# Kolom berkas penggunaan: waktu bacaan (atau tanggal untuk total harian) dan kWh
+ALIAS_KOLOM_PENGGUNAAN = {
+    'tanggal': 'waktu',
+    'Tanggal': 'waktu',
+    'Waktu': 'waktu',
+    'penggunaan': 'kwh',
+    'Penggunaan (kWh)': 'kwh',
+    'kWh': 'kwh',
+}
+
+
+def baca_penggunaan(sumber, format=None):
+    """Membaca berkas penggunaan (CSV/Parquet) menjadi (waktu epoch detik, kWh).
+
+    Waktu tanpa zona waktu dianggap waktu lokal WIB, sehingga baris berisi
+    tanggal saja masuk sebagai total harian tanggal tersebut.
+    """
+    bagian_waktu, bagian_kwh = [], []
+    for chunk in baca_inventaris(sumber, format):
+        chunk = chunk.rename(columns=ALIAS_KOLOM_PENGGUNAAN)
+        hilang = [kolom for kolom in ('waktu', 'kwh') if kolom not in chunk.columns]
+        if hilang:
+            raise ValueError(f'Kolom penggunaan tidak ditemukan: {", ".join(hilang)}')
+        waktu = pd.to_datetime(chunk['waktu'])
+        if waktu.dt.tz is None:
+            epoch = waktu.to_numpy(dtype='datetime64[s]').astype(np.int64) - OFFSET_WIB
+        else:
+            epoch = waktu.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy(dtype='datetime64[s]').astype(np.int64)
+        bagian_waktu.append(epoch)
+        bagian_kwh.append(pd.to_numeric(chunk['kwh'], errors='raise').to_numpy(dtype=np.float64))
+    if not bagian_waktu:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    return np.concatenate(bagian_waktu), np.concatenate(bagian_kwh)
+
+
+def muat_monitor_berkas(peralatan, penggunaan=None):
+    """Membuat monitor dari berkas peralatan dan (opsional) berkas penggunaan, mengembalikan (monitor, ditolak)"""
+    monitor = MonitorListrik()
+    hasil_impor = impor_peralatan(monitor, peralatan)
+    if penggunaan is not None:
+        monitor.tambah_bacaan_meter(*baca_penggunaan(penggunaan))
+    return monitor, hasil_impor['ditolak']
+
+
+def buat_ringkasan(monitor):
+    """DataFrame satu baris berisi angka-angka utama Dashboard, Estimasi Biaya dan Saran"""
+    kwh_hemat, biaya_hemat = monitor.hitung_potensi_penghematan()
+    ringkasan = {
+        'Jumlah Peralatan': len(monitor.peralatan),
+        'Total Daya (Watt)': monitor.hitung_total_daya(),
+        'Total Penggunaan (kWh/bulan)': monitor.hitung_total_penggunaan(),
+        'Rata-rata Penggunaan per Hari (kWh)': monitor.hitung_rata_rata_harian(),
+        'Estimasi Biaya (Rp/bulan)': monitor.hitung_estimasi_biaya(),
+        'Potensi Penghematan (kWh)': kwh_hemat,
+        'Potensi Penghematan (Rp)': biaya_hemat,
+    }
+    prakiraan = None if monitor.penggunaan_sampel else monitor.hitung_prakiraan_bulanan()
+    if prakiraan is not None:
+        ringkasan['Proyeksi Akhir Bulan (kWh)'] = prakiraan['kwh']
+        ringkasan['Proyeksi Biaya Akhir Bulan (Rp)'] = prakiraan['biaya']
+    return pd.DataFrame([ringkasan])
+
+
+def buat_laporan(monitor, tanggal_tagihan=1):
+    """Tabel ringkasan laporan sebagai dict nama -> DataFrame (tabel per peralatan ditulis terpisah per chunk).
+
+    Tabel penggunaan aktual (harian dan per siklus tagihan) hanya dibuat bila
+    monitor berisi data penggunaan sungguhan, bukan data sampel.
+    """
+    laporan = {
+        'ringkasan': buat_ringkasan(monitor),
+        'dashboard_konsumsi': buat_df_konsumsi(monitor),
+        'biaya_golongan': buat_df_biaya_golongan(monitor),
+    }
+    hari_awal, hari_akhir = monitor.penggunaan.rentang_hari()
+    if not monitor.penggunaan_sampel and hari_awal is not None:
+        laporan['dashboard_penggunaan_harian'] = buat_df_penggunaan_harian(monitor)
+        laporan['penggunaan_siklus_tagihan'] = buat_df_siklus_tagihan(
+            monitor.hitung_penggunaan_siklus(hari_awal, hari_akhir, tanggal_tagihan)
+        )
+    return laporan
+
+
+def tulis_tabel(df, path, format='csv'):
+    """Menulis satu DataFrame ke path (tanpa ekstensi) dalam format csv, parquet atau json"""
+    path = f'{path}.{format}'
+    if format == 'csv':
+        df.to_csv(path, index=False)
+    elif format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError('Keluaran Parquet membutuhkan paket pyarrow') from e
+        df.to_parquet(path, index=False)
+    elif format == 'json':
+        df.to_json(path, orient='records', date_format='iso', force_ascii=False, indent=2)
+    else:
+        raise ValueError(f'Format keluaran tidak didukung: {format}')
+    return path
+
+
+def proses_berkas(peralatan, penggunaan=None, folder_keluaran='laporan', format='csv', tanggal_tagihan=1):
+    """Membuat dan menulis laporan satu rumah tangga ke subfolder bernama sesuai berkas peralatan"""
+    monitor, ditolak = muat_monitor_berkas(peralatan, penggunaan)
+    nama = os.path.splitext(os.path.basename(str(peralatan)))[0]
+    folder = os.path.join(folder_keluaran, nama)
+    os.makedirs(folder, exist_ok=True)
+    laporan = buat_laporan(monitor, tanggal_tagihan)
+    if len(ditolak):
+        laporan['peralatan_ditolak'] = ditolak
+    berkas = [tulis_tabel(df, os.path.join(folder, judul), format) for judul, df in laporan.items()]
+    for judul, tabel in TABEL_PER_PERALATAN.items():
+        path = os.path.join(folder, judul) + FORMAT_EKSPOR[format][0]
+        tulis_ekspor(monitor, tabel, path, format)
+        berkas.append(path)
+    return {'peralatan': str(peralatan), 'jumlah_peralatan': len(monitor.peralatan),
+            'jumlah_ditolak': len(ditolak), 'berkas': berkas}
+
+
+def _proses_tugas(tugas):
+    """Pembungkus proses_berkas untuk process pool (satu tuple argumen)"""
+    return proses_berkas(*tugas)
+
+
+def proses_paralel(daftar_peralatan, daftar_penggunaan=None, folder_keluaran='laporan', format='csv',
+                   tanggal_tagihan=1, workers=None):
+    """Memproses banyak berkas di process pool, hasil dialirkan per berkas sesuai urutan masukan"""
+    daftar_penggunaan = daftar_penggunaan or [None] * len(daftar_peralatan)
+    if len(daftar_penggunaan) != len(daftar_peralatan):
+        raise ValueError('Jumlah berkas penggunaan harus sama dengan jumlah berkas peralatan')
+    tugas = [
+        (peralatan, penggunaan, folder_keluaran, format, tanggal_tagihan)
+        for peralatan, penggunaan in zip(daftar_peralatan, daftar_penggunaan)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(tugas)) or 1
+    if workers == 1:
+        yield from map(_proses_tugas, tugas)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_proses_tugas, tugas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('peralatan', nargs='+', help='berkas inventaris peralatan (CSV/Parquet), satu per rumah tangga')
+    parser.add_argument('--penggunaan', nargs='*', default=None,
+                        help='berkas penggunaan (kolom waktu/tanggal dan kwh), berurutan sesuai berkas peralatan')
+    parser.add_argument('--keluaran', default='laporan', help='folder keluaran (default: laporan)')
+    parser.add_argument('--format', choices=FORMAT_KELUARAN, default='csv')
+    parser.add_argument('--tanggal-tagihan', type=int, default=1, help='tanggal awal siklus tagihan (1-28)')
+    parser.add_argument('--workers', type=int, default=None, help='jumlah proses (default: jumlah core)')
+    args = parser.parse_args(argv)
+
+    hasil = proses_paralel(
+        args.peralatan, args.penggunaan, args.keluaran, args.format, args.tanggal_tagihan, args.workers
+    )
+    for ringkasan in hasil:
+        print(f'{ringkasan["peralatan"]}: {ringkasan["jumlah_peralatan"]} peralatan, '
+              f'{ringkasan["jumlah_ditolak"]} ditolak, {len(ringkasan["berkas"])} berkas')
+
+
+if __name__ == '__main__':
+    main()
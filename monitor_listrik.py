@@ -0,0 +1,710 @@
+import time
+from types import MappingProxyType
+
+import numpy as np
+
+from anomali import PemantauAnomali
+from cache_lru import CacheLRU
+from deret_waktu import DETIK_PER_HARI, OFFSET_WIB, DeretWaktu, daftar_siklus_tagihan, ke_epoch_detik, siklus_tagihan
+from impor_malas import impor_malas
+from indeks_peralatan import IndeksPeralatan
+from penyederhanaan import LEBAR_GRAFIK_PX
+from perencana import batas_jam_default, rencanakan_jam
+from prakiraan import Z_INTERVAL, HoltWinters
+from profil_beban import hitung_beban_golongan, hitung_profil_beban
+from skenario import sapu_skenario
+from tarif import DefinisiTarif
+from tabel_peralatan import GOLONGAN, HARI_PER_BULAN, JAM_MULAI_DEFAULT, TabelPeralatan, normalisasi_nama
+
+pd = impor_malas('pandas')  # Hanya dimuat saat DataFrame tampilan dibuat
+
+# Tarif listrik default per golongan (Rp/kWh)
+TARIF_DEFAULT = {
+    'R-1': 1500,  # Tarif untuk golongan R-1 (per kWh)
+    'R-2': 2000,  # Tarif untuk golongan R-2 (per kWh)
+    'R-3': 2500,  # Tarif untuk golongan R-3 (per kWh)
+}
+
+# Katalog peralatan default untuk rumah tangga baru
+PERALATAN_DEFAULT = (
+    # nama, unit, watt, golongan, jam per hari, jam mulai
+    ('Kulkas', 1, 800, 'R-1', 24, 0),
+    ('AC', 1, 2000, 'R-1', 8, 22),
+    ('Mesin Cuci', 1, 1500, 'R-1', 2, 8),
+    ('Lampu LED', 5, 20, 'R-1', 12, 18),
+    ('Kipas Angin', 2, 75, 'R-1', 8, 12),
+    ('Setrika', 1, 2000, 'R-1', 1, 19),
+    ('TV LED', 1, 200, 'R-1', 6, 17),
+    ('Rice Cooker', 1, 1000, 'R-1', 2, 16),
+    ('Laptop', 1, 300, 'R-1', 8, 9),
+    ('Microwave', 1, 1200, 'R-1', 0.5, 18.5),
+    ('Pemanas Air', 1, 3000, 'R-1', 1, 5),
+    ('Blender', 1, 700, 'R-1', 0.5, 6),
+    ('Hair Dryer', 1, 1800, 'R-1', 0.5, 6.5),
+    ('Kamera Pengawas', 2, 15, 'R-1', 24, 0),
+    ('PC', 1, 200, 'R-1', 6, 19),
+)
+
+# Irisan grafik pie per peralatan: peralatan terbesar, sisanya digabung ke 'Lainnya'
+TOP_K_GRAFIK = 15
+LABEL_LAINNYA = 'Lainnya'
+
+
+# kelas monitor listrik
+class MonitorListrik:
+    def __init__(self):
+        """Inisialisasi kelas monitoring listrik"""
+        self.peralatan = TabelPeralatan()
+        self.penggunaan = DeretWaktu()
+        self.penggunaan_sampel = False  # True selama penggunaan masih berupa data sampel
+        self.tarif_listrik = dict(TARIF_DEFAULT)
+        self.tarif_lanjutan = {}  # Golongan -> DefinisiTarif; golongan lain memakai tarif flat
+        self.tarif_terpilih = 'R-1'  # Golongan default untuk peralatan baru
+        self.prakiraan = HoltWinters()  # Diperbarui bertahap dari hari-hari penggunaan yang sudah lengkap
+        self.anomali = PemantauAnomali()  # Detektor anomali harian & per jam, juga bertahap
+        self.versi = 0  # Naik setiap kali peralatan atau penggunaan harian berubah
+        self.versi_peralatan = 0  # Naik hanya bila peralatan (termasuk jadwalnya) berubah
+        self.cache = CacheLRU(kapasitas=32)
+        self._berbagi = False  # True bila data masih milik snapshot bersama
+        # Perubahan sejak disimpan/dimuat terakhir ke suatu penyimpanan (lihat tandai_tersimpan);
+        # None berarti belum pernah, sehingga penyimpanan berikutnya menulis seluruh isi monitor
+        self.jurnal = None
+
+    # Snapshot bersama & copy-on-write
+    def bekukan(self):
+        """Menjadikan monitor hanya-baca agar aman dibagi antar sesi"""
+        self.peralatan.bekukan()
+        self.penggunaan.bekukan()
+        self.tarif_listrik = MappingProxyType(dict(self.tarif_listrik))
+        self.tarif_lanjutan = MappingProxyType(dict(self.tarif_lanjutan))
+
+    def salinan_berbagi(self):
+        """Membuat monitor baru yang berbagi data dengan monitor ini sampai perubahan pertama (copy-on-write)"""
+        salinan = MonitorListrik.__new__(MonitorListrik)
+        salinan.peralatan = self.peralatan
+        salinan.penggunaan = self.penggunaan
+        salinan.penggunaan_sampel = self.penggunaan_sampel
+        salinan.tarif_listrik = self.tarif_listrik
+        salinan.tarif_lanjutan = self.tarif_lanjutan
+        salinan.tarif_terpilih = self.tarif_terpilih
+        salinan.prakiraan = self.prakiraan.salin()
+        salinan.anomali = self.anomali.salin()
+        salinan.versi = self.versi
+        salinan.versi_peralatan = self.versi_peralatan
+        salinan.cache = CacheLRU(kapasitas=self.cache.kapasitas)
+        salinan._berbagi = True
+        salinan.jurnal = None
+        return salinan
+
+    def _pastikan_milik_sendiri(self):
+        """Menyalin data bersama tepat sebelum perubahan pertama"""
+        if self._berbagi:
+            self.peralatan = self.peralatan.salin()
+            self.penggunaan = self.penggunaan.salin()
+            self.tarif_listrik = dict(self.tarif_listrik)
+            self.tarif_lanjutan = dict(self.tarif_lanjutan)
+            self._berbagi = False
+
+    # Jurnal perubahan untuk penyimpanan inkremental
+    def tandai_tersimpan(self, tujuan):
+        """Memulai jurnal kosong: isi monitor sama dengan yang tersimpan di tujuan (mis. (path, rumah tangga))"""
+        self.jurnal = {
+            'tujuan': tujuan, 'peralatan': set(), 'peralatan_baru': set(), 'hari': set(), 'penggunaan_penuh': False
+        }
+
+    def _catat_perubahan(self, id_peralatan=(), hari=(), penggunaan_penuh=False, baru=False):
+        """Mencatat id peralatan (ditambah/diubah/dihapus) dan id hari yang berubah sejak tersimpan.
+
+        baru=True menandai id peralatan yang belum pernah tersimpan di tujuan,
+        sehingga penyimpanan menyisipkannya alih-alih memperbarui baris lama.
+        """
+        jurnal = self.jurnal
+        if jurnal is None:
+            return
+        jurnal['peralatan'].update(id_peralatan)
+        if baru:
+            jurnal['peralatan_baru'].update(id_peralatan)
+        if penggunaan_penuh:
+            jurnal['penggunaan_penuh'] = True
+            jurnal['hari'].clear()
+        elif not jurnal['penggunaan_penuh']:
+            jurnal['hari'].update(hari)
+
+    # 1.Peralatan Elektronik
+    def tambah_peralatan(self, nama, unit, watt, golongan, jam_per_hari, jam_mulai=JAM_MULAI_DEFAULT,
+                         tolak_duplikat=False):
+        """Menambahkan peralatan elektronik dan golongan listrik, mengembalikan id peralatan baru.
+
+        Dengan tolak_duplikat=True, nama yang sudah dipakai peralatan lain
+        (setelah normalisasi spasi dan huruf besar/kecil) ditolak dengan ValueError.
+        """
+        if tolak_duplikat and self.peralatan.id_dengan_nama(nama):
+            raise ValueError(f'Peralatan {nama} sudah ada')
+        self._pastikan_milik_sendiri()
+        i = self.peralatan.tambah(nama, unit, watt, golongan, jam_per_hari, jam_mulai)
+        id_baru = int(self.peralatan.id[i])
+        self._catat_perubahan(id_peralatan=(id_baru,), baru=True)
+        self.update_penggunaan_harian_dengan_peralatan_baru()
+        self.versi += 1
+        self.versi_peralatan += 1
+        return id_baru
+
+    def tambah_peralatan_banyak(self, nama, unit, watt, golongan, jam_per_hari, jam_mulai=None, tolak_duplikat=False):
+        """Menambahkan banyak peralatan sekaligus dari kolom-kolom yang sama panjang, dalam satu batch.
+
+        Dengan tolak_duplikat=True, seluruh batch ditolak (ValueError) bila ada nama
+        yang sudah dipakai peralatan lain atau muncul dua kali di batch.
+        """
+        if tolak_duplikat:
+            dilihat = set()
+            for nama_baru in np.asarray(nama, dtype=object).tolist():
+                kunci = normalisasi_nama(nama_baru)
+                if kunci in dilihat or self.peralatan.id_dengan_nama(nama_baru):
+                    raise ValueError(f'Peralatan {nama_baru} sudah ada')
+                dilihat.add(kunci)
+        self._pastikan_milik_sendiri()
+        indeks = self.peralatan.tambah_banyak(nama, unit, watt, golongan, jam_per_hari, jam_mulai)
+        if len(indeks):
+            if self.jurnal is not None:
+                self._catat_perubahan(id_peralatan=self.peralatan.id[indeks].tolist(), baru=True)
+            self.update_penggunaan_harian_dengan_peralatan_baru()
+            self.versi += 1
+            self.versi_peralatan += 1
+        return indeks
+
+    def ubah_peralatan(self, id_peralatan, **perubahan):
+        """Mengubah data peralatan ber-id tertentu dalam O(1); KeyError bila id tidak ada"""
+        self.peralatan.baris_id(id_peralatan)
+        self._pastikan_milik_sendiri()
+        self.peralatan.ubah_id(id_peralatan, **perubahan)
+        self._catat_perubahan(id_peralatan=(id_peralatan,))
+        self.versi += 1
+        self.versi_peralatan += 1
+
+    def hapus_peralatan(self, id_peralatan):
+        """Menghapus peralatan ber-id tertentu dalam O(1) (urutan baris lain bisa berubah); KeyError bila id tidak ada"""
+        self.peralatan.baris_id(id_peralatan)
+        self._pastikan_milik_sendiri()
+        self.peralatan.hapus_id(id_peralatan)
+        self._catat_perubahan(id_peralatan=(id_peralatan,))
+        self.versi += 1
+        self.versi_peralatan += 1
+
+    def cari_peralatan(self, nama):
+        """Id peralatan yang namanya sama dengan nama (setelah normalisasi), untuk deteksi duplikat"""
+        return self.peralatan.id_dengan_nama(nama)
+
+    def indeks_peralatan(self):
+        """Indeks saring/urut tabel peralatan untuk tampilan per halaman, dibuat ulang hanya bila peralatan berubah"""
+        return self.cache.ambil(
+            ('indeks_peralatan', self.versi_peralatan), lambda: IndeksPeralatan(self.peralatan),
+            versi=('versi_peralatan', self.versi_peralatan)
+        )
+
+    def hitung_total_daya(self):
+        """Menghitung total daya seluruh peralatan (Watt)"""
+        return self.peralatan.total_watt_semua
+
+    def update_penggunaan_harian_dengan_peralatan_baru(self):
+        """Mengupdate penggunaan harian (sampel) dengan peralatan baru"""
+        hari_terakhir = self.penggunaan.hari_terakhir()
+        if hari_terakhir is None:
+            self.generate_sample_data()
+        elif self.penggunaan_sampel:
+            # Hari sampel berikutnya, tetapi tidak pernah melewati hari ini
+            hari = min(hari_terakhir + 1, self.penggunaan.hari_ini())
+            new_usage = np.random.uniform(1, 5)
+            self.penggunaan.tambah_harian(hari, new_usage)
+            self._catat_perubahan(hari=(hari,))
+
+    @property
+    def penggunaan_harian(self):
+        """Penggunaan harian sebagai daftar dict {'hari', 'penggunaan'} (hari = id hari)"""
+        hari, penggunaan = self.penggunaan.harian()
+        return [{'hari': h, 'penggunaan': p} for h, p in zip(hari.tolist(), penggunaan.tolist())]
+
+    def tambah_bacaan_meter(self, waktu, kwh):
+        """Menambahkan bacaan smart meter (waktu dan kWh per bacaan, skalar atau array).
+
+        Bacaan meter pertama menggantikan data penggunaan sampel.
+        """
+        self._pastikan_milik_sendiri()
+        if self.penggunaan_sampel:
+            self.penggunaan = DeretWaktu()
+            self.prakiraan = HoltWinters()
+            self.anomali = PemantauAnomali()
+            self.penggunaan_sampel = False
+            self._catat_perubahan(penggunaan_penuh=True)
+        waktu = ke_epoch_detik(waktu)
+        self.penggunaan.tambah_bacaan_banyak(waktu, kwh)
+        if self.jurnal is not None:
+            self._catat_perubahan(hari=np.unique(self.penggunaan.per_hari.ember(waktu)).tolist())
+        self.versi += 1
+
+    def set_tarif_listrik(self, golongan):
+        """Set golongan listrik yang dipilih"""
+        if golongan not in self.tarif_listrik:
+            raise ValueError(f'Golongan listrik tidak dikenal: {golongan}')
+        self.tarif_terpilih = golongan
+
+    def ubah_tarif_listrik(self, golongan, tarif):
+        """Mengubah tarif (Rp/kWh) sebuah golongan di tabel tarif"""
+        if golongan not in self.tarif_listrik:
+            raise ValueError(f'Golongan listrik tidak dikenal: {golongan}')
+        self._pastikan_milik_sendiri()
+        self.tarif_listrik[golongan] = tarif
+
+    def atur_definisi_tarif(self, golongan, definisi):
+        """Memasang tarif lanjutan (blok, waktu pakai, minimum, pajak) untuk golongan; None kembali ke tarif flat"""
+        if golongan not in self.tarif_listrik:
+            raise ValueError(f'Golongan listrik tidak dikenal: {golongan}')
+        self._pastikan_milik_sendiri()
+        if definisi is None:
+            self.tarif_lanjutan.pop(golongan, None)
+        else:
+            self.tarif_lanjutan[golongan] = definisi
+
+    def definisi_tarif(self, golongan):
+        """Definisi tarif yang berlaku untuk golongan"""
+        definisi = self.tarif_lanjutan.get(golongan)
+        if definisi is None:
+            definisi = DefinisiTarif.flat(golongan, self.tarif_listrik[golongan])
+        return definisi
+
+    def kunci_tarif(self):
+        """Kunci yang berubah setiap kali tabel tarif, tarif lanjutan atau golongan terpilih berubah"""
+        return (
+            self.tarif_terpilih,
+            tuple(self.tarif_listrik.items()),
+            tuple(sorted((golongan, definisi.kunci()) for golongan, definisi in self.tarif_lanjutan.items())),
+        )
+
+    def ambil_turunan(self, halaman, pembuat):
+        """Mengambil tabel/grafik turunan dari cache, pembuat() hanya dipanggil bila versi atau tarif berubah.
+
+        Turunan versi lama dibuang begitu versi berubah.
+        """
+        return self.cache.ambil((halaman, self.versi, self.kunci_tarif()), pembuat, versi=('versi', self.versi))
+
+    def tarif_per_golongan(self):
+        """Tarif (Rp/kWh) dalam urutan kode golongan"""
+        return np.array([self.tarif_listrik[golongan] for golongan in GOLONGAN], dtype=np.float64)
+
+    # 2.Penggunaan Listrik
+    def hitung_total_penggunaan(self):
+        """Menghitung total penggunaan listrik dalam kWh per bulan"""
+        return self.peralatan.total_kwh
+
+    def hitung_rata_rata_harian(self):
+        """Menghitung rata-rata penggunaan listrik per hari dalam kWh"""
+        return self.peralatan.total_kwh / HARI_PER_BULAN
+
+    def hitung_penggunaan_rentang(self, hari_awal, hari_akhir):
+        """Jumlah, rata-rata, minimum dan maksimum penggunaan harian aktual pada rentang hari (inklusif), O(1)"""
+        return self.penggunaan.statistik_rentang(hari_awal, hari_akhir)
+
+    def hitung_penggunaan_siklus(self, hari_awal, hari_akhir, tanggal_tagihan=1):
+        """Penggunaan aktual per siklus tagihan kalender yang beririsan dengan rentang hari.
+
+        Setiap siklus dipotong ke rentang lalu dijawab dengan satu kueri indeks
+        rentang; estimasi peralatan memakai jumlah hari kalender siklus,
+        bukan bulan 30 hari.
+        """
+        awal, akhir = daftar_siklus_tagihan(hari_awal, hari_akhir, tanggal_tagihan)
+        statistik = self.penggunaan.statistik_rentang(np.maximum(awal, hari_awal), np.minimum(akhir - 1, hari_akhir))
+        return {
+            'hari_awal': awal,
+            'hari_akhir': akhir - 1,
+            'panjang_siklus': akhir - awal,
+            **statistik,
+            'estimasi_kwh': (akhir - awal) * self.hitung_rata_rata_harian(),
+        }
+
+    # 3.Estimasi Biaya
+    def rincian_biaya_golongan(self, kwh_golongan):
+        """Rincian tagihan per golongan untuk vektor kWh per golongan (golongan tanpa konsumsi tidak ditagih).
+
+        Golongan bertarif waktu pakai dihargai per jam: kWh golongan dibagi ke
+        24 jam sehari mengikuti bentuk beban jadwal peralatannya (lihat
+        beban_per_jam_golongan), lalu setiap jam dihargai dengan jendela atau blok.
+        """
+        kolom = ('energi', 'penyesuaian_minimum', 'abonemen', 'pajak', 'total')
+        rincian = {nama: np.zeros(len(GOLONGAN)) for nama in kolom}
+        beban_jam = self.beban_jam_tarif()
+        for kode, (definisi, kwh) in enumerate(zip(self.daftar_definisi_tarif(), kwh_golongan)):
+            if kwh > 0:
+                hasil = definisi.rincian_bentuk_jam(kwh, None if beban_jam is None else beban_jam[kode])
+                for nama, nilai in hasil.items():
+                    rincian[nama][kode] = nilai
+        return rincian
+
+    def beban_jam_tarif(self):
+        """Bentuk beban per jam golongan (golongan x 24) untuk tarif waktu pakai, None bila tidak ada yang memakainya.
+
+        Semua tagihan (estimasi, skenario, perencana) memakai bentuk yang sama
+        sehingga hasilnya konsisten; tanpa jendela waktu pakai profil beban
+        tidak perlu dihitung.
+        """
+        if any(definisi.waktu_pakai for definisi in self.daftar_definisi_tarif()):
+            return self.beban_per_jam_golongan()
+        return None
+
+    def hitung_biaya_golongan(self, kwh_golongan):
+        """Tagihan per golongan untuk vektor kWh per golongan"""
+        return self.rincian_biaya_golongan(kwh_golongan)['total']
+
+    def hitung_estimasi_biaya(self):
+        """Menghitung estimasi biaya listrik dari kWh per golongan dengan tarif golongannya"""
+        return float(self.hitung_biaya_golongan(self.peralatan.kwh_golongan).sum())
+
+    def hitung_biaya_per_golongan(self):
+        """Menghitung kWh dan rincian biaya listrik per bulan untuk setiap golongan"""
+        kwh = self.peralatan.kwh_golongan
+        rincian = self.rincian_biaya_golongan(kwh)
+        return {
+            'golongan': list(GOLONGAN),
+            'kwh': kwh.copy(),
+            'biaya': rincian['total'],
+            'rincian': rincian,
+        }
+
+    def tarif_efektif_per_golongan(self):
+        """Tarif rata-rata (Rp/kWh) per golongan: tagihan golongan dibagi kWh-nya"""
+        kwh = self.peralatan.kwh_golongan
+        biaya = self.hitung_biaya_golongan(kwh)
+        return np.divide(biaya, kwh, out=self.tarif_per_golongan(), where=kwh > 0)
+
+    def hitung_biaya_per_peralatan(self, peralatan=None):
+        """Menghitung biaya listrik per peralatan, dibagi sebanding kWh-nya dari tagihan golongannya.
+
+        peralatan boleh berupa potongan tabel (mis. satu chunk ekspor); tarif
+        efektif tetap dihitung dari seluruh peralatan.
+        """
+        peralatan = self.peralatan if peralatan is None else peralatan
+        return peralatan.kwh_per_bulan() * self.tarif_efektif_per_golongan()[peralatan.kode_golongan]
+
+    # 4.Saran Penggunaan
+    def hitung_total_penggunaan_saran(self):
+        """Menghitung total penggunaan listrik per bulan bila mengikuti saran (kWh)"""
+        return self.peralatan.total_kwh_saran
+
+    def hitung_potensi_penghematan(self):
+        """Menghitung potensi penghematan per bulan dalam kWh dan Rupiah"""
+        kwh = self.peralatan.kwh_golongan
+        kwh_saran = self.peralatan.kwh_saran_golongan
+        penghematan_biaya = self.hitung_biaya_golongan(kwh).sum() - self.hitung_biaya_golongan(kwh_saran).sum()
+        return float((kwh - kwh_saran).sum()), float(penghematan_biaya)
+
+    def daftar_definisi_tarif(self):
+        """Definisi tarif yang berlaku dalam urutan kode golongan"""
+        return [self.definisi_tarif(golongan) for golongan in GOLONGAN]
+
+    def rencanakan_penggunaan(self, target_kwh=None, anggaran=None, jam_min=None, jam_maks=None, prioritas=None):
+        """Menyusun jam penggunaan per peralatan yang memenuhi target kWh atau anggaran Rupiah per bulan.
+
+        Tanpa target, dipakai kWh dari aturan saran (batas jam) sebagai target,
+        sehingga penghematannya sama tetapi kehilangan kenyamanannya terkecil.
+        """
+        peralatan = self.peralatan
+        min_default, maks_default = batas_jam_default(peralatan.nama, peralatan.jam_per_hari)
+        if anggaran is None and target_kwh is None:
+            target_kwh = self.hitung_total_penggunaan_saran()
+        return rencanakan_jam(
+            peralatan.kwh_per_jam(), peralatan.kode_golongan, peralatan.jam_per_hari,
+            target_kwh if anggaran is None else anggaran,
+            jam_min=min_default if jam_min is None else jam_min,
+            jam_maks=maks_default if jam_maks is None else jam_maks,
+            prioritas=prioritas,
+            daftar_definisi=None if anggaran is None else self.daftar_definisi_tarif(),
+            beban_jam=None if anggaran is None else self.beban_jam_tarif(),
+        )
+
+    def sapu_skenario(self, golongan=(None,), perubahan_jam=None, penggantian_watt=None, prioritas=None):
+        """Menghitung semua kombinasi skenario golongan, selisih jam dan penggantian watt dengan tarif saat ini"""
+        return sapu_skenario(
+            self.peralatan, self.daftar_definisi_tarif(), golongan=golongan, perubahan_jam=perubahan_jam,
+            penggantian_watt=penggantian_watt, prioritas=prioritas, beban_jam=self.beban_jam_tarif()
+        )
+
+    # Prakiraan akhir bulan
+    def _perbarui_prakiraan(self, hari_ini):
+        """Memasukkan hari-hari lengkap (sebelum hari_ini) yang belum dilihat model, masing-masing O(1)"""
+        hari, kwh = self.penggunaan.harian()
+        if self.prakiraan.hari_terakhir is not None:
+            baru = hari > self.prakiraan.hari_terakhir
+            hari, kwh = hari[baru], kwh[baru]
+        lengkap = hari < hari_ini
+        for h, nilai in zip(hari[lengkap].tolist(), kwh[lengkap].tolist()):
+            self.prakiraan.perbarui(h, nilai)
+
+    def hitung_prakiraan_bulanan(self, hari_ini=None):
+        """Proyeksi kWh dan biaya sampai akhir bulan tagihan berjalan beserta interval 95%.
+
+        Penggunaan aktual hari-hari lengkap bulan ini ditambah ramalan
+        Holt-Winters untuk sisa bulan. Biaya dihitung dengan membagi kWh ke
+        golongan sebanding kWh peralatan per golongan. Mengembalikan None
+        bila data harian belum cukup (kurang dari satu minggu).
+        """
+        hari_ini = self.penggunaan.hari_ini() if hari_ini is None else hari_ini
+        self._perbarui_prakiraan(hari_ini)
+        model = self.prakiraan
+        if not model.siap:
+            return None
+        awal, akhir = siklus_tagihan(hari_ini)
+        kwh_aktual = self.penggunaan.statistik_rentang(awal, model.hari_terakhir)['jumlah']
+        langkah_awal = max(awal - model.hari_terakhir, 1)
+        kwh_ramalan, simpangan = model.ramal_jumlah(langkah_awal, akhir - 1 - model.hari_terakhir)
+        kwh_total = kwh_aktual + kwh_ramalan
+        kwh_bawah = max(kwh_total - Z_INTERVAL * simpangan, kwh_aktual)
+        kwh_atas = kwh_total + Z_INTERVAL * simpangan
+
+        total_golongan = self.peralatan.kwh_golongan.sum()
+        if total_golongan > 0:
+            bagian = self.peralatan.kwh_golongan / total_golongan
+        else:
+            bagian = (np.array(GOLONGAN) == self.tarif_terpilih).astype(np.float64)
+        biaya = [float(self.hitung_biaya_golongan(nilai * bagian).sum()) for nilai in (kwh_total, kwh_bawah, kwh_atas)]
+        return {
+            'hari_awal': awal,
+            'hari_akhir': akhir - 1,
+            'kwh_aktual': kwh_aktual,
+            'kwh': kwh_total,
+            'kwh_bawah': kwh_bawah,
+            'kwh_atas': kwh_atas,
+            'biaya': biaya[0],
+            'biaya_bawah': biaya[1],
+            'biaya_atas': biaya[2],
+        }
+
+    # Deteksi anomali
+    def periksa_anomali(self, waktu_sekarang=None):
+        """Menilai ember harian/per jam yang baru lengkap dan mengembalikan peringatan terbaru lebih dulu"""
+        waktu_sekarang = int(time.time()) if waktu_sekarang is None else waktu_sekarang
+        self.anomali.perbarui(self.penggunaan, waktu_sekarang)
+        return list(reversed(self.anomali.peringatan))
+
+    # Profil beban harian
+    def beban_golongan(self):
+        """Beban per golongan per menit (golongan x 1440), di-cache per versi peralatan.
+
+        Pembacaan meter dan perubahan tarif tidak mengubah jadwal, jadi tidak
+        membuat beban ini dihitung ulang.
+        """
+        return self.cache.ambil(
+            ('beban-golongan', self.versi_peralatan), lambda: hitung_beban_golongan(self.peralatan),
+            versi=('versi_peralatan', self.versi_peralatan)
+        )
+
+    def hitung_profil_beban(self, daya_kontrak_va=None):
+        """Menghitung beban puncak, kurva durasi beban dan menit beban lebih terhadap daya kontrak golongan"""
+        return hitung_profil_beban(self.peralatan, self.beban_golongan(), daya_kontrak_va)
+
+    def beban_per_jam_golongan(self):
+        """kWh per jam dalam sehari (golongan x 24 jam) menurut jadwal peralatan, dari beban per menit"""
+        return self.beban_golongan().reshape(len(GOLONGAN), 24, 60).sum(axis=2) / 60
+
+    def verifikasi_agregat(self):
+        """Memeriksa agregat berjalan terhadap hitung ulang penuh atas seluruh peralatan"""
+        return self.peralatan.verifikasi_agregat()
+
+    def generate_sample_data(self, hari=30):
+        """Menghasilkan data penggunaan listrik sampel"""
+        self._pastikan_milik_sendiri()
+        np.random.seed(42)
+        penggunaan = np.random.uniform(5, 15, hari)
+        self.penggunaan = DeretWaktu()
+        self.prakiraan = HoltWinters()
+        self.anomali = PemantauAnomali()
+        hari_ini = self.penggunaan.hari_ini()
+        self.penggunaan.tambah_harian(np.arange(hari_ini - hari + 1, hari_ini + 1), penggunaan)
+        self.penggunaan_sampel = True
+        self._catat_perubahan(penggunaan_penuh=True)
+        self.versi += 1
+
+    def konsumsi_energi_per_peralatan(self):
+        """Menghitung konsumsi energi per peralatan"""
+        return {
+            'peralatan': self.peralatan.nama,
+            'konsumsi': self.peralatan.kwh_per_bulan(),
+        }
+
+
+def buat_monitor_default():
+    """Membuat monitor baru berisi katalog peralatan default"""
+    monitor = MonitorListrik()
+    for nama, unit, watt, golongan, jam, jam_mulai in PERALATAN_DEFAULT:
+        monitor.tambah_peralatan(nama, unit, watt, golongan, jam, jam_mulai)
+    return monitor
+
+
+# Pembuat DataFrame untuk setiap halaman
+def buat_df_penggunaan_harian(monitor):
+    """DataFrame penggunaan listrik harian (Dashboard) langsung dari rollup hari"""
+    hari, penggunaan = monitor.penggunaan.harian()
+    awal = hari[0] if len(hari) else 0
+    return pd.DataFrame({
+        'hari': hari - awal + 1,
+        'tanggal': hari.astype('datetime64[D]'),  # id hari = tanggal lokal sejak epoch
+        'penggunaan': penggunaan,
+    })
+
+
+def buat_df_grafik_penggunaan(monitor, hari_awal=None, hari_akhir=None, jumlah_titik=LEBAR_GRAFIK_PX):
+    """DataFrame penggunaan untuk grafik garis: resolusi mengikuti rentang, disederhanakan ke lebar grafik"""
+    waktu, penggunaan, resolusi = monitor.penggunaan.kueri(hari_awal, hari_akhir, jumlah_titik)
+    df = pd.DataFrame({
+        'waktu': (waktu + monitor.penggunaan.offset).astype('datetime64[s]'),  # waktu lokal
+        'penggunaan': penggunaan,
+    })
+    return df, resolusi
+
+
+def buat_df_siklus_tagihan(siklus):
+    """DataFrame penggunaan aktual per siklus tagihan (Penggunaan Listrik)"""
+    return pd.DataFrame({
+        'Awal Siklus': siklus['hari_awal'].astype('datetime64[D]'),
+        'Akhir Siklus': siklus['hari_akhir'].astype('datetime64[D]'),
+        'Hari Kalender': siklus['panjang_siklus'],
+        'Hari Berdata': siklus['jumlah_hari'],
+        'Penggunaan Aktual (kWh)': siklus['jumlah'],
+        'Rata-rata per Hari (kWh)': siklus['rata_rata'],
+        'Minimum Harian (kWh)': siklus['minimum'],
+        'Maksimum Harian (kWh)': siklus['maksimum'],
+        'Estimasi Peralatan (kWh)': siklus['estimasi_kwh'],
+    })
+
+
+def _top_k_lainnya(nama, nilai, k):
+    """k nama dengan nilai terbesar (urut menurun) ditambah satu ember 'Lainnya' berisi jumlah sisanya"""
+    if k is None or len(nilai) <= k:
+        return nama, nilai
+    teratas = np.argpartition(nilai, -k)[-k:]
+    teratas = teratas[np.argsort(nilai[teratas], kind='stable')[::-1]]
+    sisa = nilai.sum() - nilai[teratas].sum()
+    return np.append(nama[teratas], LABEL_LAINNYA), np.append(nilai[teratas], sisa)
+
+
+def buat_df_konsumsi(monitor, k=None):
+    """DataFrame konsumsi energi per peralatan (Dashboard); dengan k, hanya k terbesar ditambah 'Lainnya'"""
+    konsumsi = monitor.konsumsi_energi_per_peralatan()
+    peralatan, konsumsi = _top_k_lainnya(konsumsi['peralatan'], konsumsi['konsumsi'], k)
+    return pd.DataFrame({'peralatan': peralatan, 'konsumsi': konsumsi})
+
+
+def buat_df_distribusi_daya(monitor, k=TOP_K_GRAFIK):
+    """DataFrame total daya k peralatan terbesar ditambah 'Lainnya' untuk grafik pie Peralatan Elektronik"""
+    nama, total_watt = _top_k_lainnya(monitor.peralatan.nama, monitor.peralatan.total_watt(), k)
+    return pd.DataFrame({'Nama Peralatan': nama, 'Total Daya (Watt)': total_watt})
+
+
+def _peralatan_potong(monitor, potong):
+    """Seluruh tabel peralatan monitor, view baris potong (slice) untuk ekspor per chunk, atau baris-baris indeks"""
+    if potong is None:
+        return monitor.peralatan
+    if isinstance(potong, slice):
+        return monitor.peralatan.potongan(potong.start, potong.stop)
+    return monitor.peralatan.pilih(potong)
+
+
+def buat_df_peralatan(monitor, potong=None):
+    """DataFrame daftar peralatan elektronik"""
+    peralatan = _peralatan_potong(monitor, potong)
+    return pd.DataFrame({
+        'Nama Peralatan': peralatan.nama,
+        'Golongan Listrik': peralatan.golongan,
+        'Jumlah Unit': peralatan.unit,
+        'Daya per Unit (Watt)': peralatan.watt,
+        'Total Daya (Watt)': peralatan.total_watt(),
+        'Jam Penggunaan per Hari': peralatan.jam_per_hari,
+        'Jam Mulai': peralatan.jam_mulai
+    })
+
+
+def buat_df_penggunaan(monitor, potong=None):
+    """DataFrame rincian penggunaan listrik per peralatan"""
+    peralatan = _peralatan_potong(monitor, potong)
+    return pd.DataFrame({
+        'Nama Peralatan': peralatan.nama,
+        'Jam Penggunaan per Hari': peralatan.jam_per_hari,
+        'Listrik per Jam (kWh)': peralatan.kwh_per_jam(),
+        'Listrik selama Sebulan (kWh)': peralatan.kwh_per_bulan(),
+    })
+
+
+def buat_df_biaya(monitor, potong=None):
+    """DataFrame rincian biaya listrik per peralatan"""
+    peralatan = _peralatan_potong(monitor, potong)
+    return pd.DataFrame({
+        'Nama Peralatan': peralatan.nama,
+        'Listrik Sebulan (kWh)': peralatan.kwh_per_bulan(),
+        'Biaya Listrik (Rp)': monitor.hitung_biaya_per_peralatan(peralatan)
+    })
+
+
+def buat_df_biaya_golongan(monitor):
+    """DataFrame kWh dan biaya listrik per golongan"""
+    biaya_golongan = monitor.hitung_biaya_per_golongan()
+    rincian = biaya_golongan['rincian']
+    return pd.DataFrame({
+        'Golongan Listrik': biaya_golongan['golongan'],
+        'Listrik Sebulan (kWh)': biaya_golongan['kwh'],
+        'Biaya Energi (Rp)': rincian['energi'],
+        'Penyesuaian Minimum (Rp)': rincian['penyesuaian_minimum'],
+        'Abonemen (Rp)': rincian['abonemen'],
+        'Pajak (Rp)': rincian['pajak'],
+        'Biaya Listrik (Rp)': biaya_golongan['biaya']
+    })
+
+
+def buat_df_rencana(monitor, rencana, potong=None):
+    """DataFrame jam dan kWh per peralatan sebelum dan sesudah rencana penghematan"""
+    peralatan = _peralatan_potong(monitor, potong)
+    potong = slice(None) if potong is None else potong
+    return pd.DataFrame({
+        'Nama Peralatan': peralatan.nama,
+        'Penggunaan Saat Ini (Jam)': peralatan.jam_per_hari,
+        'Rencana Penggunaan (Jam)': rencana['jam_rencana'][potong],
+        'Listrik Saat Ini (kWh)': peralatan.kwh_per_bulan(),
+        'Listrik Sesuai Rencana (kWh)': rencana['kwh_rencana'][potong],
+        'Kehilangan Kenyamanan': rencana['kehilangan_kenyamanan'][potong],
+    })
+
+
+def buat_df_skenario(monitor, hasil):
+    """DataFrame skenario terurut dari biaya termurah (lalu kehilangan kenyamanan terkecil)"""
+    biaya_sekarang = monitor.hitung_estimasi_biaya()
+    kolom = {
+        label[0].upper() + label[1:]: np.where(pd.isna(pilihan), 'Tetap', pilihan) if label == 'golongan' else pilihan
+        for label, pilihan in hasil['dimensi'].items()
+    }
+    df = pd.DataFrame({
+        **kolom,
+        'Listrik Sebulan (kWh)': hasil['total_kwh'],
+        'Biaya Listrik (Rp)': hasil['biaya'],
+        'Penghematan (Rp)': biaya_sekarang - hasil['biaya'],
+        'Kehilangan Kenyamanan': hasil['kehilangan_kenyamanan'],
+        'Pareto': hasil['pareto'],
+    })
+    return df.sort_values(['Biaya Listrik (Rp)', 'Kehilangan Kenyamanan'], kind='stable', ignore_index=True)
+
+
+def buat_df_profil_beban(monitor, profil):
+    """DataFrame beban per menit (kW) per golongan yang memiliki peralatan, untuk kurva beban harian"""
+    menit = np.arange(profil['beban'].shape[0])
+    ada = np.bincount(monitor.peralatan.kode_golongan, minlength=len(GOLONGAN)) > 0
+    return pd.DataFrame({
+        'waktu': pd.to_datetime(menit, unit='m').strftime('%H:%M'),
+        **{golongan: profil['beban_golongan'][kode] for kode, golongan in enumerate(GOLONGAN) if ada[kode]},
+    })
+
+
+def buat_df_anomali(peringatan):
+    """DataFrame peringatan anomali penggunaan (terbaru lebih dulu)"""
+    waktu = np.array([p['waktu'] for p in peringatan], dtype=np.int64)
+    return pd.DataFrame({
+        'Waktu (WIB)': pd.to_datetime(waktu + OFFSET_WIB, unit='s'),
+        'Resolusi': ['Harian' if p['resolusi'] == DETIK_PER_HARI else 'Per Jam' for p in peringatan],
+        'Penggunaan (kWh)': [p['kwh'] for p in peringatan],
+        'Rata-rata Normal (kWh)': [p['rata_rata'] for p in peringatan],
+        'Skor Z': [p['skor'] for p in peringatan],
+    })
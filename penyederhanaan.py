@@ -0,0 +1,41 @@
+import numpy as np
+
+# Perkiraan lebar area plot grafik garis Streamlit (piksel); satu titik per piksel sudah cukup
+LEBAR_GRAFIK_PX = 1200
+
+
+def lttb(x, y, jumlah_titik=LEBAR_GRAFIK_PX):
+    """Menyederhanakan deret (x, y) menjadi jumlah_titik titik dengan Largest-Triangle-Three-Buckets.
+
+    Titik pertama dan terakhir selalu dipertahankan; dari setiap ember di
+    antaranya dipilih titik yang membentuk segitiga terluas dengan titik
+    terpilih sebelumnya dan rata-rata ember berikutnya.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if jumlah_titik >= n or jumlah_titik < 3:
+        return x, y
+
+    xf = x.astype(np.float64)
+    batas = np.linspace(1, n - 1, jumlah_titik - 1).astype(np.int64)
+    awal_ember = batas[:-1]
+    ukuran_ember = np.diff(batas)
+
+    # Rata-rata tiap ember tengah, ditambah titik terakhir sebagai "ember" penutup
+    rata_x = np.append(np.add.reduceat(xf[:n - 1], awal_ember) / ukuran_ember, xf[-1])
+    rata_y = np.append(np.add.reduceat(y[:n - 1], awal_ember) / ukuran_ember, y[-1])
+
+    indeks = np.empty(jumlah_titik, dtype=np.int64)
+    indeks[0], indeks[-1] = 0, n - 1
+    a = 0
+    for i in range(jumlah_titik - 2):
+        awal, akhir = batas[i], batas[i + 1]
+        luas = np.abs(
+            (xf[a] - rata_x[i + 1]) * (y[awal:akhir] - y[a])
+            - (xf[a] - xf[awal:akhir]) * (rata_y[i + 1] - y[a])
+        )
+        a = awal + int(np.argmax(luas))
+        indeks[i + 1] = a
+    return x[indeks], y[indeks]
+
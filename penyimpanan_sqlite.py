@@ -0,0 +1,379 @@
+import json
+import sqlite3
+import threading
+from contextlib import closing
+
+import numpy as np
+
+from monitor_listrik import TARIF_DEFAULT, MonitorListrik
+from profil_beban import hitung_beban_jam_kelompok
+from tabel_peralatan import GOLONGAN, HARI_PER_BULAN, JAM_MULAI_DEFAULT, TabelPeralatan
+from tarif import DefinisiTarif, hitung_tagihan_golongan
+
+UKURAN_BATCH = 10000
+
+SKEMA = """
+CREATE TABLE IF NOT EXISTS rumah_tangga (
+    id TEXT PRIMARY KEY,
+    tarif_terpilih TEXT NOT NULL DEFAULT 'R-1',
+    penggunaan_sampel INTEGER NOT NULL DEFAULT 0  -- 1 selama penggunaan harian masih data sampel
+);
+CREATE TABLE IF NOT EXISTS tarif (
+    rumah_tangga TEXT NOT NULL,
+    golongan TEXT NOT NULL,
+    tarif REAL NOT NULL,
+    PRIMARY KEY (rumah_tangga, golongan)
+);
+CREATE TABLE IF NOT EXISTS tarif_lanjutan (
+    rumah_tangga TEXT NOT NULL,
+    golongan TEXT NOT NULL,
+    definisi TEXT NOT NULL,  -- JSON dari DefinisiTarif.ke_dict()
+    PRIMARY KEY (rumah_tangga, golongan)
+);
+CREATE TABLE IF NOT EXISTS peralatan (
+    id INTEGER PRIMARY KEY,
+    rumah_tangga TEXT NOT NULL,
+    id_peralatan INTEGER,  -- id stabil peralatan di dalam rumah tangganya (TabelPeralatan.id)
+    nama TEXT NOT NULL,
+    unit INTEGER NOT NULL,
+    watt REAL NOT NULL,
+    golongan TEXT NOT NULL,
+    jam_per_hari REAL NOT NULL,
+    jam_mulai REAL NOT NULL DEFAULT %s
+);
+CREATE INDEX IF NOT EXISTS idx_peralatan_rumah_tangga ON peralatan (rumah_tangga, golongan);
+CREATE TABLE IF NOT EXISTS penggunaan_harian (
+    rumah_tangga TEXT NOT NULL,
+    hari INTEGER NOT NULL,  -- id hari (hari sejak epoch, batas tengah malam WIB)
+    penggunaan REAL NOT NULL,
+    PRIMARY KEY (rumah_tangga, hari)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_penggunaan_hari ON penggunaan_harian (hari);
+""" % JAM_MULAI_DEFAULT
+
+_SQL_TAMBAH_PERALATAN = (
+    'INSERT INTO peralatan (rumah_tangga, id_peralatan, nama, unit, watt, golongan, jam_per_hari, jam_mulai) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)'
+)
+# Pembaruan per id peralatan untuk penyimpanan inkremental (peralatan baru selalu lewat INSERT)
+_SQL_UBAH_PERALATAN = (
+    'UPDATE peralatan SET nama = ?, unit = ?, watt = ?, golongan = ?, jam_per_hari = ?, jam_mulai = ? '
+    'WHERE rumah_tangga = ? AND id_peralatan = ?'
+)
+_SQL_SIMPAN_PENGGUNAAN = 'INSERT OR REPLACE INTO penggunaan_harian (rumah_tangga, hari, penggunaan) VALUES (?, ?, ?)'
+
+# Ekspresi kWh per bulan satu baris peralatan, sama dengan TabelPeralatan.kwh_per_bulan()
+_KWH_PER_BULAN = f'watt * unit / 1000.0 * jam_per_hari * {HARI_PER_BULAN}'
+
+
+class PenyimpananSQLite:
+    """Penyimpanan peralatan dan penggunaan harian di file SQLite lokal (mode WAL).
+
+    Satu file dapat menampung banyak rumah tangga. Penulisan dilakukan dalam
+    transaksi berbatch, dan agregat dihitung dengan GROUP BY di SQLite sehingga
+    rumah tangga besar tidak perlu dimuat seluruhnya ke Python.
+    """
+
+    def __init__(self, path='monitor_listrik.db'):
+        """Membuka (atau membuat) file database dan skemanya"""
+        self.path = path
+        self._koneksi = sqlite3.connect(path, check_same_thread=False)
+        self._kunci = threading.Lock()
+        self._koneksi.execute('PRAGMA journal_mode=WAL')
+        self._koneksi.execute('PRAGMA synchronous=NORMAL')
+        self._koneksi.executescript(SKEMA)
+        self._migrasi()
+
+    def _migrasi(self):
+        """Menambahkan kolom yang belum ada pada database dari versi sebelumnya"""
+        kolom = {baris[1] for baris in self._koneksi.execute('PRAGMA table_info(peralatan)')}
+        if 'jam_mulai' not in kolom:
+            with self._koneksi:
+                self._koneksi.execute(
+                    f'ALTER TABLE peralatan ADD COLUMN jam_mulai REAL NOT NULL DEFAULT {JAM_MULAI_DEFAULT}'
+                )
+        if 'id_peralatan' not in kolom:
+            # Peralatan lama mendapat id berurutan per rumah tangga menurut urutan penyimpanannya
+            with self._koneksi:
+                self._koneksi.execute('ALTER TABLE peralatan ADD COLUMN id_peralatan INTEGER')
+                self._koneksi.execute(
+                    'UPDATE peralatan SET id_peralatan = urutan.nomor FROM ('
+                    'SELECT id, ROW_NUMBER() OVER (PARTITION BY rumah_tangga ORDER BY id) - 1 AS nomor FROM peralatan'
+                    ') AS urutan WHERE peralatan.id = urutan.id'
+                )
+        self._koneksi.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS idx_peralatan_id ON peralatan (rumah_tangga, id_peralatan)'
+        )
+        kolom = {baris[1] for baris in self._koneksi.execute('PRAGMA table_info(rumah_tangga)')}
+        if 'penggunaan_sampel' not in kolom:
+            with self._koneksi:
+                self._koneksi.execute(
+                    'ALTER TABLE rumah_tangga ADD COLUMN penggunaan_sampel INTEGER NOT NULL DEFAULT 0'
+                )
+
+    def tutup(self):
+        """Menutup koneksi database"""
+        self._koneksi.close()
+
+    def _tulis_batch(self, sql, baris):
+        """Menjalankan executemany per batch di dalam satu transaksi yang sudah dibuka"""
+        batch = []
+        for item in baris:
+            batch.append(item)
+            if len(batch) >= UKURAN_BATCH:
+                self._koneksi.executemany(sql, batch)
+                batch = []
+        if batch:
+            self._koneksi.executemany(sql, batch)
+
+    def _pastikan_rumah_tangga(self, rumah_tangga, tarif_terpilih='R-1'):
+        self._koneksi.execute(
+            'INSERT OR IGNORE INTO rumah_tangga (id, tarif_terpilih) VALUES (?, ?)',
+            (rumah_tangga, tarif_terpilih)
+        )
+
+    # Penulisan
+    def simpan_peralatan(self, rumah_tangga, nama, unit, watt, golongan, jam_per_hari, jam_mulai=None):
+        """Menambahkan banyak peralatan (dalam bentuk kolom) ke rumah tangga dalam satu transaksi.
+
+        Peralatan baru mendapat id berurutan setelah id terbesar rumah tangga itu.
+        """
+        if jam_mulai is None:
+            jam_mulai = np.full(len(nama), JAM_MULAI_DEFAULT)
+        with self._kunci, self._koneksi:
+            self._pastikan_rumah_tangga(rumah_tangga)
+            id_awal = self._koneksi.execute(
+                'SELECT COALESCE(MAX(id_peralatan) + 1, 0) FROM peralatan WHERE rumah_tangga = ?', (rumah_tangga,)
+            ).fetchone()[0]
+            baris = zip(
+                [rumah_tangga] * len(nama), range(id_awal, id_awal + len(nama)),
+                np.asarray(nama, dtype=object).tolist(),
+                np.asarray(unit).tolist(), np.asarray(watt, dtype=np.float64).tolist(),
+                np.asarray(golongan, dtype=object).tolist(), np.asarray(jam_per_hari, dtype=np.float64).tolist(),
+                np.asarray(jam_mulai, dtype=np.float64).tolist()
+            )
+            self._tulis_batch(_SQL_TAMBAH_PERALATAN, baris)
+
+    def simpan_penggunaan_harian(self, rumah_tangga, hari, penggunaan):
+        """Menyimpan (menimpa) penggunaan harian untuk hari-hari tertentu dalam satu transaksi"""
+        baris = zip([rumah_tangga] * len(hari), np.asarray(hari).tolist(), np.asarray(penggunaan, dtype=np.float64).tolist())
+        with self._kunci, self._koneksi:
+            self._pastikan_rumah_tangga(rumah_tangga)
+            self._tulis_batch(_SQL_SIMPAN_PENGGUNAAN, baris)
+
+    def simpan_monitor(self, rumah_tangga, monitor):
+        """Menyimpan isi monitor sebagai rumah tangga.
+
+        Bila jurnal monitor berasal dari rumah tangga ini (dimuat atau terakhir
+        disimpan ke sini), hanya yang tercatat berubah yang ditulis: peralatan
+        baru disisipkan, yang diubah diperbarui per id, id yang sudah tidak ada
+        dihapus, dan hari-hari yang berubah ditulis ulang. Tanpa jurnal, seluruh
+        data lama rumah tangga diganti. Tarif (beberapa baris saja) selalu
+        ditulis ulang.
+
+        Id peralatan baru dialokasikan di memori; bila penulis lain sudah
+        menyimpan id yang sama untuk rumah tangga ini, sqlite3.IntegrityError
+        dinaikkan dan tidak ada yang tertulis (muat ulang lalu ulangi).
+        """
+        tujuan = (self.path, rumah_tangga)
+        jurnal = monitor.jurnal if monitor.jurnal is not None and monitor.jurnal['tujuan'] == tujuan else None
+        peralatan = monitor.peralatan
+        if jurnal is None:
+            ditambah, diubah, dihapus = peralatan, peralatan.pilih([]), []
+        else:
+            baris_baru, baris_lama, dihapus = [], [], []
+            for id_peralatan in sorted(jurnal['peralatan']):
+                try:
+                    i = peralatan.baris_id(id_peralatan)
+                except KeyError:
+                    if id_peralatan not in jurnal['peralatan_baru']:
+                        dihapus.append(id_peralatan)
+                    continue
+                (baris_baru if id_peralatan in jurnal['peralatan_baru'] else baris_lama).append(i)
+            ditambah, diubah = peralatan.pilih(baris_baru), peralatan.pilih(baris_lama)
+        baris_tambah = zip(
+            [rumah_tangga] * len(ditambah), ditambah.id.tolist(), ditambah.nama.tolist(), ditambah.unit.tolist(),
+            ditambah.watt.tolist(), ditambah.golongan.tolist(), ditambah.jam_per_hari.tolist(),
+            ditambah.jam_mulai.tolist()
+        )
+        baris_ubah = zip(
+            diubah.nama.tolist(), diubah.unit.tolist(), diubah.watt.tolist(), diubah.golongan.tolist(),
+            diubah.jam_per_hari.tolist(), diubah.jam_mulai.tolist(), [rumah_tangga] * len(diubah), diubah.id.tolist()
+        )
+        hari, penggunaan = monitor.penggunaan.harian()
+        penggunaan_penuh = jurnal is None or jurnal['penggunaan_penuh']
+        if not penggunaan_penuh:
+            berubah = np.isin(hari, np.fromiter(jurnal['hari'], dtype=np.int64, count=len(jurnal['hari'])))
+            hari, penggunaan = hari[berubah], penggunaan[berubah]
+        baris_penggunaan = zip([rumah_tangga] * len(hari), hari.tolist(), penggunaan.tolist())
+
+        with self._kunci, self._koneksi:
+            self._koneksi.execute(
+                'INSERT OR REPLACE INTO rumah_tangga (id, tarif_terpilih, penggunaan_sampel) VALUES (?, ?, ?)',
+                (rumah_tangga, monitor.tarif_terpilih, int(monitor.penggunaan_sampel))
+            )
+            self._koneksi.executemany(
+                'INSERT OR REPLACE INTO tarif (rumah_tangga, golongan, tarif) VALUES (?, ?, ?)',
+                [(rumah_tangga, golongan, tarif) for golongan, tarif in monitor.tarif_listrik.items()]
+            )
+            self._koneksi.execute('DELETE FROM tarif_lanjutan WHERE rumah_tangga = ?', (rumah_tangga,))
+            self._koneksi.executemany(
+                'INSERT INTO tarif_lanjutan (rumah_tangga, golongan, definisi) VALUES (?, ?, ?)',
+                [(rumah_tangga, golongan, json.dumps(definisi.ke_dict()))
+                 for golongan, definisi in monitor.tarif_lanjutan.items()]
+            )
+            if jurnal is None:
+                self._koneksi.execute('DELETE FROM peralatan WHERE rumah_tangga = ?', (rumah_tangga,))
+            self._tulis_batch(_SQL_TAMBAH_PERALATAN, baris_tambah)
+            if jurnal is not None:
+                self._tulis_batch(_SQL_UBAH_PERALATAN, baris_ubah)
+                self._tulis_batch(
+                    'DELETE FROM peralatan WHERE rumah_tangga = ? AND id_peralatan = ?',
+                    ((rumah_tangga, id_peralatan) for id_peralatan in dihapus)
+                )
+            if penggunaan_penuh:
+                self._koneksi.execute('DELETE FROM penggunaan_harian WHERE rumah_tangga = ?', (rumah_tangga,))
+            self._tulis_batch(_SQL_SIMPAN_PENGGUNAAN, baris_penggunaan)
+        monitor.tandai_tersimpan(tujuan)
+
+    # Pembacaan
+    def daftar_rumah_tangga(self):
+        """Mengembalikan id semua rumah tangga yang tersimpan"""
+        with self._kunci:
+            return [baris[0] for baris in self._koneksi.execute('SELECT id FROM rumah_tangga ORDER BY id')]
+
+    def iter_peralatan(self, rumah_tangga, ukuran_chunk=UKURAN_BATCH):
+        """Membaca peralatan rumah tangga per chunk, setiap chunk berupa dict kolom.
+
+        Memakai koneksi baca tersendiri (WAL mengizinkan pembaca bersamaan),
+        sehingga penyimpanan tetap bisa dipakai selama iterasi berlangsung.
+        """
+        with closing(sqlite3.connect(self.path)) as koneksi:
+            kursor = koneksi.execute(
+                'SELECT id_peralatan, nama, unit, watt, golongan, jam_per_hari, jam_mulai FROM peralatan '
+                'WHERE rumah_tangga = ? ORDER BY id_peralatan',
+                (rumah_tangga,)
+            )
+            while True:
+                baris = kursor.fetchmany(ukuran_chunk)
+                if not baris:
+                    break
+                id_peralatan, nama, unit, watt, golongan, jam_per_hari, jam_mulai = zip(*baris)
+                yield {
+                    'id': np.array(id_peralatan, dtype=np.int64),
+                    'nama': np.array(nama, dtype=object),
+                    'unit': np.array(unit, dtype=np.int64),
+                    'watt': np.array(watt, dtype=np.float64),
+                    'golongan': np.array(golongan, dtype=object),
+                    'jam_per_hari': np.array(jam_per_hari, dtype=np.float64),
+                    'jam_mulai': np.array(jam_mulai, dtype=np.float64),
+                }
+
+    def muat_monitor(self, rumah_tangga):
+        """Memuat rumah tangga menjadi MonitorListrik, atau None bila belum tersimpan"""
+        with self._kunci:
+            info = self._koneksi.execute(
+                'SELECT tarif_terpilih, penggunaan_sampel FROM rumah_tangga WHERE id = ?', (rumah_tangga,)
+            ).fetchone()
+            if info is None:
+                return None
+            tarif = self._koneksi.execute(
+                'SELECT golongan, tarif FROM tarif WHERE rumah_tangga = ?', (rumah_tangga,)
+            ).fetchall()
+            tarif_lanjutan = self._koneksi.execute(
+                'SELECT golongan, definisi FROM tarif_lanjutan WHERE rumah_tangga = ?', (rumah_tangga,)
+            ).fetchall()
+            penggunaan = self._koneksi.execute(
+                'SELECT hari, penggunaan FROM penggunaan_harian WHERE rumah_tangga = ? ORDER BY hari',
+                (rumah_tangga,)
+            ).fetchall()
+
+        monitor = MonitorListrik()
+        monitor.tarif_terpilih = info[0]
+        monitor.tarif_listrik.update(tarif)
+        for golongan, definisi in tarif_lanjutan:
+            monitor.tarif_lanjutan[golongan] = DefinisiTarif.dari_dict(json.loads(definisi))
+        for chunk in self.iter_peralatan(rumah_tangga):
+            monitor.peralatan.tambah_banyak(
+                chunk['nama'], chunk['unit'], chunk['watt'], chunk['golongan'], chunk['jam_per_hari'],
+                chunk['jam_mulai'], id_peralatan=chunk['id']
+            )
+        if penggunaan:
+            hari, nilai = zip(*penggunaan)
+            monitor.penggunaan.tambah_harian(np.array(hari, dtype=np.int64), np.array(nilai, dtype=np.float64))
+        monitor.penggunaan_sampel = bool(info[1])
+        monitor.versi += 1
+        monitor.tandai_tersimpan((self.path, rumah_tangga))
+        return monitor
+
+    # Agregat di sisi SQL
+    def hitung_kwh_per_golongan(self, rumah_tangga):
+        """Menghitung kWh per bulan per golongan dengan GROUP BY, dalam urutan kode golongan"""
+        with self._kunci:
+            hasil = dict(self._koneksi.execute(
+                f'SELECT golongan, SUM({_KWH_PER_BULAN}) FROM peralatan WHERE rumah_tangga = ? GROUP BY golongan',
+                (rumah_tangga,)
+            ).fetchall())
+        return np.array([hasil.get(golongan) or 0.0 for golongan in GOLONGAN], dtype=np.float64)
+
+    def hitung_total_penggunaan(self, rumah_tangga):
+        """Menghitung total penggunaan listrik dalam kWh per bulan"""
+        return float(self.hitung_kwh_per_golongan(rumah_tangga).sum())
+
+    def daftar_definisi_tarif(self, rumah_tangga, tarif_listrik=None):
+        """Definisi tarif per golongan (urutan kode) dari tarif dan tarif lanjutan tersimpan.
+
+        tarif_listrik (dict golongan -> Rp/kWh atau DefinisiTarif) menggantikan
+        tarif tersimpan bila diberikan.
+        """
+        if tarif_listrik is None:
+            with self._kunci:
+                tarif_listrik = dict(self._koneksi.execute(
+                    'SELECT golongan, tarif FROM tarif WHERE rumah_tangga = ?', (rumah_tangga,)
+                ).fetchall())
+                tarif_listrik.update(
+                    (golongan, DefinisiTarif.dari_dict(json.loads(definisi)))
+                    for golongan, definisi in self._koneksi.execute(
+                        'SELECT golongan, definisi FROM tarif_lanjutan WHERE rumah_tangga = ?', (rumah_tangga,)
+                    )
+                )
+        tarif_listrik = {**TARIF_DEFAULT, **tarif_listrik}
+        return [
+            tarif_listrik[golongan] if isinstance(tarif_listrik[golongan], DefinisiTarif)
+            else DefinisiTarif.flat(golongan, tarif_listrik[golongan])
+            for golongan in GOLONGAN
+        ]
+
+    def hitung_beban_per_jam_golongan(self, rumah_tangga):
+        """kWh per jam dalam sehari per golongan (golongan x 24) dari jadwal peralatan, dibaca per chunk"""
+        beban_jam = np.zeros((len(GOLONGAN), 24))
+        for chunk in self.iter_peralatan(rumah_tangga):
+            peralatan = TabelPeralatan(kapasitas=len(chunk['id']))
+            peralatan.tambah_banyak(
+                chunk['nama'], chunk['unit'], chunk['watt'], chunk['golongan'], chunk['jam_per_hari'],
+                chunk['jam_mulai'], id_peralatan=chunk['id']
+            )
+            beban_jam += hitung_beban_jam_kelompok(peralatan, peralatan.kode_golongan, len(GOLONGAN))
+        return beban_jam
+
+    def hitung_estimasi_biaya(self, rumah_tangga, tarif_listrik=None):
+        """Menghitung estimasi biaya listrik dengan tarif tersimpan rumah tangga (atau tarif_listrik).
+
+        Dihargai dengan DefinisiTarif yang sama seperti MonitorListrik; jendela
+        waktu pakai memakai bentuk beban per jam dari jadwal peralatan.
+        """
+        daftar_definisi = self.daftar_definisi_tarif(rumah_tangga, tarif_listrik)
+        beban_jam = None
+        if any(definisi.waktu_pakai for definisi in daftar_definisi):
+            beban_jam = self.hitung_beban_per_jam_golongan(rumah_tangga)
+        return float(hitung_tagihan_golongan(daftar_definisi, self.hitung_kwh_per_golongan(rumah_tangga), beban_jam))
+
+    def hitung_penggunaan_harian(self, rumah_tangga, hari_awal=None, hari_akhir=None):
+        """Menghitung jumlah, rata-rata, minimum dan maksimum penggunaan harian pada rentang hari"""
+        with self._kunci:
+            jumlah, rata_rata, minimum, maksimum = self._koneksi.execute(
+                'SELECT SUM(penggunaan), AVG(penggunaan), MIN(penggunaan), MAX(penggunaan) '
+                'FROM penggunaan_harian WHERE rumah_tangga = ? AND hari BETWEEN ? AND ?',
+                (rumah_tangga, hari_awal if hari_awal is not None else -2**62, hari_akhir if hari_akhir is not None else 2**62)
+            ).fetchone()
+        return {'jumlah': jumlah or 0.0, 'rata_rata': rata_rata, 'minimum': minimum, 'maksimum': maksimum}
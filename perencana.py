@@ -0,0 +1,129 @@
+import numpy as np
+
+from tabel_peralatan import GOLONGAN, HARI_PER_BULAN, PERALATAN_SELALU_NYALA
+from tarif import hitung_tagihan_golongan
+
+ITERASI_BISEKSI = 50
+
+
+def batas_jam_default(nama, jam_per_hari):
+    """Jam minimum dan maksimum default: peralatan yang harus selalu menyala dipertahankan, lainnya boleh sampai 0 jam"""
+    jam = np.asarray(jam_per_hari, dtype=np.float64)
+    selalu_nyala = np.isin(np.asarray(nama, dtype=object), PERALATAN_SELALU_NYALA)
+    return np.where(selalu_nyala, jam, 0.0), jam.copy()
+
+
+def rencanakan_jam(kwh_per_jam, kode_golongan, jam_per_hari, target, jam_min=None, jam_maks=None,
+                   prioritas=None, rumah_tangga=None, daftar_definisi=None, beban_jam=None):
+    """Memilih jam penggunaan per peralatan agar target tercapai dengan kehilangan kenyamanan terkecil.
+
+    Kehilangan kenyamanan = prioritas x jam yang dikurangi dari jam_per_hari.
+    Target berupa kWh per bulan, atau Rupiah per bulan bila daftar_definisi
+    (satu DefinisiTarif per golongan) diberikan; boleh skalar atau satu nilai
+    per rumah tangga (rumah_tangga = kode 0..H-1 per peralatan). beban_jam
+    berupa bentuk beban per jam (golongan x 24, atau rumah tangga x golongan
+    x 24) agar tagihan menghargai jendela waktu pakai seperti estimasi biaya.
+
+    Peralatan diurutkan per rumah tangga menurut penghematan per satuan
+    kenyamanan, lalu dipotong penuh satu per satu dan yang terakhir dipotong
+    sebagian (knapsack pecahan). Untuk target kWh dan tarif flat hasilnya
+    optimal; untuk tarif blok urutan memakai harga marginal saat ini.
+    Seluruh langkah berupa operasi array, tanpa perulangan per rumah tangga.
+    """
+    kwh_per_jam = np.asarray(kwh_per_jam, dtype=np.float64)
+    kode_golongan = np.asarray(kode_golongan, dtype=np.int64)
+    jam = np.asarray(jam_per_hari, dtype=np.float64)
+    n = len(jam)
+    jam_min = np.zeros(n) if jam_min is None else np.asarray(jam_min, dtype=np.float64)
+    jam_maks = jam if jam_maks is None else np.asarray(jam_maks, dtype=np.float64)
+    prioritas = np.ones(n) if prioritas is None else np.asarray(prioritas, dtype=np.float64)
+    kode_rt = np.zeros(n, dtype=np.int64) if rumah_tangga is None else np.asarray(rumah_tangga, dtype=np.int64)
+    jumlah_rt = max(int(kode_rt.max()) + 1 if n else 1, np.size(target))
+    target = np.broadcast_to(np.asarray(target, dtype=np.float64), (jumlah_rt,))
+    jumlah_golongan = len(GOLONGAN)
+    semua_rt = np.arange(jumlah_rt)
+
+    if beban_jam is not None:
+        beban_jam = np.asarray(beban_jam, dtype=np.float64)
+        beban_jam = np.broadcast_to(beban_jam, (jumlah_rt, *beban_jam.shape[-2:]))
+
+    def nilai(kwh_golongan, rt):
+        if daftar_definisi is None:
+            return kwh_golongan.sum(axis=-1)
+        return hitung_tagihan_golongan(daftar_definisi, kwh_golongan, None if beban_jam is None else beban_jam[rt])
+
+    def per_golongan(kwh):
+        sel = kode_rt * jumlah_golongan + kode_golongan
+        return np.bincount(sel, weights=kwh, minlength=jumlah_rt * jumlah_golongan).reshape(jumlah_rt, jumlah_golongan)
+
+    # Titik awal: jam sekarang dijepit ke [jam_min, jam_maks]; yang bisa dipotong hanya di atas jam_min
+    jam_awal = np.clip(jam, jam_min, jam_maks)
+    jam_bisa_dikurangi = jam_awal - np.minimum(jam_min, jam_awal)
+    kwh_bulan_per_jam = kwh_per_jam * HARI_PER_BULAN
+    pengurangan = kwh_bulan_per_jam * jam_bisa_dikurangi
+    kwh_awal = per_golongan(kwh_bulan_per_jam * jam_awal)
+
+    if daftar_definisi is None:
+        harga = np.ones(n)
+    else:
+        harga_marginal = np.stack(
+            [definisi.harga_marginal(kwh_awal[:, kode]) for kode, definisi in enumerate(daftar_definisi)], axis=1
+        )
+        harga = harga_marginal[kode_rt, kode_golongan]
+    penghematan = kwh_bulan_per_jam * harga
+    rasio = np.divide(penghematan, prioritas, out=np.full(n, np.inf), where=prioritas > 0)
+    rasio = np.where(pengurangan > 0, rasio, -np.inf)
+    # Urut per rumah tangga lalu rasio menurun; kunci gabungan int64 jauh lebih cepat dari lexsort
+    peringkat = np.empty(n, dtype=np.int64)
+    peringkat[np.argsort(-rasio)] = np.arange(n)
+    urutan = np.argsort(kode_rt * n + peringkat)
+
+    # kWh per golongan yang tersisa setelah memotong penuh peralatan sampai posisi ini (per rumah tangga)
+    rt_urut, golongan_urut, pengurangan_urut = kode_rt[urutan], kode_golongan[urutan], pengurangan[urutan]
+    langkah = np.zeros((n, jumlah_golongan))
+    langkah[np.arange(n), golongan_urut] = pengurangan_urut
+    kumulatif = np.vstack([np.zeros(jumlah_golongan), np.cumsum(langkah, axis=0)])
+    awal_segmen = np.searchsorted(rt_urut, semua_rt)
+    ukuran_segmen = np.bincount(rt_urut, minlength=jumlah_rt)
+    sisa = np.maximum(kwh_awal[rt_urut] - (kumulatif[1:] - kumulatif[awal_segmen][rt_urut]), 0.0)
+
+    # Nilai menurun sepanjang urutan, jadi banyaknya posisi di atas target = jumlah peralatan yang dipotong penuh
+    perlu = nilai(kwh_awal, semua_rt) > target
+    dipotong_penuh = np.bincount(rt_urut, weights=nilai(sisa, rt_urut) > target[rt_urut], minlength=jumlah_rt).astype(np.int64)
+    dipotong_penuh = np.where(perlu, dipotong_penuh, 0)
+    tercapai = dipotong_penuh < ukuran_segmen
+    parsial = np.flatnonzero(perlu & tercapai)
+
+    # Peralatan pemotong terakhir dipotong sebagian sampai nilai tepat sama dengan target
+    posisi = awal_segmen[parsial] + dipotong_penuh[parsial]
+    satu_langkah = langkah[posisi]
+    sebelum = sisa[posisi] + satu_langkah
+    if daftar_definisi is None:
+        fraksi_parsial = (sebelum.sum(axis=1) - target[parsial]) / pengurangan_urut[posisi]
+    else:
+        bawah, fraksi_parsial = np.zeros(len(parsial)), np.ones(len(parsial))
+        for _ in range(ITERASI_BISEKSI):
+            tengah = (bawah + fraksi_parsial) / 2
+            lebih = nilai(sebelum - tengah[:, None] * satu_langkah, parsial) > target[parsial]
+            bawah = np.where(lebih, tengah, bawah)
+            fraksi_parsial = np.where(lebih, fraksi_parsial, tengah)
+
+    posisi_dalam_segmen = np.arange(n) - awal_segmen[rt_urut]
+    fraksi_urut = (posisi_dalam_segmen < dipotong_penuh[rt_urut]).astype(np.float64)
+    fraksi_urut[posisi] = np.clip(fraksi_parsial, 0.0, 1.0)
+    fraksi = np.empty(n)
+    fraksi[urutan] = fraksi_urut
+
+    jam_rencana = jam_awal - fraksi * jam_bisa_dikurangi
+    kwh_rencana = kwh_bulan_per_jam * jam_rencana
+    kwh_golongan = per_golongan(kwh_rencana)
+    kehilangan = prioritas * np.maximum(jam - jam_rencana, 0.0)
+    return {
+        'jam_rencana': jam_rencana,
+        'kwh_rencana': kwh_rencana,
+        'kehilangan_kenyamanan': kehilangan,
+        'kwh_golongan': kwh_golongan,
+        'nilai': nilai(kwh_golongan, semua_rt),
+        'tercapai': tercapai | ~perlu,
+        'kehilangan_kenyamanan_rumah_tangga': np.bincount(kode_rt, weights=kehilangan, minlength=jumlah_rt),
+    }
@@ -0,0 +1,98 @@
+import numpy as np
+
+PERIODE_MINGGUAN = 7
+Z_INTERVAL = 1.96  # Interval prakiraan 95%
+
+
+class HoltWinters:
+    """Pemulusan eksponensial Holt-Winters aditif dengan musiman mingguan, diperbarui per hari.
+
+    Status model (level, tren, 7 faktor musiman per hari dalam minggu dan
+    jumlah kuadrat galat satu langkah) diperbarui O(1) setiap kali satu total
+    harian masuk, tanpa melatih ulang dari awal. Minggu pertama dipakai
+    untuk inisialisasi.
+    """
+
+    def __init__(self, alpha=0.3, beta=0.02, gamma=0.1, periode=PERIODE_MINGGUAN):
+        """Inisialisasi model kosong dengan konstanta pemulusan tetap"""
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.periode = periode
+        self.level = None
+        self.tren = 0.0
+        self.musiman = np.zeros(periode)
+        self.hari_terakhir = None  # Id hari terakhir yang sudah masuk ke model
+        self._awal = []  # Bacaan minggu pertama sebelum model siap
+        self._jumlah_galat = 0
+        self._jumlah_kuadrat_galat = 0.0
+
+    @property
+    def siap(self):
+        """True bila model sudah terinisialisasi dan bisa meramal"""
+        return self.level is not None
+
+    def salin(self):
+        """Membuat salinan status model"""
+        salinan = HoltWinters(self.alpha, self.beta, self.gamma, self.periode)
+        salinan.__dict__.update(self.__dict__)
+        salinan.musiman = self.musiman.copy()
+        salinan._awal = list(self._awal)
+        return salinan
+
+    def perbarui(self, hari, kwh):
+        """Memasukkan total kWh hari berikutnya; hari yang terlewat dianggap sesuai ramalan"""
+        if self.hari_terakhir is not None and hari <= self.hari_terakhir:
+            return
+        if not self.siap:
+            self._awal.append(kwh)
+            self.hari_terakhir = hari
+            if len(self._awal) == self.periode:
+                awal = np.asarray(self._awal, dtype=np.float64)
+                self.level = float(awal.mean())
+                # musiman diindeks hari dalam minggu (id hari % periode)
+                urutan = (np.arange(hari - self.periode + 1, hari + 1)) % self.periode
+                self.musiman[urutan] = awal - self.level
+                self._awal = []
+            return
+
+        for hari_lewat in range(self.hari_terakhir + 1, hari):
+            self._langkah(hari_lewat, None)
+        self._langkah(hari, kwh)
+        self.hari_terakhir = hari
+
+    def _langkah(self, hari, kwh):
+        """Satu langkah pembaruan Holt-Winters (kwh None = hari tanpa data, status hanya dimajukan)"""
+        indeks = hari % self.periode
+        ramalan = self.level + self.tren + self.musiman[indeks]
+        if kwh is None:
+            self.level += self.tren
+            return
+        galat = kwh - ramalan
+        self._jumlah_galat += 1
+        self._jumlah_kuadrat_galat += galat * galat
+        level_lama = self.level
+        self.level = self.alpha * (kwh - self.musiman[indeks]) + (1 - self.alpha) * (level_lama + self.tren)
+        self.tren = self.beta * (self.level - level_lama) + (1 - self.beta) * self.tren
+        self.musiman[indeks] = self.gamma * (kwh - self.level) + (1 - self.gamma) * self.musiman[indeks]
+
+    def ramal(self, langkah):
+        """Ramalan kWh untuk langkah 1..langkah hari setelah hari terakhir"""
+        k = np.arange(1, langkah + 1)
+        return self.level + k * self.tren + self.musiman[(self.hari_terakhir + k) % self.periode]
+
+    def ramal_jumlah(self, langkah_awal, langkah_akhir):
+        """Jumlah ramalan kWh untuk langkah langkah_awal..langkah_akhir beserta simpangan bakunya.
+
+        Varians jumlah mengikuti model ETS(A,A) berderet galat satu langkah:
+        galat ke-m ikut terbawa ke ramalan langkah k > m dengan bobot alpha + (k-m)*beta.
+        """
+        if langkah_akhir < langkah_awal:
+            return 0.0, 0.0
+        jumlah = float(self.ramal(langkah_akhir)[langkah_awal - 1:].sum())
+        varians = self._jumlah_kuadrat_galat / self._jumlah_galat if self._jumlah_galat else 0.0
+        k = np.arange(langkah_awal, langkah_akhir + 1)
+        m = np.arange(1, langkah_akhir + 1)
+        selisih = k[None, :] - m[:, None]
+        bobot = np.where(selisih > 0, self.alpha + selisih * self.beta, (selisih == 0).astype(np.float64))
+        return jumlah, float(np.sqrt(varians * (bobot.sum(axis=1) ** 2).sum()))
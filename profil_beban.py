@@ -0,0 +1,85 @@
+import numpy as np
+
+from tabel_peralatan import GOLONGAN
+
+MENIT_PER_HARI = 24 * 60
+UKURAN_CHUNK = 512  # Baris peralatan per chunk matriks beban (~6 MB float64 per chunk)
+
+# Daya tersambung (VA) per golongan; daya papan nama peralatan (watt) dianggap setara VA
+DAYA_KONTRAK_VA = {
+    'R-1': 2200,
+    'R-2': 5500,
+    'R-3': 6600,
+}
+
+
+def matriks_beban(peralatan):
+    """Matriks beban (kW) berbentuk (peralatan x 1440 menit) dari jadwal harian setiap peralatan.
+
+    Peralatan menyala jam_per_hari jam mulai jam_mulai; menit yang hanya
+    sebagian tercakup jadwal mendapat beban sebanding.
+    """
+    menit = np.arange(MENIT_PER_HARI, dtype=np.float64)
+    mulai = peralatan.jam_mulai[:, None] * 60
+    durasi = np.minimum(peralatan.jam_per_hari, 24)[:, None] * 60
+    sejak_mulai = (menit[None, :] - mulai) % MENIT_PER_HARI
+    # Bagian menit [m, m+1) yang jatuh di dalam jendela [mulai, mulai + durasi)
+    menyala = np.clip(durasi - sejak_mulai, 0.0, 1.0)
+    menyala += np.minimum(np.clip(sejak_mulai + 1 - MENIT_PER_HARI, 0.0, 1.0), durasi)  # Jendela mulai di tengah menit
+    return np.minimum(menyala, 1.0) * peralatan.kwh_per_jam()[:, None]
+
+
+def hitung_beban_golongan(peralatan, ukuran_chunk=UKURAN_CHUNK):
+    """Beban (kW) per golongan per menit berbentuk (golongan x 1440), dijumlahkan per chunk peralatan.
+
+    Matriks beban hanya dibangun untuk satu chunk sekaligus, sehingga memori
+    tidak tumbuh dengan jumlah peralatan.
+    """
+    beban_golongan = np.zeros((len(GOLONGAN), MENIT_PER_HARI))
+    for awal in range(0, len(peralatan), ukuran_chunk):
+        chunk = peralatan.potongan(awal, awal + ukuran_chunk)
+        satu_panas = np.zeros((len(GOLONGAN), len(chunk)))
+        satu_panas[chunk.kode_golongan, np.arange(len(chunk))] = 1.0
+        beban_golongan += satu_panas @ matriks_beban(chunk)
+    return beban_golongan
+
+
+def hitung_beban_jam_kelompok(peralatan, kelompok, jumlah_kelompok, ukuran_chunk=UKURAN_CHUNK):
+    """kWh per jam dalam sehari per kelompok peralatan berbentuk (jumlah_kelompok x 24), per chunk peralatan.
+
+    kelompok berisi kode 0..jumlah_kelompok-1 per peralatan (mis. rumah
+    tangga x golongan pada armada).
+    """
+    kelompok = np.asarray(kelompok, dtype=np.int64)
+    beban_jam = np.zeros((jumlah_kelompok, 24))
+    for awal in range(0, len(peralatan), ukuran_chunk):
+        chunk = peralatan.potongan(awal, awal + ukuran_chunk)
+        per_jam = matriks_beban(chunk).reshape(len(chunk), 24, 60).sum(axis=2) / 60
+        kelompok_chunk = kelompok[awal:awal + len(chunk)]
+        for jam in range(24):
+            beban_jam[:, jam] += np.bincount(kelompok_chunk, weights=per_jam[:, jam], minlength=jumlah_kelompok)
+    return beban_jam
+
+
+def hitung_profil_beban(peralatan, beban_golongan=None, daya_kontrak_va=None):
+    """Menghitung beban per menit per golongan, beban puncak, kurva durasi beban dan menit beban lebih.
+
+    beban_golongan boleh diberikan (mis. dari cache) agar tidak dihitung ulang;
+    daya_kontrak_va berupa dict golongan -> VA (default DAYA_KONTRAK_VA).
+    """
+    if beban_golongan is None:
+        beban_golongan = hitung_beban_golongan(peralatan)
+    daya_kontrak_va = {**DAYA_KONTRAK_VA, **(daya_kontrak_va or {})}
+    beban = beban_golongan.sum(axis=0)
+    kapasitas_kw = np.array([daya_kontrak_va[golongan] for golongan in GOLONGAN], dtype=np.float64) / 1000
+    beban_lebih = beban_golongan > kapasitas_kw[:, None]
+    return {
+        'beban': beban,
+        'beban_golongan': beban_golongan,
+        'puncak_kw': float(beban.max()) if len(peralatan) else 0.0,
+        'menit_puncak': int(beban.argmax()),
+        'kurva_durasi': np.sort(beban)[::-1],
+        'kapasitas_kw': kapasitas_kw,
+        'puncak_golongan_kw': beban_golongan.max(axis=1),
+        'menit_beban_lebih': beban_lebih.sum(axis=1),
+    }
@@ -0,0 +1,82 @@
+import os
+
+import streamlit as st
+
+from ekspor import FORMAT_EKSPOR, data_unduhan, format_tersedia, nama_berkas_ekspor
+from monitor_listrik import buat_monitor_default
+
+# Bila diisi, monitor setiap rumah tangga disimpan ke file SQLite ini
+DB_PATH = os.environ.get('MONITOR_LISTRIK_DB')
+
+
+@st.cache_resource
+def monitor_default():
+    """Rumah tangga default hanya-baca, dibuat sekali per proses dan dibagi ke semua sesi"""
+    monitor = buat_monitor_default()
+    monitor.bekukan()
+    return monitor
+
+
+@st.cache_resource
+def penyimpanan():
+    """Penyimpanan SQLite bersama untuk proses ini, atau None bila DB_PATH tidak diatur"""
+    if not DB_PATH:
+        return None
+    from penyimpanan_sqlite import PenyimpananSQLite
+    return PenyimpananSQLite(DB_PATH)
+
+
+def _rumah_tangga():
+    """Id rumah tangga sesi ini, diambil dari query parameter ?rumah_tangga="""
+    return st.query_params.get('rumah_tangga', 'default')
+
+
+def _kunci_simpan(monitor):
+    return (monitor.versi, monitor.kunci_tarif())
+
+
+def ambil_monitor():
+    """Mengambil monitor milik sesi, dibuat sekali lalu dipakai bersama oleh semua halaman.
+
+    Sesi baru hanya mereferensikan snapshot default dan baru menyalin datanya
+    sendiri saat pertama kali diubah (copy-on-write). Bila penyimpanan SQLite
+    aktif, rumah tangga yang sudah tersimpan dimuat dari sana.
+    """
+    if 'monitor' not in st.session_state:
+        db = penyimpanan()
+        monitor = db.muat_monitor(_rumah_tangga()) if db else None
+        if monitor is None:
+            monitor = monitor_default().salinan_berbagi()
+        st.session_state.monitor = monitor
+        st.session_state.kunci_tersimpan = _kunci_simpan(monitor) if db else None
+    return st.session_state.monitor
+
+
+def simpan_monitor():
+    """Menyimpan monitor sesi ke SQLite bila ada perubahan sejak penyimpanan terakhir"""
+    db = penyimpanan()
+    if db is None or 'monitor' not in st.session_state:
+        return
+    monitor = st.session_state.monitor
+    kunci = _kunci_simpan(monitor)
+    if kunci != st.session_state.kunci_tersimpan:
+        db.simpan_monitor(_rumah_tangga(), monitor)
+        st.session_state.kunci_tersimpan = kunci
+
+
+def tombol_ekspor(monitor, tabel, rencana=None):
+    """Pilihan format dan tombol unduh tabel halaman; berkas baru dibuat per chunk saat tombol diklik"""
+    col1, col2 = st.columns([1, 3], vertical_alignment='bottom')
+    with col1:
+        format = st.selectbox(
+            'Format ekspor', format_tersedia(), format_func=str.upper, key=f'format-ekspor-{tabel}'
+        )
+    with col2:
+        st.download_button(
+            'Unduh Tabel',
+            data=lambda: data_unduhan(monitor, tabel, format, rencana),
+            file_name=nama_berkas_ekspor(tabel, format),
+            mime=FORMAT_EKSPOR[format][1],
+            on_click='ignore',
+            key=f'unduh-{tabel}'
+        )
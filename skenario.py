@@ -0,0 +1,122 @@
+import numpy as np
+
+from tabel_peralatan import GOLONGAN, HARI_PER_BULAN, KODE_GOLONGAN
+from tarif import hitung_tagihan_golongan
+
+# Batas jumlah kombinasi, dan batas sel matriks (kombinasi x peralatan yang disentuh grid) agar tetap muat di memori
+BATAS_KOMBINASI = 200000
+BATAS_SEL = 20000000
+
+
+def tandai_pareto(biaya, kehilangan):
+    """Menandai skenario di front Pareto: tidak ada skenario lain yang lebih murah sekaligus lebih nyaman"""
+    urutan = np.lexsort((kehilangan, biaya))
+    kehilangan_urut = kehilangan[urutan]
+    terbaik_sebelumnya = np.concatenate([[np.inf], np.minimum.accumulate(kehilangan_urut)[:-1]])
+    pareto = np.empty(len(biaya), dtype=bool)
+    pareto[urutan] = kehilangan_urut < terbaik_sebelumnya
+    return pareto
+
+
+def sapu_skenario(peralatan, daftar_definisi, golongan=(None,), perubahan_jam=None, penggantian_watt=None,
+                  prioritas=None, beban_jam=None):
+    """Menghitung semua kombinasi skenario "bagaimana jika" dalam satu komputasi broadcast.
+
+    golongan         -- pilihan golongan untuk seluruh peralatan (None = tetap seperti sekarang)
+    perubahan_jam    -- dict nama peralatan -> pilihan selisih jam per hari (mis. {'AC': [0, -1, -2]})
+    penggantian_watt -- dict nama peralatan -> pilihan watt per unit (mis. {'Lampu LED': [20, 9]})
+    prioritas        -- bobot kenyamanan per peralatan untuk jam yang dikurangi (default 1)
+    beban_jam        -- bentuk beban per jam golongan (golongan x 24) untuk tarif waktu pakai (lihat
+                        hitung_tagihan_golongan); pilihan golongan memindahkan seluruh bentuk ke golongan itu
+
+    Setiap dimensi menjadi satu sumbu grid. Hanya peralatan yang disebut di
+    perubahan_jam atau penggantian_watt yang mendapat kolom di matriks
+    (kombinasi x peralatan) untuk jam, watt dan golongan; kWh peralatan
+    lainnya sama di semua kombinasi, sehingga cukup dijumlahkan sekali per
+    golongan sebagai dasar (pilihan golongan hanya memindahkannya ke satu
+    golongan). kWh per golongan dan tagihan lalu dihitung sekaligus untuk
+    semua kombinasi.
+    Mengembalikan dict berisi pilihan tiap dimensi per kombinasi, total_kwh,
+    biaya, kehilangan_kenyamanan dan pareto.
+    """
+    perubahan_jam = perubahan_jam or {}
+    penggantian_watt = penggantian_watt or {}
+    nama = peralatan.nama
+    for kunci in (*perubahan_jam, *penggantian_watt):
+        if not np.any(nama == kunci):
+            raise ValueError(f'Peralatan tidak ditemukan: {kunci}')
+    for pilihan in golongan:
+        if pilihan is not None and pilihan not in KODE_GOLONGAN:
+            raise ValueError(f'Golongan listrik tidak dikenal: {pilihan}')
+
+    dimensi = [('golongan', list(golongan))]
+    dimensi += [(f'jam {kunci}', list(pilihan)) for kunci, pilihan in perubahan_jam.items()]
+    dimensi += [(f'watt {kunci}', list(pilihan)) for kunci, pilihan in penggantian_watt.items()]
+    bentuk = tuple(len(pilihan) for _, pilihan in dimensi)
+    jumlah_kombinasi = int(np.prod(bentuk))
+    if jumlah_kombinasi > BATAS_KOMBINASI:
+        raise ValueError(f'Terlalu banyak kombinasi skenario: {jumlah_kombinasi} (batas {BATAS_KOMBINASI})')
+    tersentuh = np.flatnonzero(np.isin(nama, [*perubahan_jam, *penggantian_watt]))
+    if jumlah_kombinasi * len(tersentuh) > BATAS_SEL:
+        raise ValueError(
+            f'Skenario terlalu besar: {jumlah_kombinasi} kombinasi x {len(tersentuh)} peralatan (batas {BATAS_SEL} sel)'
+        )
+    indeks = np.indices(bentuk).reshape(len(bentuk), -1)  # (dimensi, kombinasi)
+    jumlah_golongan = len(GOLONGAN)
+
+    # Golongan: satu kode untuk semua peralatan, atau kode asal bila pilihan None
+    kode_pilihan = np.array([-1 if g is None else KODE_GOLONGAN[g] for g in golongan], dtype=np.int64)[indeks[0]]
+
+    # Dasar kWh per golongan dari peralatan yang tidak disentuh grid
+    tetap = np.ones(len(peralatan), dtype=bool)
+    tetap[tersentuh] = False
+    dasar = np.bincount(
+        peralatan.kode_golongan[tetap], weights=peralatan.kwh_per_bulan()[tetap], minlength=jumlah_golongan
+    )
+    dasar_pilihan = np.zeros((len(golongan), jumlah_golongan))
+    for p, g in enumerate(golongan):
+        if g is None:
+            dasar_pilihan[p] = dasar
+        else:
+            dasar_pilihan[p, KODE_GOLONGAN[g]] = dasar.sum()
+    kwh_golongan = dasar_pilihan[indeks[0]]
+
+    # Kolom peralatan yang disentuh grid
+    nama_tersentuh = nama[tersentuh]
+    kode = np.where(kode_pilihan[:, None] < 0, peralatan.kode_golongan[tersentuh][None, :], kode_pilihan[:, None])
+    jam_asal = peralatan.jam_per_hari[tersentuh]
+    jam = np.broadcast_to(jam_asal, (jumlah_kombinasi, len(tersentuh))).copy()
+    watt = np.broadcast_to(peralatan.watt[tersentuh], (jumlah_kombinasi, len(tersentuh))).copy()
+    for d, (kunci, pilihan) in enumerate(perubahan_jam.items(), start=1):
+        jam += np.asarray(pilihan, dtype=np.float64)[indeks[d]][:, None] * (nama_tersentuh == kunci)[None, :]
+    for d, (kunci, pilihan) in enumerate(penggantian_watt.items(), start=1 + len(perubahan_jam)):
+        watt = np.where(nama_tersentuh == kunci, np.asarray(pilihan, dtype=np.float64)[indeks[d]][:, None], watt)
+    jam = np.clip(jam, 0.0, 24.0)
+
+    kwh = watt * peralatan.unit[tersentuh] / 1000 * jam * HARI_PER_BULAN
+    sel = np.arange(jumlah_kombinasi)[:, None] * jumlah_golongan + kode
+    kwh_golongan += np.bincount(
+        sel.ravel(), weights=kwh.ravel(), minlength=jumlah_kombinasi * jumlah_golongan
+    ).reshape(jumlah_kombinasi, jumlah_golongan)
+    if beban_jam is None:
+        biaya = hitung_tagihan_golongan(daftar_definisi, kwh_golongan)
+    else:
+        biaya = np.empty(jumlah_kombinasi)
+        for p, g in enumerate(golongan):
+            bentuk = np.asarray(beban_jam, dtype=np.float64)
+            if g is not None:
+                bentuk = np.zeros_like(bentuk)
+                bentuk[KODE_GOLONGAN[g]] = np.sum(beban_jam, axis=0)
+            dipilih = indeks[0] == p
+            biaya[dipilih] = hitung_tagihan_golongan(daftar_definisi, kwh_golongan[dipilih], bentuk)
+
+    prioritas = np.ones(len(peralatan)) if prioritas is None else np.asarray(prioritas, dtype=np.float64)
+    kehilangan = np.maximum(jam_asal - jam, 0.0) @ prioritas[tersentuh]
+
+    return {
+        'dimensi': {label: np.asarray(pilihan, dtype=object)[indeks[d]] for d, (label, pilihan) in enumerate(dimensi)},
+        'total_kwh': kwh_golongan.sum(axis=1),
+        'biaya': biaya,
+        'kehilangan_kenyamanan': kehilangan,
+        'pareto': tandai_pareto(biaya, kehilangan),
+    }
@@ -0,0 +1,458 @@
+import numpy as np
+
+# Golongan listrik yang dikenal, urutannya menjadi kode golongan di array
+GOLONGAN = ('R-1', 'R-2', 'R-3')
+KODE_GOLONGAN = {golongan: kode for kode, golongan in enumerate(GOLONGAN)}
+
+HARI_PER_BULAN = 30
+
+# Aturan saran penggunaan: batas jam per hari, kecuali peralatan yang harus selalu menyala
+BATAS_JAM_SARAN = 4
+PERALATAN_SELALU_NYALA = ('Kulkas', 'Kamera Pengawas')
+
+# Jadwal harian: peralatan menyala jam_per_hari jam berturut-turut mulai jam_mulai (boleh melewati tengah malam)
+JAM_MULAI_DEFAULT = 18.0
+
+# Atribut array per baris; id peralatan stabil, baris bisa berpindah saat ada yang dihapus
+KOLOM_ARRAY = ('_id', '_nama', '_unit', '_watt', '_jam_per_hari', '_kode_golongan', '_jam_mulai')
+
+
+def normalisasi_nama(nama):
+    """Nama peralatan untuk deteksi duplikat: spasi dirapikan dan huruf kecil (casefold)"""
+    return ' '.join(str(nama).split()).casefold()
+
+
+class TabelPeralatan:
+    """Penyimpanan peralatan berbentuk kolom (struct-of-arrays) berbasis NumPy.
+
+    Setiap atribut peralatan disimpan dalam array yang bersebelahan di memori
+    dan tumbuh dua kali lipat saat penuh, sehingga penambahan peralatan tetap
+    O(1) teramortisasi dan seluruh agregat bisa dihitung secara vektor.
+    Iterasi atas tabel tetap menghasilkan dict seperti daftar peralatan lama.
+
+    Total kWh, kWh per golongan, total watt dan kWh setelah saran (total dan
+    per golongan) dijaga secara berjalan oleh setiap operasi tambah/ubah/hapus, sehingga
+    pembacaannya O(1).
+
+    Setiap peralatan mendapat id stabil yang tidak pernah dipakai ulang.
+    Array id -> baris (tabel alamat langsung, id berurutan) membuat ubah dan
+    hapus per id O(1); hapus memindahkan baris terakhir ke baris yang
+    dihapus (swap-remove). Indeks nama ternormalisasi -> id untuk deteksi
+    duplikat dibuat saat pertama dipakai lalu dijaga oleh setiap operasi.
+    """
+
+    def __init__(self, kapasitas=16):
+        """Inisialisasi array kosong dengan kapasitas awal"""
+        self._jumlah = 0
+        self._id = np.zeros(kapasitas, dtype=np.int64)
+        self._nama = np.empty(kapasitas, dtype=object)
+        self._unit = np.zeros(kapasitas, dtype=np.int64)
+        self._watt = np.zeros(kapasitas, dtype=np.float64)
+        self._jam_per_hari = np.zeros(kapasitas, dtype=np.float64)
+        self._kode_golongan = np.zeros(kapasitas, dtype=np.int8)
+        self._jam_mulai = np.zeros(kapasitas, dtype=np.float64)
+
+        # Indeks id
+        self._id_berikutnya = 0
+        self._baris_id = np.full(kapasitas, -1, dtype=np.int64)  # id -> baris, -1 bila sudah dihapus
+        self._indeks_nama = None  # Nama ternormalisasi -> set id, dibuat saat pertama dipakai
+
+        # Agregat berjalan
+        self.total_kwh = 0.0
+        self.total_kwh_saran = 0.0
+        self.total_watt_semua = 0.0
+        self.kwh_golongan = np.zeros(len(GOLONGAN), dtype=np.float64)
+        self.kwh_saran_golongan = np.zeros(len(GOLONGAN), dtype=np.float64)
+
+    def _pastikan_kapasitas(self, dibutuhkan):
+        """Memperbesar array (dua kali lipat) bila kapasitas tidak cukup"""
+        kapasitas = len(self._watt)
+        if dibutuhkan <= kapasitas:
+            return
+        while kapasitas < dibutuhkan:
+            kapasitas *= 2
+        for atribut in KOLOM_ARRAY:
+            lama = getattr(self, atribut)
+            baru = np.zeros(kapasitas, dtype=lama.dtype) if lama.dtype != object else np.empty(kapasitas, dtype=object)
+            baru[:self._jumlah] = lama[:self._jumlah]
+            setattr(self, atribut, baru)
+
+    def _pastikan_kapasitas_id(self, dibutuhkan):
+        """Memperbesar array id -> baris (dua kali lipat) bila kapasitas tidak cukup"""
+        kapasitas = len(self._baris_id)
+        if dibutuhkan <= kapasitas:
+            return
+        while kapasitas < dibutuhkan:
+            kapasitas *= 2
+        baru = np.full(kapasitas, -1, dtype=np.int64)
+        baru[:self._id_berikutnya] = self._baris_id[:self._id_berikutnya]
+        self._baris_id = baru
+
+    def salin(self):
+        """Membuat salinan tabel yang dapat diubah (array dan agregat ikut disalin)"""
+        salinan = TabelPeralatan.__new__(TabelPeralatan)
+        salinan._jumlah = self._jumlah
+        salinan._id_berikutnya = self._id_berikutnya
+        salinan._indeks_nama = None
+        for atribut in (*KOLOM_ARRAY, '_baris_id', 'kwh_golongan', 'kwh_saran_golongan'):
+            setattr(salinan, atribut, getattr(self, atribut).copy())
+        salinan.total_kwh = self.total_kwh
+        salinan.total_kwh_saran = self.total_kwh_saran
+        salinan.total_watt_semua = self.total_watt_semua
+        return salinan
+
+    def bekukan(self):
+        """Menjadikan seluruh array hanya-baca, perubahan berikutnya akan gagal"""
+        for atribut in (*KOLOM_ARRAY, '_baris_id', 'kwh_golongan', 'kwh_saran_golongan'):
+            getattr(self, atribut).flags.writeable = False
+
+    def potongan(self, awal, akhir):
+        """View hanya-baca baris awal..akhir (tanpa salinan array) untuk diproses per chunk.
+
+        Kolom dan kolom turunan tersedia, tetapi agregat berjalan tidak
+        (bernilai None) karena view tidak pernah diubah.
+        """
+        awal, akhir, _ = slice(awal, akhir).indices(self._jumlah)
+        view = TabelPeralatan.__new__(TabelPeralatan)
+        view._jumlah = max(akhir - awal, 0)
+        for atribut in KOLOM_ARRAY:
+            array = getattr(self, atribut)[awal:awal + view._jumlah]
+            array.flags.writeable = False
+            setattr(view, atribut, array)
+        view._id_berikutnya = view._baris_id = view._indeks_nama = None
+        view.total_kwh = view.total_kwh_saran = view.total_watt_semua = None
+        view.kwh_golongan = view.kwh_saran_golongan = None
+        return view
+
+    def pilih(self, indeks):
+        """Tabel hanya-baca berisi baris-baris indeks dalam urutan tersebut (mis. satu halaman tampilan).
+
+        Berbeda dengan potongan, kolomnya salinan kecil; agregat berjalan
+        juga bernilai None.
+        """
+        indeks = np.asarray(indeks, dtype=np.int64)
+        pilihan = TabelPeralatan.__new__(TabelPeralatan)
+        pilihan._jumlah = len(indeks)
+        for atribut in KOLOM_ARRAY:
+            array = getattr(self, atribut)[:self._jumlah][indeks]
+            array.flags.writeable = False
+            setattr(pilihan, atribut, array)
+        pilihan._id_berikutnya = pilihan._baris_id = pilihan._indeks_nama = None
+        pilihan.total_kwh = pilihan.total_kwh_saran = pilihan.total_watt_semua = None
+        pilihan.kwh_golongan = pilihan.kwh_saran_golongan = None
+        return pilihan
+
+    def tambah(self, nama, unit, watt, golongan, jam_per_hari, jam_mulai=JAM_MULAI_DEFAULT):
+        """Menambahkan satu peralatan ke akhir tabel dan mengembalikan indeksnya (id-nya: tabel.id[indeks])"""
+        if golongan not in KODE_GOLONGAN:
+            raise ValueError(f'Golongan listrik tidak dikenal: {golongan}')
+        self._pastikan_kapasitas(self._jumlah + 1)
+        self._pastikan_kapasitas_id(self._id_berikutnya + 1)
+        i = self._jumlah
+        id_baru = self._id_berikutnya
+        self._id[i] = id_baru
+        self._baris_id[id_baru] = i
+        self._id_berikutnya += 1
+        if self._indeks_nama is not None:
+            self._indeks_nama.setdefault(normalisasi_nama(nama), set()).add(id_baru)
+        self._nama[i] = nama
+        self._unit[i] = unit
+        self._watt[i] = watt
+        self._jam_per_hari[i] = jam_per_hari
+        self._kode_golongan[i] = KODE_GOLONGAN[golongan]
+        self._jam_mulai[i] = jam_mulai % 24
+        self._jumlah += 1
+        self._catat_kontribusi(i, 1)
+        return i
+
+    def tambah_banyak(self, nama, unit, watt, golongan, jam_per_hari, jam_mulai=None, id_peralatan=None):
+        """Menambahkan banyak peralatan sekaligus dari kolom-kolom (array/list) yang sama panjang.
+
+        golongan boleh berupa nama golongan ('R-1', ...) atau kode golongannya;
+        jam_mulai None berarti JAM_MULAI_DEFAULT untuk semua peralatan.
+        id_peralatan memberi id tertentu (mis. saat memuat dari penyimpanan):
+        harus unik dan belum pernah dipakai tabel ini; None berarti id baru berurutan.
+        """
+        nama = np.asarray(nama, dtype=object)
+        n = len(nama)
+        kode = np.asarray(golongan)
+        if kode.dtype.kind in 'iu':
+            kode = kode.astype(np.int8)
+            if n and (kode.min() < 0 or kode.max() >= len(GOLONGAN)):
+                raise ValueError('Kode golongan listrik di luar jangkauan')
+        else:
+            tidak_dikenal = ~np.isin(kode, GOLONGAN)
+            if tidak_dikenal.any():
+                raise ValueError(f'Golongan listrik tidak dikenal: {kode[tidak_dikenal][0]}')
+            nama_golongan = np.array(GOLONGAN)
+            urutan = np.argsort(nama_golongan)
+            kode = urutan[np.searchsorted(nama_golongan[urutan], kode.astype(str))].astype(np.int8)
+        kolom = {
+            '_nama': nama,
+            '_unit': np.asarray(unit, dtype=np.int64),
+            '_watt': np.asarray(watt, dtype=np.float64),
+            '_jam_per_hari': np.asarray(jam_per_hari, dtype=np.float64),
+            '_kode_golongan': kode,
+            '_jam_mulai': np.full(n, JAM_MULAI_DEFAULT) if jam_mulai is None
+            else np.asarray(jam_mulai, dtype=np.float64) % 24,
+        }
+        if any(len(nilai) != n for nilai in kolom.values()):
+            raise ValueError('Semua kolom peralatan harus sama panjang')
+        id_berikutnya = self._id_berikutnya + n
+        if id_peralatan is not None:
+            id_peralatan = np.asarray(id_peralatan, dtype=np.int64)
+            if len(id_peralatan) != n:
+                raise ValueError('Semua kolom peralatan harus sama panjang')
+            if n:
+                if id_peralatan.min() < self._id_berikutnya or len(np.unique(id_peralatan)) != n:
+                    raise ValueError('Id peralatan harus unik dan belum pernah dipakai')
+                id_berikutnya = int(id_peralatan.max()) + 1
+            else:
+                id_berikutnya = self._id_berikutnya
+
+        self._pastikan_kapasitas(self._jumlah + n)
+        self._pastikan_kapasitas_id(id_berikutnya)
+        awal, akhir = self._jumlah, self._jumlah + n
+        for atribut, nilai in kolom.items():
+            getattr(self, atribut)[awal:akhir] = nilai
+        self._jumlah = akhir
+
+        if id_peralatan is None:
+            # Id baru berurutan; array id diisi dari array id -> baris tanpa array sementara kedua
+            id_awal = self._id_berikutnya
+            baris_id = self._baris_id[id_awal:id_awal + n]
+            baris_id[:] = np.arange(awal, akhir)
+            self._id[awal:akhir] = baris_id
+            self._id[awal:akhir] += id_awal - awal
+        else:
+            self._id[awal:akhir] = id_peralatan
+            self._baris_id[id_peralatan] = np.arange(awal, akhir)
+        self._id_berikutnya = id_berikutnya
+        if self._indeks_nama is not None:
+            for id_baru, nama_baru in zip(self._id[awal:akhir].tolist(), nama.tolist()):
+                self._indeks_nama.setdefault(normalisasi_nama(nama_baru), set()).add(id_baru)
+
+        # Agregat berjalan diperbarui sekali untuk seluruh blok
+        total_watt = self._watt[awal:akhir] * self._unit[awal:akhir]
+        jam = self._jam_per_hari[awal:akhir]
+        jam_saran = np.where(np.isin(nama, PERALATAN_SELALU_NYALA), jam, np.minimum(jam, BATAS_JAM_SARAN))
+        kwh = total_watt / 1000 * jam * HARI_PER_BULAN
+        kwh_saran = total_watt / 1000 * jam_saran * HARI_PER_BULAN
+        self.total_kwh += float(kwh.sum())
+        self.total_kwh_saran += float(kwh_saran.sum())
+        self.total_watt_semua += float(total_watt.sum())
+        self.kwh_golongan += np.bincount(kode, weights=kwh, minlength=len(GOLONGAN))
+        self.kwh_saran_golongan += np.bincount(kode, weights=kwh_saran, minlength=len(GOLONGAN))
+        return np.arange(awal, akhir)
+
+    def ubah(self, i, nama=None, unit=None, watt=None, golongan=None, jam_per_hari=None, jam_mulai=None):
+        """Mengubah atribut peralatan ke-i, atribut yang None tidak diubah"""
+        i = self._indeks(i)
+        if golongan is not None and golongan not in KODE_GOLONGAN:
+            raise ValueError(f'Golongan listrik tidak dikenal: {golongan}')
+        self._catat_kontribusi(i, -1)
+        if nama is not None:
+            if self._indeks_nama is not None:
+                self._lepas_nama(i)
+                self._indeks_nama.setdefault(normalisasi_nama(nama), set()).add(int(self._id[i]))
+            self._nama[i] = nama
+        if unit is not None:
+            self._unit[i] = unit
+        if watt is not None:
+            self._watt[i] = watt
+        if golongan is not None:
+            self._kode_golongan[i] = KODE_GOLONGAN[golongan]
+        if jam_per_hari is not None:
+            self._jam_per_hari[i] = jam_per_hari
+        if jam_mulai is not None:
+            self._jam_mulai[i] = jam_mulai % 24
+        self._catat_kontribusi(i, 1)
+
+    def hapus(self, i):
+        """Menghapus peralatan ke-i dalam O(1): baris terakhir dipindah ke posisinya (swap-remove)"""
+        i = self._indeks(i)
+        self._catat_kontribusi(i, -1)
+        if self._indeks_nama is not None:
+            self._lepas_nama(i)
+        terakhir = self._jumlah - 1
+        id_hapus = int(self._id[i])
+        if i != terakhir:
+            for atribut in KOLOM_ARRAY:
+                array = getattr(self, atribut)
+                array[i] = array[terakhir]
+            self._baris_id[self._id[i]] = i
+        self._baris_id[id_hapus] = -1
+        self._jumlah = terakhir
+        self._nama[terakhir] = None
+        if self._jumlah == 0:
+            self._reset_agregat()
+
+    def _lepas_nama(self, i):
+        """Melepas id peralatan ke-i dari indeks nama"""
+        nama = normalisasi_nama(self._nama[i])
+        daftar_id = self._indeks_nama[nama]
+        daftar_id.discard(int(self._id[i]))
+        if not daftar_id:
+            del self._indeks_nama[nama]
+
+    # Akses per id
+    def baris_id(self, id_peralatan):
+        """Indeks baris peralatan ber-id tertentu dalam O(1); KeyError bila id tidak ada"""
+        if not 0 <= id_peralatan < self._id_berikutnya or self._baris_id[id_peralatan] < 0:
+            raise KeyError(f'Peralatan dengan id {id_peralatan} tidak ditemukan')
+        return int(self._baris_id[id_peralatan])
+
+    def ubah_id(self, id_peralatan, **perubahan):
+        """Mengubah peralatan ber-id tertentu (atribut seperti ubah)"""
+        self.ubah(self.baris_id(id_peralatan), **perubahan)
+
+    def hapus_id(self, id_peralatan):
+        """Menghapus peralatan ber-id tertentu dengan swap-remove"""
+        self.hapus(self.baris_id(id_peralatan))
+
+    def id_dengan_nama(self, nama):
+        """Id (terurut) semua peralatan yang namanya sama setelah normalisasi, untuk deteksi duplikat"""
+        if self._indeks_nama is None:
+            indeks_nama = {}
+            for id_peralatan, nama_peralatan in zip(self.id.tolist(), self.nama.tolist()):
+                indeks_nama.setdefault(normalisasi_nama(nama_peralatan), set()).add(id_peralatan)
+            self._indeks_nama = indeks_nama
+        return sorted(self._indeks_nama.get(normalisasi_nama(nama), ()))
+
+    def _indeks(self, i):
+        """Menormalkan indeks negatif dan memeriksa jangkauannya"""
+        if i < 0:
+            i += self._jumlah
+        if not 0 <= i < self._jumlah:
+            raise IndexError('indeks peralatan di luar jangkauan')
+        return i
+
+    def _catat_kontribusi(self, i, tanda):
+        """Menambah (tanda=1) atau mengurangi (tanda=-1) kontribusi peralatan ke-i pada agregat berjalan"""
+        total_watt = float(self._watt[i] * self._unit[i])
+        jam = float(self._jam_per_hari[i])
+        jam_saran = jam if self._nama[i] in PERALATAN_SELALU_NYALA else min(jam, BATAS_JAM_SARAN)
+        kwh = total_watt / 1000 * jam * HARI_PER_BULAN
+        kwh_saran = total_watt / 1000 * jam_saran * HARI_PER_BULAN
+        self.total_kwh += tanda * kwh
+        self.total_kwh_saran += tanda * kwh_saran
+        self.total_watt_semua += tanda * total_watt
+        self.kwh_golongan[self._kode_golongan[i]] += tanda * kwh
+        self.kwh_saran_golongan[self._kode_golongan[i]] += tanda * kwh_saran
+
+    def _reset_agregat(self):
+        """Mengosongkan agregat berjalan (menghapus sisa galat pembulatan)"""
+        self.total_kwh = 0.0
+        self.total_kwh_saran = 0.0
+        self.total_watt_semua = 0.0
+        self.kwh_golongan[:] = 0.0
+        self.kwh_saran_golongan[:] = 0.0
+
+    def hitung_ulang_agregat(self):
+        """Menghitung ulang seluruh agregat dari array (tanpa mengubah agregat berjalan)"""
+        return {
+            'total_kwh': float(self.kwh_per_bulan().sum()),
+            'total_kwh_saran': float(self.kwh_saran_per_bulan().sum()),
+            'total_watt_semua': float(self.total_watt().sum()),
+            'kwh_golongan': self.kwh_per_golongan(),
+            'kwh_saran_golongan': self.kwh_saran_per_golongan(),
+        }
+
+    def verifikasi_agregat(self, rtol=1e-9, atol=1e-6):
+        """Memeriksa apakah agregat berjalan sama dengan hasil hitung ulang penuh"""
+        ulang = self.hitung_ulang_agregat()
+        return bool(
+            np.isclose(self.total_kwh, ulang['total_kwh'], rtol=rtol, atol=atol)
+            and np.isclose(self.total_kwh_saran, ulang['total_kwh_saran'], rtol=rtol, atol=atol)
+            and np.isclose(self.total_watt_semua, ulang['total_watt_semua'], rtol=rtol, atol=atol)
+            and np.allclose(self.kwh_golongan, ulang['kwh_golongan'], rtol=rtol, atol=atol)
+            and np.allclose(self.kwh_saran_golongan, ulang['kwh_saran_golongan'], rtol=rtol, atol=atol)
+        )
+
+    # Kolom (view tanpa salinan)
+    @property
+    def id(self):
+        return self._id[:self._jumlah]
+
+    @property
+    def nama(self):
+        return self._nama[:self._jumlah]
+
+    @property
+    def unit(self):
+        return self._unit[:self._jumlah]
+
+    @property
+    def watt(self):
+        return self._watt[:self._jumlah]
+
+    @property
+    def jam_per_hari(self):
+        return self._jam_per_hari[:self._jumlah]
+
+    @property
+    def kode_golongan(self):
+        return self._kode_golongan[:self._jumlah]
+
+    @property
+    def jam_mulai(self):
+        return self._jam_mulai[:self._jumlah]
+
+    @property
+    def golongan(self):
+        return np.array(GOLONGAN, dtype=object)[self.kode_golongan]
+
+    # Kolom turunan
+    def total_watt(self):
+        """Total daya (watt) per peralatan"""
+        return self.watt * self.unit
+
+    def kwh_per_jam(self):
+        """Konsumsi listrik per jam (kWh) per peralatan"""
+        return self.total_watt() / 1000
+
+    def kwh_per_bulan(self):
+        """Konsumsi listrik per bulan (kWh) per peralatan"""
+        return self.kwh_per_jam() * self.jam_per_hari * HARI_PER_BULAN
+
+    def kwh_per_golongan(self):
+        """Konsumsi listrik per bulan (kWh) dikelompokkan menurut golongan"""
+        return np.bincount(self.kode_golongan, weights=self.kwh_per_bulan(), minlength=len(GOLONGAN))
+
+    def jam_saran(self):
+        """Saran jam penggunaan per hari untuk setiap peralatan"""
+        selalu_nyala = np.isin(self.nama, PERALATAN_SELALU_NYALA)
+        return np.where(selalu_nyala, self.jam_per_hari, np.minimum(self.jam_per_hari, BATAS_JAM_SARAN))
+
+    def kwh_saran_per_bulan(self):
+        """Konsumsi listrik per bulan (kWh) per peralatan bila mengikuti saran"""
+        return self.kwh_per_jam() * self.jam_saran() * HARI_PER_BULAN
+
+    def kwh_saran_per_golongan(self):
+        """Konsumsi listrik per bulan (kWh) setelah saran, dikelompokkan menurut golongan"""
+        return np.bincount(self.kode_golongan, weights=self.kwh_saran_per_bulan(), minlength=len(GOLONGAN))
+
+    # Tampilan dict seperti daftar peralatan lama
+    def baris(self, i):
+        """Mengembalikan peralatan ke-i sebagai dict"""
+        i = self._indeks(i)
+        return {
+            'id': int(self._id[i]),
+            'nama': self._nama[i],
+            'unit': int(self._unit[i]),
+            'watt': float(self._watt[i]),
+            'total_watt': float(self._watt[i] * self._unit[i]),
+            'golongan': GOLONGAN[self._kode_golongan[i]],
+            'jam_per_hari': float(self._jam_per_hari[i]),
+            'jam_mulai': float(self._jam_mulai[i]),
+        }
+
+    def __getitem__(self, i):
+        return self.baris(i)
+
+    def __iter__(self):
+        for i in range(self._jumlah):
+            yield self.baris(i)
+
+    def __len__(self):
+        return self._jumlah
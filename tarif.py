@@ -0,0 +1,151 @@
+import numpy as np
+
+
+class DefinisiTarif:
+    """Definisi tarif listrik: blok konsumsi, jendela waktu pakai, biaya minimum, abonemen dan pajak.
+
+    Semua perhitungan menerima array, sehingga ribuan rumah tangga (atau
+    matriks beban per jam) dihargai dalam satu lintasan vektor.
+
+    blok         -- urutan (batas_atas_kwh, harga_per_kwh); batas terakhir None (tak terbatas)
+    waktu_pakai  -- urutan (jam_mulai, jam_selesai, harga_per_kwh) untuk jendela [mulai, selesai),
+                    boleh melewati tengah malam; kWh di luar jendela dihargai dengan blok
+    biaya_minimum -- tagihan energi minimum per bulan (Rp)
+    abonemen     -- biaya tetap per bulan (Rp)
+    pajak        -- persentase pajak atas tagihan (mis. 0.03 untuk 3%)
+    """
+
+    def __init__(self, nama, blok, waktu_pakai=(), biaya_minimum=0.0, abonemen=0.0, pajak=0.0):
+        """Inisialisasi dan validasi definisi tarif"""
+        if not blok:
+            raise ValueError('Tarif harus memiliki minimal satu blok')
+        batas = [np.inf if batas_atas is None else float(batas_atas) for batas_atas, _ in blok]
+        if batas[-1] != np.inf:
+            raise ValueError('Batas blok terakhir harus None (tak terbatas)')
+        if any(b <= a for a, b in zip(batas, batas[1:])):
+            raise ValueError('Batas blok harus naik')
+
+        self.nama = nama
+        self.blok = tuple((batas_atas, float(harga)) for batas_atas, harga in blok)
+        self.waktu_pakai = tuple((int(mulai), int(selesai), float(harga)) for mulai, selesai, harga in waktu_pakai)
+        self.biaya_minimum = float(biaya_minimum)
+        self.abonemen = float(abonemen)
+        self.pajak = float(pajak)
+
+        self._batas_atas = np.array(batas)
+        self._batas_bawah = np.concatenate([[0.0], self._batas_atas[:-1]])
+        self._harga_blok = np.array([harga for _, harga in self.blok])
+
+        # Harga per jam dalam sehari, NaN untuk jam yang dihargai dengan blok
+        self._harga_jam = np.full(24, np.nan)
+        for mulai, selesai, harga in self.waktu_pakai:
+            jam = np.arange(mulai, selesai if selesai > mulai else selesai + 24) % 24
+            self._harga_jam[jam] = harga
+
+    @classmethod
+    def flat(cls, nama, harga):
+        """Tarif satu harga per kWh tanpa komponen lain"""
+        return cls(nama, [(None, harga)])
+
+    def ke_dict(self):
+        """Isi definisi sebagai dict siap JSON (kebalikan dari_dict)"""
+        return {
+            'nama': self.nama,
+            'blok': [list(blok) for blok in self.blok],
+            'waktu_pakai': [list(jendela) for jendela in self.waktu_pakai],
+            'biaya_minimum': self.biaya_minimum,
+            'abonemen': self.abonemen,
+            'pajak': self.pajak,
+        }
+
+    @classmethod
+    def dari_dict(cls, data):
+        """Definisi tarif dari dict hasil ke_dict"""
+        return cls(**data)
+
+    def kunci(self):
+        """Tuple yang mewakili seluruh isi definisi (untuk kunci cache)"""
+        return (self.nama, self.blok, self.waktu_pakai, self.biaya_minimum, self.abonemen, self.pajak)
+
+    def biaya_energi_blok(self, kwh):
+        """Biaya energi menurut blok konsumsi untuk array kWh (bentuk apa pun)"""
+        kwh = np.asarray(kwh, dtype=np.float64)
+        lebar = self._batas_atas - self._batas_bawah
+        dalam_blok = np.clip(kwh[..., None] - self._batas_bawah, 0.0, lebar)
+        return dalam_blok @ self._harga_blok
+
+    def harga_marginal(self, kwh):
+        """Harga blok (Rp/kWh, termasuk pajak) untuk kWh berikutnya pada konsumsi kwh"""
+        kwh = np.asarray(kwh, dtype=np.float64)
+        blok = np.minimum(np.searchsorted(self._batas_atas, kwh, side='right'), len(self._harga_blok) - 1)
+        return self._harga_blok[blok] * (1 + self.pajak)
+
+    def rincian(self, kwh, biaya_energi=None):
+        """Rincian tagihan (energi, penyesuaian minimum, abonemen, pajak, total) untuk array kWh"""
+        kwh = np.asarray(kwh, dtype=np.float64)
+        energi = self.biaya_energi_blok(kwh) if biaya_energi is None else np.asarray(biaya_energi, dtype=np.float64)
+        penyesuaian_minimum = np.maximum(self.biaya_minimum - energi, 0.0)
+        sebelum_pajak = energi + penyesuaian_minimum + self.abonemen
+        pajak = sebelum_pajak * self.pajak
+        return {
+            'energi': energi,
+            'penyesuaian_minimum': penyesuaian_minimum,
+            'abonemen': np.full_like(energi, self.abonemen),
+            'pajak': pajak,
+            'total': sebelum_pajak + pajak,
+        }
+
+    def hitung(self, kwh):
+        """Total tagihan untuk array kWh per bulan (tanpa data per jam, jendela waktu tidak berlaku)"""
+        return self.rincian(kwh)['total']
+
+    def rincian_beban_per_jam(self, beban, jam_awal=0):
+        """Rincian tagihan untuk matriks beban kWh per jam berbentuk (..., jumlah_jam).
+
+        Jam ke-t dianggap jam (jam_awal + t) % 24. kWh pada jendela waktu pakai
+        dihargai dengan harga jendelanya, sisanya dihargai dengan blok.
+        """
+        beban = np.asarray(beban, dtype=np.float64)
+        harga = self._harga_jam[(jam_awal + np.arange(beban.shape[-1])) % 24]
+        dalam_jendela = ~np.isnan(harga)
+        biaya_jendela = beban[..., dalam_jendela] @ harga[dalam_jendela]
+        kwh_blok = beban[..., ~dalam_jendela].sum(axis=-1)
+        energi = biaya_jendela + self.biaya_energi_blok(kwh_blok)
+        return self.rincian(beban.sum(axis=-1), biaya_energi=energi)
+
+    def hitung_beban_per_jam(self, beban, jam_awal=0):
+        """Total tagihan untuk matriks beban kWh per jam berbentuk (..., jumlah_jam)"""
+        return self.rincian_beban_per_jam(beban, jam_awal)['total']
+
+    def rincian_bentuk_jam(self, kwh, bentuk_jam=None):
+        """Rincian tagihan untuk array kWh per bulan yang tersebar ke 24 jam sehari mengikuti bentuk_jam.
+
+        bentuk_jam berbentuk (..., 24), mis. kWh per jam dari jadwal peralatan;
+        hanya proporsinya yang dipakai. Tanpa jendela waktu pakai, tanpa
+        bentuk, atau bila bentuknya nol, seluruh kWh dihargai dengan blok.
+        """
+        kwh = np.asarray(kwh, dtype=np.float64)
+        if not self.waktu_pakai or bentuk_jam is None:
+            return self.rincian(kwh)
+        bentuk_jam = np.asarray(bentuk_jam, dtype=np.float64)
+        total = bentuk_jam.sum(axis=-1)
+        per_jam = self.rincian_beban_per_jam(bentuk_jam * (kwh / np.where(total > 0, total, 1.0))[..., None])
+        blok = self.rincian(kwh)
+        return {nama: np.where(total > 0, nilai, blok[nama]) for nama, nilai in per_jam.items()}
+
+
+def hitung_tagihan_golongan(daftar_definisi, kwh_golongan, beban_jam=None):
+    """Total tagihan untuk array kWh berbentuk (..., golongan), satu definisi per golongan.
+
+    beban_jam berbentuk (..., golongan, 24) memberi bentuk beban harian per
+    golongan sehingga jendela waktu pakai ikut dihargai (lihat
+    DefinisiTarif.rincian_bentuk_jam). Golongan tanpa konsumsi tidak ditagih
+    (tanpa minimum maupun abonemen).
+    """
+    kwh_golongan = np.asarray(kwh_golongan, dtype=np.float64)
+    tagihan = np.zeros(kwh_golongan.shape[:-1])
+    for kode, definisi in enumerate(daftar_definisi):
+        kwh = kwh_golongan[..., kode]
+        bentuk = None if beban_jam is None else np.asarray(beban_jam)[..., kode, :]
+        tagihan = tagihan + np.where(kwh > 0, definisi.rincian_bentuk_jam(kwh, bentuk)['total'], 0.0)
+    return tagihan
@@ -0,0 +1,15 @@
+import numpy as np
+
+from anomali import DetektorAnomali
+
+
+def test_perbarui_dan_perbarui_satu_sama_pada_seri_konstan():
+    vektor, skalar = DetektorAnomali(), DetektorAnomali()
+    nilai = [5.0] * 10 + [5.5, 5.0]
+    for x in nilai:
+        skor_vektor, anomali_vektor = vektor.perbarui(x)
+        skor_skalar, anomali_skalar = skalar.perbarui_satu(x)
+        assert skor_vektor[0] == skor_skalar
+        assert anomali_vektor[0] == anomali_skalar
+    assert np.array_equal(vektor.jumlah, skalar.jumlah)
+    assert np.allclose(vektor.rata_rata, skalar.rata_rata)
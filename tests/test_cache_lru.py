@@ -0,0 +1,22 @@
+from cache_lru import CacheLRU
+
+
+def test_entri_versi_lama_dibuang_saat_versi_berubah():
+    cache = CacheLRU(kapasitas=32)
+    cache.ambil(('a', 1), lambda: 'a1', versi=('versi', 1))
+    cache.ambil(('b', 1), lambda: 'b1', versi=('versi', 1))
+    cache.ambil('tanpa-versi', lambda: 'x')
+    assert len(cache) == 3
+
+    cache.ambil(('a', 2), lambda: 'a2', versi=('versi', 2))
+    assert len(cache) == 2
+    assert cache.ambil('tanpa-versi', lambda: 'baru') == 'x'
+
+
+def test_kapasitas_tetap_dibatasi():
+    cache = CacheLRU(kapasitas=2)
+    for i in range(5):
+        cache.ambil(i, lambda: i, versi=('versi', 0))
+    assert len(cache) == 2
+    cache.ambil('baru', lambda: 0, versi=('versi', 1))
+    assert len(cache) == 1
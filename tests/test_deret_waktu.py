@@ -0,0 +1,23 @@
+import numpy as np
+
+from deret_waktu import DETIK_PER_HARI, DETIK_PER_JAM, DETIK_PER_MENIT, DeretWaktu
+
+
+def test_kueri_memakai_rollup_menit_walau_bacaan_mulai_setelah_tengah_malam():
+    deret = DeretWaktu()
+    awal = deret.per_hari.waktu_awal(20000) + 10 * DETIK_PER_JAM
+    waktu = awal + np.arange(3 * 24 * 60) * DETIK_PER_MENIT
+    deret.tambah_bacaan_banyak(waktu, np.full(len(waktu), 0.01))
+
+    _, kwh, resolusi = deret.kueri(jumlah_titik=10 ** 6)
+    assert resolusi == DETIK_PER_MENIT
+    assert np.isclose(kwh.sum(), 0.01 * len(waktu))
+
+
+def test_kueri_memakai_rollup_hari_untuk_hari_yang_hanya_punya_total_harian():
+    deret = DeretWaktu()
+    deret.tambah_harian(np.arange(20000, 20003), [10.0, 11.0, 12.0])
+    deret.tambah_bacaan(deret.per_hari.waktu_awal(20003) + DETIK_PER_JAM, 0.5)
+
+    _, _, resolusi = deret.kueri()
+    assert resolusi == DETIK_PER_HARI
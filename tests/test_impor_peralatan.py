@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+from impor_peralatan import impor_peralatan
+from monitor_listrik import buat_monitor_default
+
+CSV = """nama,unit,watt,golongan,jam_per_hari
+Dispenser,1,350,R-1,10
+kulkas,1,150,R-1,24
+Pompa  Air,1,250,R-1,2
+pompa air,1,250,R-1,2
+TV,0,100,R-1,5
+"""
+
+
+def test_impor_menolak_nama_duplikat():
+    monitor = buat_monitor_default()
+    jumlah_awal = len(monitor.peralatan)
+    hasil = impor_peralatan(monitor, io.StringIO(CSV), format='csv', tolak_duplikat=True)
+
+    assert hasil['jumlah_diimpor'] == 2
+    assert len(monitor.peralatan) == jumlah_awal + 2
+    ditolak = hasil['ditolak'].set_index('baris')['alasan'].to_dict()
+    assert ditolak == {
+        2: 'nama sudah dipakai peralatan lain',
+        4: 'nama sudah dipakai peralatan lain',
+        5: 'unit harus bilangan bulat >= 1',
+    }
+
+
+def test_impor_default_mempertahankan_nama_berulang():
+    monitor = buat_monitor_default()
+    hasil = impor_peralatan(monitor, io.StringIO(CSV + 'Lampu LED,4,9,R-1,6\n'), format='csv')
+    assert hasil['jumlah_diimpor'] == 5
+    assert len(monitor.cari_peralatan('Lampu LED')) == 2
+
+
+def test_tambah_banyak_dengan_tolak_duplikat():
+    monitor = buat_monitor_default()
+    jumlah_awal = len(monitor.peralatan)
+    with pytest.raises(ValueError):
+        monitor.tambah_peralatan_banyak(['Dispenser', 'dispenser'], [1, 1], [350, 350], ['R-1', 'R-1'], [10, 10],
+                                        tolak_duplikat=True)
+    assert len(monitor.peralatan) == jumlah_awal
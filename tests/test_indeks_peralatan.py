@@ -0,0 +1,20 @@
+from monitor_listrik import buat_monitor_default
+
+
+def test_indeks_bertahan_saat_bacaan_meter_dan_dibuat_ulang_saat_peralatan_berubah():
+    monitor = buat_monitor_default()
+    indeks = monitor.indeks_peralatan()
+    indeks.urutan('nama')
+    monitor.tambah_bacaan_meter(monitor.penggunaan.per_hari.waktu_awal(monitor.penggunaan.hari_ini()), 1.0)
+    assert monitor.indeks_peralatan() is indeks
+
+    monitor.hapus_peralatan(int(monitor.peralatan.id[0]))
+    assert monitor.indeks_peralatan() is not indeks
+
+
+def test_urutan_ditambahkan_mengikuti_id_setelah_hapus():
+    monitor = buat_monitor_default()
+    monitor.hapus_peralatan(int(monitor.peralatan.id[1]))
+    baris, _ = monitor.indeks_peralatan().kueri(urut='indeks', ukuran_halaman=100)
+    id_urut = monitor.peralatan.id[baris].tolist()
+    assert id_urut == sorted(id_urut)
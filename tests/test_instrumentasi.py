@@ -0,0 +1,21 @@
+import instrumentasi
+
+
+def test_rentang_main_masuk_tahapnya_sendiri():
+    perekam = instrumentasi.mulai_rerun()
+    with instrumentasi.rentang('app.halaman'):
+        with instrumentasi.rentang('st.dataframe'):
+            pass
+    with instrumentasi.rentang('app.simpan_monitor'):
+        pass
+    ringkasan = instrumentasi.selesai_rerun(perekam, None)
+
+    assert [catatan['nama'] for catatan in ringkasan['rentang']] == ['app.halaman', 'st.dataframe', 'app.simpan_monitor']
+    assert ringkasan['tahap_ms']['halaman'] > 0
+    assert ringkasan['tahap_ms']['simpan'] > 0
+    assert ringkasan['halaman'] is None
+
+
+def test_rentang_tanpa_perekam_tidak_berefek():
+    with instrumentasi.rentang('app.halaman'):
+        pass
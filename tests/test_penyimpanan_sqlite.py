@@ -0,0 +1,137 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from monitor_listrik import MonitorListrik, buat_monitor_default
+from penyimpanan_sqlite import PenyimpananSQLite
+from tarif import DefinisiTarif
+
+
+def test_penggunaan_sampel_tersimpan_dan_diganti_bacaan_meter(tmp_path):
+    monitor = MonitorListrik()
+    monitor.tambah_peralatan('Kulkas', 1, 150, 'R-1', 24)
+    monitor.tambah_peralatan('TV', 1, 100, 'R-1', 5)
+    hari_ini = monitor.penggunaan.hari_ini()
+    assert monitor.penggunaan_sampel
+    assert monitor.penggunaan.hari_terakhir() <= hari_ini
+
+    penyimpanan = PenyimpananSQLite(str(tmp_path / 'monitor.db'))
+    penyimpanan.simpan_monitor('rumah', monitor)
+    dimuat = penyimpanan.muat_monitor('rumah')
+    penyimpanan.tutup()
+    assert dimuat.penggunaan_sampel
+
+    dimuat.tambah_bacaan_meter(int(dimuat.penggunaan.per_hari.waktu_awal(hari_ini)) + 3600, 1.0)
+    hari, penggunaan = dimuat.penggunaan.harian()
+    assert len(hari) == 1 and penggunaan[0] == 1.0
+
+
+def test_id_peralatan_tetap_setelah_dimuat_ulang(tmp_path):
+    monitor = buat_monitor_default()
+    monitor.hapus_peralatan(int(monitor.peralatan.id[2]))
+    id_baru = monitor.tambah_peralatan('Dispenser', 1, 350, 'R-1', 10)
+    id_sebelum = dict(zip(monitor.peralatan.id.tolist(), monitor.peralatan.nama.tolist()))
+
+    penyimpanan = PenyimpananSQLite(str(tmp_path / 'monitor.db'))
+    penyimpanan.simpan_monitor('rumah', monitor)
+    dimuat = penyimpanan.muat_monitor('rumah')
+    penyimpanan.tutup()
+
+    assert dict(zip(dimuat.peralatan.id.tolist(), dimuat.peralatan.nama.tolist())) == id_sebelum
+    assert dimuat.cari_peralatan('Dispenser') == [id_baru]
+    assert dimuat.tambah_peralatan('Kompor Listrik', 1, 1200, 'R-1', 2) == id_baru + 1
+    assert dimuat.verifikasi_agregat()
+
+
+def test_migrasi_memberi_id_peralatan_lama(tmp_path):
+    path = str(tmp_path / 'lama.db')
+    koneksi = sqlite3.connect(path)
+    koneksi.executescript("""
+        CREATE TABLE rumah_tangga (id TEXT PRIMARY KEY, tarif_terpilih TEXT NOT NULL DEFAULT 'R-1');
+        CREATE TABLE peralatan (
+            id INTEGER PRIMARY KEY, rumah_tangga TEXT NOT NULL, nama TEXT NOT NULL, unit INTEGER NOT NULL,
+            watt REAL NOT NULL, golongan TEXT NOT NULL, jam_per_hari REAL NOT NULL
+        );
+        INSERT INTO rumah_tangga VALUES ('a', 'R-1'), ('b', 'R-1');
+        INSERT INTO peralatan (rumah_tangga, nama, unit, watt, golongan, jam_per_hari) VALUES
+            ('a', 'Kulkas', 1, 150, 'R-1', 24), ('b', 'TV', 1, 100, 'R-1', 5), ('a', 'Lampu', 2, 10, 'R-1', 12);
+    """)
+    koneksi.close()
+
+    penyimpanan = PenyimpananSQLite(path)
+    penyimpanan.simpan_peralatan('a', ['Kipas'], [1], [50], ['R-1'], [8])
+    dimuat = penyimpanan.muat_monitor('a')
+    penyimpanan.tutup()
+    assert dimuat.peralatan.id.tolist() == [0, 1, 2]
+    assert dimuat.peralatan.nama.tolist() == ['Kulkas', 'Lampu', 'Kipas']
+
+
+def _isi(monitor):
+    hari, penggunaan = monitor.penggunaan.harian()
+    return (
+        sorted(zip(monitor.peralatan.id.tolist(), monitor.peralatan.nama.tolist(), monitor.peralatan.watt.tolist())),
+        hari.tolist(), penggunaan.tolist(), monitor.kunci_tarif(), monitor.penggunaan_sampel,
+    )
+
+
+def test_simpan_inkremental_hanya_menulis_yang_berubah(tmp_path):
+    penyimpanan = PenyimpananSQLite(str(tmp_path / 'monitor.db'))
+    monitor = buat_monitor_default()
+    for i in range(500):
+        monitor.tambah_peralatan(f'Lampu {i}', 1, 10, 'R-1', 5)
+    penyimpanan.simpan_monitor('rumah', monitor)
+
+    monitor = penyimpanan.muat_monitor('rumah')
+    id_awal = int(monitor.peralatan.id[0])
+    monitor.ubah_peralatan(id_awal, watt=900)
+    monitor.hapus_peralatan(int(monitor.peralatan.id[5]))
+    monitor.tambah_peralatan('Dispenser', 1, 350, 'R-2', 10)
+    monitor.atur_definisi_tarif('R-1', DefinisiTarif('R-1', [(None, 1500)], waktu_pakai=[(17, 22, 5000)]))
+    hari_ini = monitor.penggunaan.hari_ini()
+    waktu_awal = int(monitor.penggunaan.per_hari.waktu_awal(hari_ini))
+    monitor.tambah_bacaan_meter([waktu_awal + 60, waktu_awal - 86400 * 3], [1.0, 2.0])  # Hari pertama mengganti sampel
+
+    sebelum = penyimpanan._koneksi.total_changes
+    penyimpanan.simpan_monitor('rumah', monitor)
+    ditulis = penyimpanan._koneksi.total_changes - sebelum
+    assert ditulis < 100  # Peralatan dan hari yang berubah, tarif, dan baris sampel yang dihapus; bukan 515 peralatan
+
+    monitor.ubah_peralatan(id_awal, jam_per_hari=3)
+    monitor.tambah_bacaan_meter(waktu_awal + 120, 0.5)
+    sebelum = penyimpanan._koneksi.total_changes
+    penyimpanan.simpan_monitor('rumah', monitor)
+    assert penyimpanan._koneksi.total_changes - sebelum < 10
+
+    dimuat = penyimpanan.muat_monitor('rumah')
+    penyimpanan.tutup()
+    assert _isi(dimuat) == _isi(monitor)
+    assert dimuat.tarif_lanjutan['R-1'].waktu_pakai == ((17, 22, 5000.0),)
+    assert dimuat.hitung_estimasi_biaya() == monitor.hitung_estimasi_biaya()
+
+
+def test_estimasi_biaya_sql_memakai_tarif_lanjutan(tmp_path):
+    monitor = buat_monitor_default()
+    monitor.atur_definisi_tarif(
+        'R-1', DefinisiTarif('R-1', [(100, 1000), (None, 1500)], waktu_pakai=[(17, 22, 3000)], abonemen=20000)
+    )
+    penyimpanan = PenyimpananSQLite(str(tmp_path / 'monitor.db'))
+    penyimpanan.simpan_monitor('rumah', monitor)
+    biaya = penyimpanan.hitung_estimasi_biaya('rumah')
+    penyimpanan.tutup()
+    assert np.isclose(biaya, monitor.hitung_estimasi_biaya())
+
+
+def test_dua_penulis_menambah_peralatan_tidak_saling_menimpa(tmp_path):
+    penyimpanan = PenyimpananSQLite(str(tmp_path / 'monitor.db'))
+    penyimpanan.simpan_monitor('rumah', buat_monitor_default())
+    pertama, kedua = penyimpanan.muat_monitor('rumah'), penyimpanan.muat_monitor('rumah')
+    pertama.tambah_peralatan('Dispenser', 1, 350, 'R-1', 10)
+    kedua.tambah_peralatan('Kompor Listrik', 1, 1200, 'R-1', 2)
+
+    penyimpanan.simpan_monitor('rumah', pertama)
+    with pytest.raises(sqlite3.IntegrityError):
+        penyimpanan.simpan_monitor('rumah', kedua)
+    dimuat = penyimpanan.muat_monitor('rumah')
+    penyimpanan.tutup()
+    assert _isi(dimuat) == _isi(pertama)
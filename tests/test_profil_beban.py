@@ -0,0 +1,26 @@
+import numpy as np
+
+from monitor_listrik import buat_monitor_default
+from profil_beban import hitung_beban_golongan, matriks_beban
+from tabel_peralatan import GOLONGAN
+
+
+def test_beban_golongan_per_chunk_sama_dengan_matriks_penuh():
+    monitor = buat_monitor_default()
+    peralatan = monitor.peralatan
+    peralatan.ubah(3, golongan='R-2')
+    peralatan.ubah(7, golongan='R-3', jam_mulai=23.5)
+    matriks = matriks_beban(peralatan)
+    penuh = np.array([matriks[peralatan.kode_golongan == kode].sum(axis=0) for kode in range(len(GOLONGAN))])
+    assert np.allclose(hitung_beban_golongan(peralatan, ukuran_chunk=4), penuh)
+
+
+def test_beban_golongan_tidak_dihitung_ulang_saat_bacaan_meter_atau_tarif_berubah():
+    monitor = buat_monitor_default()
+    beban = monitor.beban_golongan()
+    monitor.tambah_bacaan_meter(monitor.penggunaan.per_hari.waktu_awal(monitor.penggunaan.hari_ini()), 1.0)
+    monitor.ubah_tarif_listrik('R-1', 1700)
+    assert monitor.beban_golongan() is beban
+
+    monitor.ubah_peralatan(int(monitor.peralatan.id[0]), jam_per_hari=12)
+    assert monitor.beban_golongan() is not beban
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+import skenario
+from monitor_listrik import buat_monitor_default
+
+
+def test_skenario_hanya_menghitung_peralatan_yang_disentuh():
+    monitor = buat_monitor_default()
+    monitor.tambah_peralatan('AC Kamar', 1, 900, 'R-2', 6, 21)
+    hasil = monitor.sapu_skenario(
+        golongan=(None, 'R-3'), perubahan_jam={'AC': [0, -2]}, penggantian_watt={'Lampu LED': [20, 9]}
+    )
+    kwh_sekarang = monitor.peralatan.kwh_golongan.sum()
+    assert np.isclose(hasil['total_kwh'][0], kwh_sekarang)
+    assert np.isclose(hasil['biaya'][0], monitor.hitung_estimasi_biaya())
+
+    # Golongan R-3, AC dikurangi 2 jam, lampu diganti 9 W: semua kWh pindah ke R-3
+    terakhir = len(hasil['biaya']) - 1
+    kwh = kwh_sekarang - 2 * 2000 / 1000 * 30 - 5 * (20 - 9) / 1000 * 12 * 30
+    assert np.isclose(hasil['total_kwh'][terakhir], kwh)
+    assert np.isclose(hasil['biaya'][terakhir], kwh * monitor.tarif_listrik['R-3'])
+    assert np.isclose(hasil['kehilangan_kenyamanan'][terakhir], 2.0)
+
+
+def test_skenario_dibatasi_kombinasi_kali_peralatan(monkeypatch):
+    monitor = buat_monitor_default()
+    monkeypatch.setattr(skenario, 'BATAS_SEL', 3)
+    monitor.sapu_skenario(perubahan_jam={'AC': [0, -1, -2]})
+    with pytest.raises(ValueError):
+        monitor.sapu_skenario(perubahan_jam={'AC': [0, -1, -2], 'TV LED': [0, -1]})
@@ -0,0 +1,31 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_spec = importlib.util.spec_from_file_location('bench_startup', os.path.join(AKAR, 'benchmark', 'bench_startup.py'))
+bench_startup = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench_startup)
+
+# Anggaran longgar untuk mesin CI yang lambat atau sibuk; bench_startup.py memakai anggaran ketat
+KELONGGARAN = 3
+
+
+def test_impor_app_tidak_memuat_modul_berat():
+    kode = (
+        f'import json, sys; sys.path.insert(0, {AKAR!r}); import app; '
+        f'print(json.dumps([nama for nama in {bench_startup.MODUL_BERAT!r} if nama in sys.modules]))'
+    )
+    keluaran = subprocess.run([sys.executable, '-c', kode], capture_output=True, text=True, check=True, cwd=AKAR)
+    assert json.loads(keluaran.stdout.strip().splitlines()[-1]) == []
+
+
+def test_cold_start_dalam_anggaran():
+    hasil = bench_startup.ukur(bench_startup.HALAMAN_DEFAULT, 1)
+    _, pelanggaran = bench_startup.periksa(
+        hasil, bench_startup.ANGGARAN_IMPOR_DETIK * KELONGGARAN, bench_startup.ANGGARAN_RENDER_DETIK * KELONGGARAN
+    )
+    assert pelanggaran == []
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from tabel_peralatan import GOLONGAN, TabelPeralatan
+
+NAMA = ('Kulkas', 'AC', 'Lampu LED', 'TV LED', 'Kamera Pengawas', 'Setrika')
+
+
+def _tambah_acak(tabel, rng):
+    return tabel.tambah(
+        str(rng.choice(NAMA)), int(rng.integers(1, 5)), float(rng.uniform(5, 3000)),
+        str(rng.choice(GOLONGAN)), float(rng.uniform(0.1, 24)), float(rng.uniform(0, 24))
+    )
+
+
+def _tambah_banyak_acak(tabel, rng):
+    n = int(rng.integers(0, 40))
+    return tabel.tambah_banyak(
+        rng.choice(NAMA, n), rng.integers(1, 5, n), rng.uniform(5, 3000, n),
+        rng.choice(GOLONGAN, n), rng.uniform(0.1, 24, n), rng.uniform(0, 24, n)
+    )
+
+
+def _ubah_acak(tabel, rng):
+    perubahan = {
+        'nama': str(rng.choice(NAMA)),
+        'unit': int(rng.integers(1, 5)),
+        'watt': float(rng.uniform(5, 3000)),
+        'golongan': str(rng.choice(GOLONGAN)),
+        'jam_per_hari': float(rng.uniform(0.1, 24)),
+    }
+    dipilih = rng.choice(list(perubahan), int(rng.integers(1, len(perubahan) + 1)), replace=False)
+    tabel.ubah(int(rng.integers(len(tabel))), **{atribut: perubahan[atribut] for atribut in dipilih})
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_agregat_berjalan_sama_dengan_hitung_ulang(seed):
+    rng = np.random.default_rng(seed)
+    tabel = TabelPeralatan(kapasitas=4)
+    for _ in range(400):
+        operasi = rng.random()
+        if operasi < 0.3 or not len(tabel):
+            _tambah_acak(tabel, rng)
+        elif operasi < 0.45:
+            _tambah_banyak_acak(tabel, rng)
+        elif operasi < 0.75:
+            _ubah_acak(tabel, rng)
+        else:
+            tabel.hapus(int(rng.integers(len(tabel))))
+        assert tabel.verifikasi_agregat()
+
+
+def test_agregat_kembali_nol_setelah_semua_dihapus():
+    rng = np.random.default_rng(0)
+    tabel = TabelPeralatan()
+    _tambah_banyak_acak(tabel, rng)
+    _tambah_acak(tabel, rng)
+    while len(tabel):
+        tabel.hapus(0)
+    assert tabel.total_kwh == tabel.total_kwh_saran == tabel.total_watt_semua == 0.0
+    assert not tabel.kwh_golongan.any() and not tabel.kwh_saran_golongan.any()
@@ -0,0 +1,39 @@
+import numpy as np
+
+from monitor_listrik import buat_monitor_default
+from tabel_peralatan import HARI_PER_BULAN
+from tarif import DefinisiTarif
+
+
+def test_estimasi_biaya_memakai_jendela_waktu_pakai():
+    monitor = buat_monitor_default()
+    flat = monitor.hitung_estimasi_biaya()
+    monitor.atur_definisi_tarif('R-1', DefinisiTarif('R-1', [(None, 1500)], waktu_pakai=[(17, 22, 5000)]))
+
+    beban_jam = monitor.beban_per_jam_golongan()[0] * HARI_PER_BULAN
+    jendela = np.zeros(24, dtype=bool)
+    jendela[17:22] = True
+    diharapkan = beban_jam[jendela].sum() * 5000 + beban_jam[~jendela].sum() * 1500
+    assert np.isclose(beban_jam.sum(), monitor.peralatan.kwh_golongan[0])
+    assert np.isclose(monitor.hitung_estimasi_biaya(), diharapkan)
+    assert monitor.hitung_estimasi_biaya() > flat
+
+
+def test_tarif_tanpa_jendela_tetap_memakai_blok():
+    monitor = buat_monitor_default()
+    flat = monitor.hitung_estimasi_biaya()
+    monitor.atur_definisi_tarif('R-1', DefinisiTarif('R-1', [(None, 1500)]))
+    assert np.isclose(monitor.hitung_estimasi_biaya(), flat)
+
+
+def test_skenario_dan_perencana_memakai_tarif_waktu_pakai():
+    monitor = buat_monitor_default()
+    monitor.atur_definisi_tarif('R-1', DefinisiTarif('R-1', [(None, 1500)], waktu_pakai=[(17, 22, 3000)]))
+    estimasi = monitor.hitung_estimasi_biaya()
+
+    hasil = monitor.sapu_skenario(golongan=(None, 'R-1'), perubahan_jam={'AC': [0, -2]})
+    assert np.isclose(hasil['biaya'][0], estimasi)
+
+    rencana = monitor.rencanakan_penggunaan(anggaran=estimasi)
+    assert np.isclose(rencana['nilai'][0], estimasi)
+    assert np.allclose(rencana['jam_rencana'], monitor.peralatan.jam_per_hari)